@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : validation_benchmark.py
+# Description : Benchmark of the validation package
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 19.10.2026 14:00:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+import sys
+import json
+import time
+import argparse
+import platform
+import datetime
+import tracemalloc
+import numpy as np
+from cognitivelab.validation import CrossValidationWithDev
+
+
+# Shuffle configurations (name, shuffle, permutation)
+CONFIGURATIONS = [
+    ('no-shuffle', False, 'array'),
+    ('shuffle-array', True, 'array'),
+    ('shuffle-feistel', True, 'feistel')
+]
+
+
+# Synthetic in-memory dataset
+class SyntheticDataset(object):
+    """
+    Synthetic in-memory dataset, sample i is i (nothing stored)
+    """
+
+    # Constructor
+    def __init__(self, length):
+        """
+        Constructor
+        :param length: Number of samples
+        """
+        self._length = length
+    # end __init__
+
+    # Length
+    def __len__(self):
+        """
+        Length
+        """
+        return self._length
+    # end __len__
+
+    # Get item
+    def __getitem__(self, item):
+        """
+        Get item
+        :param item: Index
+        """
+        return item
+    # end __getitem__
+
+    # Get items
+    def __getitems__(self, items):
+        """
+        Get items
+        :param items: List of indexes
+        """
+        return items
+    # end __getitems__
+
+# end SyntheticDataset
+
+
+# Benchmark one configuration
+def benchmark(length, shuffle, permutation, k, n_samples, batch_size, max_epoch_batches):
+    """
+    Benchmark one configuration of CrossValidationWithDev
+    :param length: Dataset size
+    :param shuffle: Shuffle samples?
+    :param permutation: Shuffle method
+    :param k: Number of folds
+    :param n_samples: Number of random positions to measure __getitem__ latency
+    :param batch_size: Batch size of the epoch iteration
+    :param max_epoch_batches: Maximum number of batches iterated, the epoch time is extrapolated beyond
+    :return: Dictionary of measures
+    """
+    # Fold construction (folds and train split), time and peak memory
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    validation = CrossValidationWithDev(
+        SyntheticDataset(length),
+        k=k,
+        shuffle=shuffle,
+        seed=1,
+        permutation=permutation
+    )
+    validation.train()
+    validation._split()
+    fold_construction_time = time.perf_counter() - start_time
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Per-sample __getitem__ latency
+    train_length = len(validation._split())
+    positions = np.random.randint(0, train_length, n_samples).tolist()
+    start_time = time.perf_counter()
+    for position in positions:
+        validation[position]
+    # end for
+    getitem_latency = (time.perf_counter() - start_time) / n_samples
+
+    # Epoch iteration with batches
+    n_batches = (train_length + batch_size - 1) // batch_size
+    iterated_batches = min(n_batches, max_epoch_batches)
+    start_time = time.perf_counter()
+    for batch_index in range(iterated_batches):
+        validation.__getitems__(slice(batch_index * batch_size, (batch_index + 1) * batch_size))
+    # end for
+    epoch_time = (time.perf_counter() - start_time) * n_batches / max(iterated_batches, 1)
+
+    return {
+        'fold_construction_time': fold_construction_time,
+        'peak_memory': peak_memory,
+        'getitem_latency': getitem_latency,
+        'epoch_time': epoch_time,
+        'epoch_extrapolated': iterated_batches < n_batches,
+        'train_length': train_length
+    }
+# end benchmark
+
+
+# Main
+def main(args=None):
+    """
+    Run the benchmark, one JSON object per line and configuration
+    :param args: Command line arguments
+    """
+    # Arguments
+    parser = argparse.ArgumentParser(description="Benchmark of cognitivelab.validation")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10**e for e in range(3, 9)], help="Dataset sizes")
+    parser.add_argument('--configurations', nargs='+', default=[c[0] for c in CONFIGURATIONS],
+                        choices=[c[0] for c in CONFIGURATIONS], help="Shuffle configurations")
+    parser.add_argument('--k', type=int, default=10, help="Number of folds")
+    parser.add_argument('--samples', type=int, default=10000, help="Positions used to measure __getitem__ latency")
+    parser.add_argument('--batch-size', type=int, default=256, help="Batch size of the epoch iteration")
+    parser.add_argument('--max-epoch-batches', type=int, default=2000, help="Batches iterated before extrapolating")
+    parser.add_argument('--output', type=str, default=None, help="Output file (JSON lines), stdout if not given")
+    args = parser.parse_args(args)
+
+    # Environment
+    environment = {
+        'date': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine()
+    }
+
+    # Output
+    output = sys.stdout if args.output is None else open(args.output, 'a')
+
+    # For each size and configuration
+    try:
+        for length in args.sizes:
+            for name, shuffle, permutation in CONFIGURATIONS:
+                if name not in args.configurations:
+                    continue
+                # end if
+
+                # Run
+                measures = benchmark(
+                    length,
+                    shuffle,
+                    permutation,
+                    args.k,
+                    args.samples,
+                    args.batch_size,
+                    args.max_epoch_batches
+                )
+
+                # Write
+                output.write(json.dumps(dict(
+                    environment,
+                    benchmark='CrossValidationWithDev',
+                    configuration=name,
+                    size=length,
+                    k=args.k,
+                    **measures
+                )) + "\n")
+                output.flush()
+            # end for
+        # end for
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        # end if
+    # end try
+# end main
+
+
+# Main
+if __name__ == '__main__':
+    main()
+# end if
@@ -28,9 +28,14 @@ import click
 import random
 import string
 import sys
+import time
+import threading
+from concurrent.futures import Future, wait
 
 # CL imports
 from cognitivelab.repository import collector_factory
+from cognitivelab.repository import CollectorSync
+from cognitivelab.repository import ColumnarExport
 from cognitivelab.repository import Config
 from cognitivelab.repository import RemoteDepot
 from cognitivelab.tools import load_xp_class
@@ -46,6 +51,9 @@ COGNITIVELAB_REPO_DIRS = [
     'models'
 ]
 
+# Time in seconds given to collector probes after their connection timeout (open and close)
+PROBE_MARGIN = 2.0
+
 
 @click.group('main')
 @click.pass_context
@@ -93,13 +101,78 @@ def init(repo_config, repo_name):
 # end help
 
 
+# Open and close a collector
+def probe_collector(collector_config, timeout):
+    """
+    Open and close a collector
+    :param collector_config: Collector configuration
+    :param timeout: Connection timeout in seconds
+    :return: Latency in seconds
+    """
+    # Create the collector, with the timeout for remote collectors
+    options = {'connect_timeout': timeout} if collector_config.collector_type == 'mongodb' else {}
+    collector = collector_factory.get_collector_from_config(collector_config, **options)
+
+    # Open and close
+    start_time = time.perf_counter()
+    collector.open()
+    collector.close()
+    return time.perf_counter() - start_time
+# end probe_collector
+
+
+# Start a collector probe
+def start_probe(collector_config, timeout):
+    """
+    Probe a collector in a daemon thread, a probe still running does not keep the command from exiting
+    :param collector_config: Collector configuration
+    :param timeout: Connection timeout in seconds
+    :return: Future of the latency in seconds
+    """
+    future = Future()
+
+    # Run the probe
+    def run():
+        try:
+            future.set_result(probe_collector(collector_config, timeout))
+        except Exception as e:
+            future.set_exception(e)
+        # end try
+    # end run
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+# end start_probe
+
+
+# Get a collector of the repository
+def repository_collector(repo_config, connection_string=None):
+    """
+    Get a collector of the repository, exit if not found
+    :param repo_config: Repository configuration object
+    :param connection_string: Connection string of the collector, None for the first collector
+    :return: Collector object (not opened)
+    """
+    collector_configs = repo_config.repo.repo_collectors
+    if connection_string is not None:
+        collector_configs = [c for c in collector_configs if c.collector_connection_string == connection_string]
+    # end if
+    if not collector_configs:
+        click.echo(Error_Messages['UNKNOWN_COL'].format(connection_string or ""))
+        sys.exit(1)
+    # end if
+    return collector_factory.get_collector_from_config(collector_configs[0])
+# end repository_collector
+
+
 # Command to add a collector for experiments output
 @main.command("collector")
 @click.argument("action")
 @click.argument("collector_type", required=False, default="")
 @click.argument("connection_string", required=False, default="")
+@click.option("--timeout", type=float, default=5.0, help="Timeout in seconds of the collector test")
 @click.pass_obj
-def collector_command(repo_config, action, collector_type, connection_string):
+def collector_command(repo_config, action, collector_type, connection_string, timeout):
     """
     Manage and add collector which store and share the results of experiments.
     """
@@ -137,22 +210,36 @@ def collector_command(repo_config, action, collector_type, connection_string):
         repo_config.save_config()
     # Test a collector (connection or path exists)
     elif action == 'test':
-        # Go through all collectors
-        for collector in repo_config.repo.repo_collectors:
-            # Validate
-            try:
-                # Open and close to test
-                collector.open()
-                collector.close()
-            except Exception as e:
-                click.echo(Error_Messages['VALIDATE_COL_FAILED'].format(e))
-            finally:
-                click.echo("Collector {}:{} validated successfully!".format(
-                    collector.collector_type,
-                    collector.collector_connection_string
+        # Probe all collectors concurrently, the connection timeout plus a margin to open and close
+        collector_configs = repo_config.repo.repo_collectors
+        probes = [start_probe(c, timeout) for c in collector_configs]
+        wait(probes, timeout=timeout + PROBE_MARGIN)
+
+        # Results
+        failed = False
+        for collector_config, probe in zip(collector_configs, probes):
+            collector_name = "{}:{}".format(
+                collector_config.collector_type,
+                collector_config.collector_connection_string
+            )
+            if not probe.done():
+                click.echo(Error_Messages['VALIDATE_COL_RUNNING'].format(collector_name, timeout + PROBE_MARGIN))
+                failed = True
+            elif probe.exception() is not None:
+                click.echo(Error_Messages['VALIDATE_COL_FAILED'].format(collector_name, probe.exception()))
+                failed = True
+            else:
+                click.echo("Collector {} validated successfully in {:.1f} ms".format(
+                    collector_name,
+                    probe.result() * 1000.0
                 ))
-            # end try
+            # end if
         # end for
+
+        # Exit code
+        if failed:
+            sys.exit(1)
+        # end if
     # List of collectors
     elif action == 'list':
         # Go through all collectors
@@ -173,7 +260,41 @@ def collector_command(repo_config, action, collector_type, connection_string):
         # Save configuration
         repo_config.save_config()
     elif action == 'sync':
-        pass
+        # Source and destination collectors, by connection string
+        collector_configs = {c.collector_connection_string: c for c in repo_config.repo.repo_collectors}
+        for collector_connection_string in (collector_type, connection_string):
+            if collector_connection_string not in collector_configs:
+                click.echo(Error_Messages['UNKNOWN_COL'].format(collector_connection_string))
+                sys.exit(1)
+            # end if
+        # end for
+        source = collector_factory.get_collector_from_config(collector_configs[collector_type])
+        destination = collector_factory.get_collector_from_config(collector_configs[connection_string])
+
+        # Copy new records
+        try:
+            source.open()
+            destination.open()
+            stats = CollectorSync(source, destination).run()
+            source.close()
+            destination.close()
+        except Exception as e:
+            click.echo(Error_Messages['SYNC_COL_FAILED'].format(e))
+            sys.exit(1)
+        # end try
+
+        # Report
+        if stats['up_to_date']:
+            click.echo("Collector {} is up to date with {}".format(connection_string, collector_type))
+        else:
+            click.echo("Synced {} records and {} experiments from {} to {} in {:.1f} s".format(
+                stats['records'],
+                stats['experiments'],
+                collector_type,
+                connection_string,
+                stats['duration']
+            ))
+        # end if
     elif action == 'update':
         pass
     else:
@@ -291,6 +412,94 @@ def depot_command(repo_config, action, depot_location):
 # end depot_command
 
 
+# Command to export experiments to columnar files
+@main.command("export")
+@click.argument("directory")
+@click.option("--lab", default=None, help="Export only the experiments of this lab")
+@click.option("--collector", "connection_string", default=None,
+              help="Connection string of the collector, the first collector of the repository by default")
+@click.option("--format", "file_format", type=click.Choice([ColumnarExport.PARQUET, ColumnarExport.ARROW]),
+              default=ColumnarExport.PARQUET, help="File format")
+@click.option("--batch-size", type=int, default=65536, help="Number of rows per batch")
+@click.pass_obj
+def export_command(repo_config, directory, lab, connection_string, file_format, batch_size):
+    """
+    Export experiments, records and metric series to Parquet or Arrow files.
+    """
+    # Load the repository configuration
+    try:
+        repo_config.load_config()
+    except FileNotFoundError:
+        click.echo(Error_Messages['REPO_NOT_INITIALIZED'])
+        return
+    # end try
+
+    # Stream the collector to the files
+    collector = repository_collector(repo_config, connection_string)
+    try:
+        collector.open()
+        stats = ColumnarExport(collector, file_format=file_format, batch_size=batch_size).export_experiments(
+            directory,
+            lab=lab
+        )
+        collector.close()
+    except Exception as e:
+        click.echo(Error_Messages['EXPORT_FAILED'].format(e))
+        sys.exit(1)
+    # end try
+
+    # Report
+    click.echo("Exported {} experiments, {} records and {} metric points to {}".format(
+        stats['experiments'],
+        stats['records'],
+        stats['points'],
+        directory
+    ))
+# end export_command
+
+
+# Command to import experiments from columnar files
+@main.command("import")
+@click.argument("directory")
+@click.option("--collector", "connection_string", default=None,
+              help="Connection string of the collector, the first collector of the repository by default")
+@click.option("--format", "file_format", type=click.Choice([ColumnarExport.PARQUET, ColumnarExport.ARROW]),
+              default=ColumnarExport.PARQUET, help="File format")
+@click.option("--batch-size", type=int, default=65536, help="Number of rows per batch")
+@click.pass_obj
+def import_command(repo_config, directory, connection_string, file_format, batch_size):
+    """
+    Import experiments, records and metric series from Parquet or Arrow files.
+    """
+    # Load the repository configuration
+    try:
+        repo_config.load_config()
+    except FileNotFoundError:
+        click.echo(Error_Messages['REPO_NOT_INITIALIZED'])
+        return
+    # end try
+
+    # Stream the files to the collector
+    collector = repository_collector(repo_config, connection_string)
+    try:
+        collector.open()
+        stats = ColumnarExport(collector, file_format=file_format, batch_size=batch_size).import_experiments(directory)
+        collector.close()
+    except Exception as e:
+        click.echo(Error_Messages['IMPORT_FAILED'].format(e))
+        sys.exit(1)
+    # end try
+
+    # Report
+    click.echo("Imported {} experiments, {} records and {} metric points from {}".format(
+        stats['experiments'],
+        stats['records'],
+        stats['points'],
+        directory
+    ))
+# end import_command
+
+
 # Command to deal with the Alogo backend
 @main.command("run")
 @click.argument("action")
@@ -27,8 +27,13 @@ Error_Messages = {
     'REPO_NOT_INITIALIZED': "Error: cannot find repository configuration, is this repository initialized?",
     'CANNOT_GET_COLLECTOR': "Error: cannot get collector with connection string \"{}\"",
     'REPO_ALREADY_CONTAINS_COL': "Error: repository already contains a collector with the same remote destination",
-    'VALIDATE_COL_FAILED': "Error: validating collector failed ({})",
+    'VALIDATE_COL_FAILED': "Error: validating collector {} failed ({})",
+    'VALIDATE_COL_RUNNING': "Error: validating collector {} did not finish in {} s (still running)",
     'ERROR_REMOVING_COL': "Error removing collector: {}",
+    'UNKNOWN_COL': "Error: no collector with connection string \"{}\" in the repository",
+    'SYNC_COL_FAILED': "Error: synchronizing collectors failed ({})",
+    'EXPORT_FAILED': "Error: exporting experiments failed ({})",
+    'IMPORT_FAILED': "Error: importing experiments failed ({})",
     'UNKNOWN_COL_ACTION': "ERROR: unknown collector action: {}",
     'UNKNOWN_LABS_ACTION': "ERROR: unknown labs actions: {}",
     'LAB_ALREADY_EXISTS': "Laboratory directory already exists ({})"
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : ArtifactCodec.py
+# Description : Compression of artifact chunks
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 23.10.2026 10:00:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import zlib
+
+
+# Compression of artifact chunks
+class ArtifactCodec(object):
+    """
+    Compression of artifact chunks with zlib (standard library) or zstd (zstandard package,
+    imported when first used). Chunks are compressed independently, so they can be compressed,
+    written, read and decompressed in parallel, both zlib and zstd release the GIL.
+    """
+
+    # Compressions
+    NONE = 'none'
+    ZLIB = 'zlib'
+    ZSTD = 'zstd'
+
+    # Default compression levels
+    DEFAULT_LEVELS = {ZLIB: 6, ZSTD: 3}
+
+    # Constructor
+    def __init__(self, compression=ZLIB, level=None):
+        """
+        Constructor
+        :param compression: Compression (none, zlib or zstd)
+        :param level: Compression level, None for the default level of the compression
+        """
+        # Check compression
+        if compression not in (self.NONE, self.ZLIB, self.ZSTD):
+            raise Exception("Error: unknown artifact compression {}".format(compression))
+        # end if
+
+        # zstandard is optional
+        self._zstd = None
+        if compression == self.ZSTD:
+            try:
+                import zstandard
+            except ImportError:
+                raise Exception("Error: zstd compression requires the zstandard package (pip install zstandard)")
+            # end try
+            self._zstd = zstandard
+        # end if
+
+        # Properties
+        self._compression = compression
+        self._level = self.DEFAULT_LEVELS.get(compression) if level is None else level
+    # end __init__
+
+    # region PROPERTIES
+
+    # Compression
+    @property
+    def compression(self):
+        """
+        Compression
+        :return: none, zlib or zstd
+        """
+        return self._compression
+    # end compression
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Compress a chunk
+    def compress(self, data):
+        """
+        Compress a chunk (thread-safe)
+        :param data: Bytes-like object
+        :return: Compressed bytes
+        """
+        if self._compression == self.ZLIB:
+            return zlib.compress(data, self._level)
+        elif self._compression == self.ZSTD:
+            return self._zstd.ZstdCompressor(level=self._level, write_checksum=True).compress(data)
+        else:
+            return bytes(data)
+        # end if
+    # end compress
+
+    # Decompress a chunk
+    def decompress(self, data):
+        """
+        Decompress a chunk (thread-safe)
+        :param data: Compressed bytes
+        :return: Bytes
+        """
+        if self._compression == self.ZLIB:
+            return zlib.decompress(data)
+        elif self._compression == self.ZSTD:
+            return self._zstd.ZstdDecompressor().decompress(data)
+        else:
+            return bytes(data)
+        # end if
+    # end decompress
+
+    # endregion PUBLIC
+
+# end ArtifactCodec
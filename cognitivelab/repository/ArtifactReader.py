@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : ArtifactReader.py
+# Description : Streaming reader of chunked artifacts
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 23.10.2026 10:40:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import io
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from .ArtifactCodec import ArtifactCodec
+
+
+# Streaming reader of chunked artifacts
+class ArtifactReader(io.RawIOBase):
+    """
+    Streaming reader of an artifact stored as compressed chunks (binary file object). The next
+    chunks are read and decompressed ahead in parallel, at most parallelism chunks are held in
+    memory whatever the size of the artifact. Seeking restarts the read-ahead at the chunk of the
+    new position.
+    """
+
+    # Constructor
+    def __init__(self, info, read_chunk, parallelism=4):
+        """
+        Constructor
+        :param info: Artifact information (length, chunks, chunk_size and compression)
+        :param read_chunk: Function returning the compressed bytes of a chunk from its index (called from threads)
+        :param parallelism: Number of chunks read ahead in parallel
+        """
+        # Super
+        super(ArtifactReader, self).__init__()
+
+        # Properties
+        self._info = info
+        self._read_chunk = read_chunk
+        self._codec = ArtifactCodec(info['compression'])
+        self._parallelism = max(1, parallelism)
+        self._executor = ThreadPoolExecutor(self._parallelism, thread_name_prefix="cognitivelab-artifact")
+
+        # Chunks read ahead (futures in chunk order) and next chunk to request
+        self._pending = collections.deque()
+        self._next_chunk = 0
+
+        # Current chunk, position in the current chunk and in the artifact
+        self._chunk = b''
+        self._chunk_position = 0
+        self._position = 0
+    # end __init__
+
+    # region PROPERTIES
+
+    # Artifact information
+    @property
+    def info(self):
+        """
+        Artifact information
+        :return: Dictionary
+        """
+        return self._info
+    # end info
+
+    # Artifact length
+    @property
+    def length(self):
+        """
+        Artifact length
+        :return: Size in bytes (uncompressed)
+        """
+        return self._info['length']
+    # end length
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Iterate over chunks
+    def iter_chunks(self):
+        """
+        Iterate over the rest of the artifact chunk by chunk, without copies
+        :return: Iterator of bytes
+        """
+        # Rest of the current chunk
+        if self._chunk_position < len(self._chunk):
+            data = self._chunk[self._chunk_position:]
+            self._advance(len(data))
+            yield data
+        # end if
+
+        # Next chunks
+        while self._load_chunk():
+            data = self._chunk
+            self._advance(len(data))
+            yield data
+        # end while
+    # end iter_chunks
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Fetch a chunk
+    def _fetch(self, index):
+        """
+        Read and decompress a chunk (in a worker thread)
+        :param index: Chunk index
+        :return: Bytes
+        """
+        return self._codec.decompress(self._read_chunk(index))
+    # end _fetch
+
+    # Load the next chunk
+    def _load_chunk(self):
+        """
+        Make the next chunk the current one, and request the chunks after it
+        :return: False at the end of the artifact
+        """
+        # Read ahead
+        while len(self._pending) < self._parallelism and self._next_chunk < self._info['chunks']:
+            self._pending.append(self._executor.submit(self._fetch, self._next_chunk))
+            self._next_chunk += 1
+        # end while
+
+        # End of the artifact
+        if not self._pending:
+            return False
+        # end if
+
+        self._chunk = self._pending.popleft().result()
+        self._chunk_position = 0
+        return True
+    # end _load_chunk
+
+    # Advance in the current chunk
+    def _advance(self, size):
+        """
+        Advance in the current chunk
+        :param size: Number of bytes
+        """
+        self._chunk_position += size
+        self._position += size
+    # end _advance
+
+    # Cancel the read-ahead
+    def _cancel(self):
+        """
+        Cancel the chunks read ahead
+        """
+        for future in self._pending:
+            future.cancel()
+        # end for
+        self._pending.clear()
+    # end _cancel
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Readable
+    def readable(self):
+        """
+        Readable
+        :return: True
+        """
+        return True
+    # end readable
+
+    # Seekable
+    def seekable(self):
+        """
+        Seekable
+        :return: True
+        """
+        return True
+    # end seekable
+
+    # Read into a buffer
+    def readinto(self, buffer):
+        """
+        Read bytes into a buffer, at most to the end of the current chunk
+        :param buffer: Writable bytes-like object
+        :return: Number of bytes read, 0 at the end of the artifact
+        """
+        # Next chunk
+        if self._chunk_position >= len(self._chunk) and not self._load_chunk():
+            return 0
+        # end if
+
+        # Copy
+        size = min(len(buffer), len(self._chunk) - self._chunk_position)
+        memoryview(buffer).cast('B')[:size] = self._chunk[self._chunk_position:self._chunk_position + size]
+        self._advance(size)
+        return size
+    # end readinto
+
+    # Read bytes
+    def read(self, size=-1):
+        """
+        Read bytes, across chunks
+        :param size: Number of bytes, -1 or None for the rest of the artifact
+        :return: Bytes, shorter than size only at the end of the artifact
+        """
+        # Rest of the artifact
+        if size is None or size < 0:
+            return self.readall()
+        # end if
+
+        # Copy from the chunks
+        data = bytearray(size)
+        position = 0
+        while position < size:
+            n_read = self.readinto(memoryview(data)[position:])
+            if n_read == 0:
+                break
+            # end if
+            position += n_read
+        # end while
+        del data[position:]
+        return bytes(data)
+    # end read
+
+    # Read everything left
+    def readall(self):
+        """
+        Read the rest of the artifact
+        :return: Bytes
+        """
+        return b''.join(self.iter_chunks())
+    # end readall
+
+    # Position
+    def tell(self):
+        """
+        Position in the artifact
+        :return: Position in bytes
+        """
+        return self._position
+    # end tell
+
+    # Seek
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Change the position, the chunk of the new position is read when reading
+        :param offset: Offset in bytes
+        :param whence: io.SEEK_SET, io.SEEK_CUR or io.SEEK_END
+        :return: New position
+        """
+        # New position
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._info['length']
+        # end if
+        if offset < 0:
+            raise ValueError("Negative seek position {}".format(offset))
+        # end if
+
+        # Position in the current chunk
+        chunk_start = self._position - self._chunk_position
+        if chunk_start <= offset < chunk_start + len(self._chunk):
+            self._chunk_position = offset - chunk_start
+            self._position = offset
+            return offset
+        # end if
+
+        # Restart the read-ahead at the chunk of the position
+        self._cancel()
+        chunk_size = self._info['chunk_size']
+        self._next_chunk = offset // chunk_size
+        self._chunk = b''
+        self._chunk_position = 0
+        self._position = self._next_chunk * chunk_size
+        if self._load_chunk():
+            self._chunk_position = offset - self._position
+        # end if
+        self._position = offset
+        return offset
+    # end seek
+
+    # Close
+    def close(self):
+        """
+        Close the reader and stop the read-ahead
+        """
+        if not self.closed:
+            self._cancel()
+            self._executor.shutdown(wait=False)
+            self._chunk = b''
+        # end if
+        super(ArtifactReader, self).close()
+    # end close
+
+    # endregion OVERRIDE
+
+# end ArtifactReader
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : AsyncCollector.py
+# Description : Base class for asyncio collectors
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 20.10.2026 15:10:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+# Imports
+from .Collector import Collector
+
+
+# Base class for asyncio collectors
+class AsyncCollector(Collector):
+    """
+    Base class for asyncio collectors. The public interface is the one of Collector with coroutines,
+    so that many experiments can write to collectors from a single event loop without a thread per writer.
+    Experiment updates, sync and artifacts are only available on synchronous collectors, their methods raise
+    NotImplementedError.
+    """
+
+    # region PUBLIC
+
+    # Open the collector
+    async def open(self):
+        """
+        Open the collector
+        """
+        pass
+    # end open
+
+    # Close the collector
+    async def close(self):
+        """
+        Close the collector
+        """
+        pass
+    # end close
+
+    # Get experiment
+    async def get_experiment(self, experiment_name):
+        """
+        Get an experiment from the collector
+        :param experiment_name: Experiment name
+        :return: CLExperiment object
+        """
+        pass
+    # end get_experiment
+
+    # What is the status of an experiment?
+    async def experiment_status(self, experiment_name):
+        """
+        What is the status of an experiment?
+        :param experiment_name: Experiment name
+        :return: Status as an integer
+        """
+        pass
+    # end experiment_status
+
+    # Query records
+    async def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment
+        :param experiment_name: Experiment name
+        :param query: Filter on the records as a dictionary, None for all the records
+        :param projection: Fields to return, None for all the fields
+        :return: List of records
+        """
+        pass
+    # end query
+
+    # Write a record
+    async def write(self, experiment_name, record):
+        """
+        Write a record of an experiment (may be buffered until flush)
+        :param experiment_name: Experiment name
+        :param record: Record as a dictionary
+        """
+        await self.write_many(experiment_name, [record])
+    # end write
+
+    # Write records
+    async def write_many(self, experiment_name, records):
+        """
+        Write records of an experiment (may be buffered until flush)
+        :param experiment_name: Experiment name
+        :param records: List of records as dictionaries
+        """
+        await self._write_records([self._create_record(experiment_name, record) for record in records])
+    # end write_many
+
+    # Log a metric point
+    async def log_metric(self, experiment_name, metric, step, value):
+        """
+        Log a point of a metric series (buffered in a bucket until full or flush)
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param step: Step (integer)
+        :param value: Value (float)
+        """
+        await self.log_metrics(experiment_name, metric, [step], [value])
+    # end log_metric
+
+    # Log metric points
+    async def log_metrics(self, experiment_name, metric, steps, values):
+        """
+        Log points of a metric series, written as buckets of metric_bucket_size points
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param steps: Steps (array-like of integers)
+        :param values: Values (array-like of floats)
+        """
+        buckets = self._add_metric_points(experiment_name, metric, steps, values)
+        self._touch_experiments([experiment_name])
+        if buckets:
+            await self._write_records(buckets)
+        # end if
+    # end log_metrics
+
+    # Get a metric series
+    async def get_metric(self, experiment_name, metric):
+        """
+        Get a metric series, buffered points are flushed first
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: Steps (int64 array), values (float64 array) ordered by step
+        """
+        await self.flush()
+        return self._merge_buckets(await self._read_buckets(experiment_name, metric))
+    # end get_metric
+
+    # Flush buffered records
+    async def flush(self):
+        """
+        Flush buffered records and metric points to the backend
+        """
+        # Write open metric buckets
+        buckets = self._seal_metric_buckets()
+        if buckets:
+            await self._write_records(buckets)
+        # end if
+
+        await self._flush_records()
+    # end flush
+
+    # Enable asynchronous writes
+    def enable_async_writes(self, *args, **kwargs):
+        """
+        Not available, writes are already asynchronous
+        """
+        raise Exception("Error: {} writes are already asynchronous".format(type(self).__name__))
+    # end enable_async_writes
+
+    # Create or update an experiment
+    def update_experiment(self, experiment_name, lab=None, status=None, **fields):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('update_experiment')
+    # end update_experiment
+
+    # Iterate over records
+    def iter_records(self, since=None, experiment_name=None):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('iter_records')
+    # end iter_records
+
+    # Iterate over experiments
+    def iter_experiments(self, since=None):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('iter_experiments')
+    # end iter_experiments
+
+    # Insert or replace records
+    def upsert_records(self, records):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('upsert_records')
+    # end upsert_records
+
+    # Insert or replace experiments
+    def upsert_experiments(self, experiments):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('upsert_experiments')
+    # end upsert_experiments
+
+    # Get a sync watermark
+    def sync_watermark(self, source):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('sync_watermark')
+    # end sync_watermark
+
+    # Set a sync watermark
+    def set_sync_watermark(self, source, watermark):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('set_sync_watermark')
+    # end set_sync_watermark
+
+    # Store an artifact
+    def put_artifact(self, *args, **kwargs):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('put_artifact')
+    # end put_artifact
+
+    # Read an artifact
+    def get_artifact(self, *args, **kwargs):
+        """
+        Not available on asyncio collectors (synchronous interface)
+        """
+        self._not_available('get_artifact')
+    # end get_artifact
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Method not available
+    def _not_available(self, method):
+        """
+        Raise for a synchronous method of Collector not available on asyncio collectors
+        :param method: Method name
+        """
+        raise NotImplementedError("Error: {}.{} is not available on asyncio collectors, use a synchronous "
+                                  "collector".format(type(self).__name__, method))
+    # end _not_available
+
+    # Write records to the backend
+    async def _write_records(self, records):
+        """
+        Write records to the backend
+        :param records: List of records (from _create_record)
+        """
+        pass
+    # end _write_records
+
+    # Read metric buckets
+    async def _read_buckets(self, experiment_name, metric):
+        """
+        Read the buckets of a metric series
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: List of bucket records (steps and values as bytes), ordered by start step
+        """
+        pass
+    # end _read_buckets
+
+    # Flush the backend
+    async def _flush_records(self):
+        """
+        Flush records buffered by _write_records to the backend
+        """
+        pass
+    # end _flush_records
+
+    # endregion PRIVATE
+
+# end AsyncCollector
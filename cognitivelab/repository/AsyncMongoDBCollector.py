@@ -0,0 +1,381 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : AsyncMongoDBCollector.py
+# Description : Asyncio experiment data collector to MongoDB
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 20.10.2026 15:30:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import time
+import asyncio
+import datetime
+from pymongo.errors import BulkWriteError
+from .Collector import Collector
+from .AsyncCollector import AsyncCollector
+
+
+# Asyncio experiment data collector to MongoDB
+class AsyncMongoDBCollector(AsyncCollector):
+    """
+    Asyncio experiment data collector to MongoDB, based on motor. Records are buffered
+    like with MongoDBCollector and written with unordered bulk inserts.
+    """
+
+    # Collection of experiment records
+    RECORDS_COLLECTION = "records"
+
+    # Collection of metric buckets
+    METRICS_COLLECTION = "metrics"
+
+    # Duplicate key error code (record already written by an interrupted insert)
+    DUPLICATE_KEY_ERROR = 11000
+
+    # Constructor
+    def __init__(self, connection_string, buffer_size=1000, buffer_bytes=8 * 1024 * 1024, buffer_delay=1.0,
+                 max_pool_size=100, min_pool_size=0, client=None):
+        """
+        Constructor
+        :param connection_string: Connection information to MongoDB
+        :param buffer_size: Number of buffered records which triggers a flush
+        :param buffer_bytes: Size in bytes (BSON) of buffered records which triggers a flush
+        :param buffer_delay: Age in seconds of the oldest buffered record which triggers a flush
+        :param max_pool_size: Maximum number of sockets of the client
+        :param min_pool_size: Minimum number of sockets of the client
+        :param client: Motor client to use (or a stand-in with the same interface), None to create one when opened
+        """
+        # Super
+        super(AsyncMongoDBCollector, self).__init__("mongodb", connection_string)
+
+        # Parse information
+        connection_string_schema = self.get_connection_infos(connection_string)
+
+        # No db name?
+        if connection_string_schema.path == "":
+            raise Exception("Database name is empty")
+        # end if
+
+        # Properties
+        self._connection_string = connection_string
+        self._db_name = connection_string_schema.path[1:]
+        self._client = client
+        self._own_client = client is None
+        self._db = None
+        self._connected = False
+        self._max_pool_size = max_pool_size
+        self._min_pool_size = min_pool_size
+
+        # Write buffer
+        self._buffer_size = buffer_size
+        self._buffer_bytes = buffer_bytes
+        self._buffer_delay = buffer_delay
+        self._buffer = list()
+        self._buffered_bytes = 0
+        self._buffer_time = None
+        self._flush_lock = None
+        self._flush_handle = None
+        self._flush_task = None
+        self._flush_error = None
+    # end __init__
+
+    # region PROPERTIES
+
+    # Get connection_string
+    @property
+    def connection_string(self):
+        """
+        Get connection_string
+        :return: MongoDB connection string
+        """
+        return self._connection_string
+    # end connection_string
+
+    # Get database
+    @property
+    def db_name(self):
+        """
+        Get database
+        :return: MongoDB database
+        """
+        return self._db_name
+    # end db_name
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Open the collector
+    async def open(self):
+        """
+        Open the collector
+        """
+        # Already opened
+        if self._connected:
+            return
+        # end if
+
+        # Create the motor client
+        if self._own_client:
+            try:
+                from motor.motor_asyncio import AsyncIOMotorClient
+            except ImportError:
+                raise Exception("Error: motor is required by AsyncMongoDBCollector (pip install motor)")
+            # end try
+            self._client = AsyncIOMotorClient(
+                self._connection_string,
+                maxPoolSize=self._max_pool_size,
+                minPoolSize=self._min_pool_size
+            )
+        # end if
+
+        # Check connection
+        try:
+            await self._client.admin.command('ismaster')
+        except Exception as e:
+            if self._own_client:
+                self._client.close()
+                self._client = None
+            # end if
+            raise Exception("Error: Cannot connect to the MongoDB server: {}".format(e))
+        # end try
+
+        # Get database
+        self._db = self._client[self._db_name]
+        self._flush_lock = asyncio.Lock()
+
+        # Connected
+        self._connected = True
+    # end open
+
+    # Close the collector
+    async def close(self):
+        """
+        Close the collector
+        """
+        # Not opened
+        if not self._connected:
+            return
+        # end if
+
+        # Wait for the flush on timer, then write what is left
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        # end if
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+        # end if
+        await self.flush()
+
+        # Close our client
+        if self._own_client:
+            self._client.close()
+            self._client = None
+        # end if
+        self._db = None
+        self._connected = False
+    # end close
+
+    # Get collector status
+    def status(self):
+        """
+        Get collector status
+        :return: Collector status as an Integer
+        """
+        if self._connected:
+            return Collector.COLLECTOT_INITIALIZED
+        else:
+            return Collector.COLLECTOR_NOT_INITIALIZED
+        # end if
+    # end status
+
+    # Query records
+    async def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment, buffered records are flushed first
+        :param experiment_name: Experiment name
+        :param query: Filter on the records as a dictionary, None for all the records
+        :param projection: Fields to return, None for all the fields
+        :return: List of records
+        """
+        await self.flush()
+        cursor = self._db[self.RECORDS_COLLECTION].find(dict(query or {}, experiment=experiment_name), projection)
+        return await cursor.to_list(length=None)
+    # end query
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Write records to the buffer
+    async def _write_records(self, records):
+        """
+        Write records to the buffer, flush when a size, byte or time threshold is reached
+        :param records: List of records
+        """
+        # Buffer, flushed by a timer after buffer_delay
+        if self._buffer_time is None:
+            self._buffer_time = time.monotonic()
+            self._flush_handle = asyncio.get_running_loop().call_later(self._buffer_delay, self._idle_flush)
+        # end if
+        self._buffer.extend(records)
+        self._buffered_bytes += self._estimate_size(records)
+
+        # Thresholds
+        if len(self._buffer) >= self._buffer_size or self._buffered_bytes >= self._buffer_bytes or \
+                time.monotonic() - self._buffer_time >= self._buffer_delay:
+            await self._flush_records()
+        # end if
+    # end _write_records
+
+    # Flush on timer
+    def _idle_flush(self):
+        """
+        Start a flush of buffered records buffer_delay seconds after the first one, if no write or flush did
+        it before
+        """
+        self._flush_handle = None
+        if self._connected and self._buffer_time is not None:
+            self._flush_task = asyncio.ensure_future(self._flush_idle_records())
+        # end if
+    # end _idle_flush
+
+    # Flush records on timer
+    async def _flush_idle_records(self):
+        """
+        Flush buffered records, records which cannot be written stay buffered and the error is raised by the
+        next write or flush
+        """
+        try:
+            await self._flush_records()
+        except Exception as e:
+            self._flush_error = e
+        # end try
+    # end _flush_idle_records
+
+    # Flush buffered records
+    async def _flush_records(self):
+        """
+        Flush buffered records to MongoDB with a single unordered bulk insert, records not written are kept
+        in the buffer and records already written (duplicate IDs) are skipped. A flush in progress is waited
+        for, and the error of the last flush on timer is raised.
+        """
+        # Check connection
+        if not self._connected:
+            if not self._buffer:
+                return
+            # end if
+            raise Exception("Error: MongoDB collector is not opened")
+        # end if
+
+        # Take the buffer once the flush in progress is done, records written meanwhile go to a new one
+        async with self._flush_lock:
+            # Error of the flush on timer
+            if self._flush_error is not None:
+                error, self._flush_error = self._flush_error, None
+                raise error
+            # end if
+
+            # Nothing to write
+            if not self._buffer:
+                return
+            # end if
+            records = self._buffer
+            self._buffer = list()
+            self._buffered_bytes = 0
+            self._buffer_time = None
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            # end if
+
+            # Bulk inserts of records and metric buckets, stamped with their insert date
+            now = datetime.datetime.now()
+            records = [dict(record, **{self.INSERT_DATE_FIELD: now}) for record in records]
+            failed = list()
+            error = None
+            groups = [
+                (self.RECORDS_COLLECTION, [r for r in records if self.METRIC_FIELD not in r]),
+                (self.METRICS_COLLECTION, [r for r in records if self.METRIC_FIELD in r])
+            ]
+            for group_index, (collection, documents) in enumerate(groups):
+                if not documents:
+                    continue
+                # end if
+                try:
+                    await self._db[collection].insert_many(documents, ordered=False)
+                except BulkWriteError as e:
+                    # Unacknowledged writes are retried, failed inserts except duplicates too
+                    if e.details.get('writeConcernErrors'):
+                        group_failed = documents
+                    else:
+                        group_failed = [
+                            documents[write_error['index']] for write_error in e.details.get('writeErrors', [])
+                            if write_error['code'] != self.DUPLICATE_KEY_ERROR
+                        ]
+                    # end if
+                    if group_failed:
+                        failed.extend(group_failed)
+                        error = e
+                    # end if
+                except Exception as e:
+                    # Unknown state, this group and the next ones are retried
+                    for _, next_documents in groups[group_index:]:
+                        failed.extend(next_documents)
+                    # end for
+                    error = e
+                    break
+                # end try
+            # end for
+
+            # Records not written are kept in the buffer
+            if failed:
+                self._buffer[:0] = failed
+                self._buffered_bytes += self._estimate_size(failed)
+                if self._buffer_time is None:
+                    self._buffer_time = time.monotonic()
+                # end if
+                raise error
+            # end if
+            self.collector_last_write_date = now
+        # end with
+    # end _flush_records
+
+    # Read metric buckets
+    async def _read_buckets(self, experiment_name, metric):
+        """
+        Read the buckets of a metric series
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: List of bucket records (steps and values as bytes), ordered by start step
+        """
+        cursor = self._db[self.METRICS_COLLECTION].find(
+            {'experiment': experiment_name, self.METRIC_FIELD: metric},
+            {'_id': 0, 'steps': 1, 'values': 1}
+        ).sort('start_step', 1)
+        return await cursor.to_list(length=None)
+    # end _read_buckets
+
+    # endregion PRIVATE
+
+# end AsyncMongoDBCollector
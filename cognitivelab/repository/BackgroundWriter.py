@@ -0,0 +1,403 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : BackgroundWriter.py
+# Description : Background thread writing collector records from a bounded queue
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 20.10.2026 11:40:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import os
+import time
+import pickle
+import tempfile
+import threading
+import collections
+
+
+# Flush request in the queue
+class _FlushRequest(object):
+    """
+    Flush request in the queue, done when all the records queued before are written and flushed
+    """
+
+    # Constructor
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.done = threading.Event()
+    # end __init__
+
+# end _FlushRequest
+
+
+# Background thread writing collector records from a bounded queue
+class BackgroundWriter(object):
+    """
+    Background thread writing records from a bounded in-memory queue. Producers never wait
+    for the backend, except with the 'block' policy when the queue is full. When full, the
+    'drop-oldest' policy discards the oldest queued records and the 'spill' policy writes new
+    records to a file on disk, replayed by the thread when the queue is empty.
+    """
+
+    # Backpressure policies
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop-oldest'
+    SPILL = 'spill'
+
+    # Constructor
+    def __init__(self, write_function, flush_function, queue_size=10000, batch_size=1000, policy='block',
+                 spill_directory=None, flush_interval=1.0, name="BackgroundWriter"):
+        """
+        Constructor
+        :param write_function: Function writing a list of records to the backend
+        :param flush_function: Function flushing the backend
+        :param queue_size: Maximum number of queued records
+        :param batch_size: Maximum number of records given to write_function at once
+        :param policy: What to do when the queue is full ('block', 'drop-oldest' or 'spill')
+        :param spill_directory: Directory of the spill file ('spill' policy), None for the temporary directory
+        :param flush_interval: Maximum time in seconds between two flushes of the backend
+        :param name: Thread name
+        """
+        # Check policy
+        if policy not in (self.BLOCK, self.DROP_OLDEST, self.SPILL):
+            raise ValueError("Unknown backpressure policy {}".format(policy))
+        # end if
+
+        # Properties
+        self._write_function = write_function
+        self._flush_function = flush_function
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._policy = policy
+        self._flush_interval = flush_interval
+
+        # Queue of records and flush requests
+        self._queue = collections.deque()
+        self._queued_records = 0
+        self._condition = threading.Condition()
+        self._closing = False
+
+        # Spill file
+        self._spill_file = None
+        self._spilled_records = 0
+        if policy == self.SPILL:
+            spill_fd, self._spill_file = tempfile.mkstemp(
+                prefix="cognitivelab-spill-",
+                suffix=".pkl",
+                dir=spill_directory
+            )
+            os.close(spill_fd)
+        # end if
+
+        # Statistics
+        self._written = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._errors = 0
+        self._last_error = None
+        self._last_write_time = None
+        self._pending_since = None
+
+        # Start thread
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    # end __init__
+
+    # region PROPERTIES
+
+    # Number of records waiting to be written
+    @property
+    def pending(self):
+        """
+        Number of records waiting to be written (queued and spilled)
+        :return: Number of records
+        """
+        with self._condition:
+            return self._queued_records + self._spilled_records
+        # end with
+    # end pending
+
+    # Statistics
+    @property
+    def stats(self):
+        """
+        Statistics
+        :return: Dictionary with pending, written, dropped, spilled records, errors, last error, last write time
+        and time since when records are pending (None if no record is pending)
+        """
+        with self._condition:
+            return {
+                'pending': self._queued_records + self._spilled_records,
+                'written': self._written,
+                'dropped': self._dropped,
+                'spilled': self._spilled,
+                'errors': self._errors,
+                'last_error': self._last_error,
+                'last_write_time': self._last_write_time,
+                'pending_since': self._pending_since
+            }
+        # end with
+    # end stats
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Queue records
+    def put(self, records):
+        """
+        Queue records, applying the backpressure policy if the queue is full
+        :param records: List of records
+        """
+        with self._condition:
+            # Closed
+            if self._closing:
+                raise Exception("Error: background writer is closed")
+            # end if
+
+            # Wait for space
+            if self._policy == self.BLOCK:
+                while self._queued_records + len(records) > self._queue_size and self._queued_records > 0:
+                    self._condition.wait()
+                # end while
+            # end if
+
+            # Drop oldest records
+            if self._policy == self.DROP_OLDEST:
+                overflow = self._queued_records + len(records) - self._queue_size
+                kept = list()
+                while overflow > 0 and self._queue:
+                    item = self._queue.popleft()
+                    if isinstance(item, _FlushRequest):
+                        kept.append(item)
+                    else:
+                        self._queued_records -= 1
+                        self._dropped += 1
+                        overflow -= 1
+                    # end if
+                # end while
+                self._queue.extendleft(reversed(kept))
+                if overflow > 0:
+                    self._dropped += overflow
+                    records = records[overflow:]
+                # end if
+            # end if
+
+            # Spill to disk
+            if self._policy == self.SPILL and self._queued_records + len(records) > self._queue_size:
+                with open(self._spill_file, 'ab') as f:
+                    pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+                # end with
+                self._spilled_records += len(records)
+                self._spilled += len(records)
+                records = list()
+            # end if
+
+            # Records pending since
+            if self._pending_since is None and (records or self._spilled_records > 0):
+                self._pending_since = time.time()
+            # end if
+
+            # Queue
+            self._queue.extend(records)
+            self._queued_records += len(records)
+            self._condition.notify_all()
+        # end with
+    # end put
+
+    # Flush
+    def flush(self, timeout=None):
+        """
+        Wait until all the records queued before are written and the backend is flushed
+        :param timeout: Maximum time to wait in seconds, None to wait forever
+        :return: True if flushed, False on timeout
+        """
+        # Request
+        request = _FlushRequest()
+        with self._condition:
+            if not self._thread.is_alive():
+                return False
+            # end if
+            self._queue.append(request)
+            self._condition.notify_all()
+        # end with
+
+        return request.done.wait(timeout)
+    # end flush
+
+    # Close
+    def close(self, timeout=None):
+        """
+        Drain the queue and the spill file, flush the backend and stop the thread
+        :param timeout: Maximum time to wait in seconds, None to wait forever
+        """
+        # Drain
+        self.flush(timeout)
+
+        # Stop
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        # end with
+        self._thread.join(timeout)
+
+        # Remove spill file
+        if self._spill_file is not None and self._spilled_records == 0 and os.path.exists(self._spill_file):
+            os.remove(self._spill_file)
+        # end if
+    # end close
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Thread loop
+    def _run(self):
+        """
+        Thread loop
+        """
+        last_flush = time.monotonic()
+        while True:
+            # Take a batch of records, up to a flush request
+            batch = list()
+            request = None
+            with self._condition:
+                # Wait for records
+                while not self._queue and not self._closing and self._spilled_records == 0 and \
+                        time.monotonic() - last_flush < self._flush_interval:
+                    self._condition.wait(self._flush_interval)
+                # end while
+
+                # Stop
+                if self._closing and not self._queue:
+                    return
+                # end if
+
+                while self._queue and len(batch) < self._batch_size:
+                    item = self._queue.popleft()
+                    if isinstance(item, _FlushRequest):
+                        request = item
+                        break
+                    # end if
+                    batch.append(item)
+                # end while
+                self._queued_records -= len(batch)
+                self._condition.notify_all()
+            # end with
+
+            # Write batch
+            self._write(batch)
+
+            # Replay spilled records when the queue is empty, or before a flush
+            if request is not None or not self._queue:
+                self._replay()
+            # end if
+
+            # Flush on request or interval
+            if request is not None or time.monotonic() - last_flush >= self._flush_interval:
+                self._call(self._flush_function)
+                last_flush = time.monotonic()
+            # end if
+
+            # Nothing pending
+            with self._condition:
+                if not self._queue and self._spilled_records == 0:
+                    self._pending_since = None
+                # end if
+            # end with
+
+            # Flush done
+            if request is not None:
+                request.done.set()
+            # end if
+        # end while
+    # end _run
+
+    # Write records
+    def _write(self, records):
+        """
+        Write records to the backend
+        :param records: List of records
+        """
+        for start in range(0, len(records), self._batch_size):
+            batch = records[start:start + self._batch_size]
+            if self._call(self._write_function, batch):
+                with self._condition:
+                    self._written += len(batch)
+                    self._last_write_time = time.time()
+                # end with
+            # end if
+        # end for
+    # end _write
+
+    # Replay spilled records
+    def _replay(self):
+        """
+        Replay spilled records
+        """
+        # Take the spill file
+        with self._condition:
+            if self._spilled_records == 0:
+                return
+            # end if
+            replay_file = self._spill_file + ".replay"
+            os.replace(self._spill_file, replay_file)
+            self._spilled_records = 0
+        # end with
+
+        # Write spilled batches
+        with open(replay_file, 'rb') as f:
+            while True:
+                try:
+                    records = pickle.load(f)
+                except EOFError:
+                    break
+                # end try
+                self._write(records)
+            # end while
+        # end with
+        os.remove(replay_file)
+    # end _replay
+
+    # Call a backend function
+    def _call(self, function, *args):
+        """
+        Call a backend function, errors are counted instead of stopping the thread
+        :return: True on success
+        """
+        try:
+            function(*args)
+            return True
+        except Exception as e:
+            with self._condition:
+                self._errors += 1
+                self._last_error = e
+            # end with
+            return False
+        # end try
+    # end _call
+
+    # endregion PRIVATE
+
+# end BackgroundWriter
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : CachedCollector.py
+# Description : Collector with an LRU cache in front of its reads
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 21.10.2026 16:40:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import json
+import time
+import threading
+from .Collector import Collector
+from .Experiment import Experiment
+from .QueryCache import QueryCache
+
+
+# Collector with an LRU cache in front of its reads
+class CachedCollector(object):
+    """
+    Collector with an LRU cache in front of its reads (experiments, records and metric series).
+    Results for an experiment are served from memory as long as its modification stamp in the
+    collector and its stamp in the backend (newest insert and update dates, so writes from other
+    processes are seen) are unchanged, results over all the experiments as long as the global stamps
+    are unchanged. A hit still reads the backend stamp (a few index-only queries with MongoDB) when the
+    last one is older than check_interval seconds, so writes from other processes are seen after at most
+    check_interval seconds, and with check_interval=0 every call is a round trip to the backend. With
+    collectors without backend stamp, writes from other processes are not seen, use ttl to bound the age
+    of the results. Cached results are shared and must not be modified.
+    Other attributes are the ones of the collector.
+    """
+
+    # Constructor
+    def __init__(self, collector, max_bytes=64 * 1024 * 1024, ttl=None, check_interval=1.0):
+        """
+        Constructor
+        :param collector: Collector to read from
+        :param max_bytes: Memory budget of the cache in bytes
+        :param ttl: Maximum age in seconds of cached results, None for no limit
+        :param check_interval: Time in seconds a backend stamp is used before being read again (staleness bound
+        for writes from other processes), 0 to read it at each call
+        """
+        self._collector = collector
+        self._cache = QueryCache(max_bytes=max_bytes, ttl=ttl)
+        self._check_interval = check_interval
+
+        # Backend stamps, experiment name (None for all) -> (read time, stamp)
+        self._backend_stamps = dict()
+        self._stamps_lock = threading.Lock()
+    # end __init__
+
+    # region PROPERTIES
+
+    # Collector
+    @property
+    def collector(self):
+        """
+        Get the collector
+        :return: Collector object
+        """
+        return self._collector
+    # end collector
+
+    # Cache
+    @property
+    def cache(self):
+        """
+        Get the cache
+        :return: QueryCache object
+        """
+        return self._cache
+    # end cache
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Get experiment
+    def get_experiment(self, experiment_name):
+        """
+        Get an experiment, its information and records are read through the cache when first used
+        :param experiment_name: Experiment name
+        :return: Experiment object, None if not found
+        """
+        status = self.experiment_status(experiment_name)
+        if status == Collector.EXPERIMENT_NOT_FOUND:
+            return None
+        # end if
+        return Experiment(self, experiment_name, status)
+    # end get_experiment
+
+    # Get experiment information
+    def experiment_info(self, experiment_name):
+        """
+        Get the information of an experiment
+        :param experiment_name: Experiment name
+        :return: Dictionary, None if not found
+        """
+        return self._cached(experiment_name, 'experiment_info', experiment_name)
+    # end experiment_info
+
+    # What is the status of an experiment?
+    def experiment_status(self, experiment_name):
+        """
+        What is the status of an experiment?
+        :param experiment_name: Experiment name
+        :return: Status as an integer
+        """
+        return self._cached(experiment_name, 'experiment_status', experiment_name)
+    # end experiment_status
+
+    # Status of many experiments
+    def experiment_statuses(self, lab=None, status=None):
+        """
+        Status of the experiments of a lab
+        :param lab: Lab name, None for all the experiments
+        :param status: Only experiments with this status, None for all
+        :return: Dictionary of experiment name to status
+        """
+        return self._cached(None, 'experiment_statuses', lab, status)
+    # end experiment_statuses
+
+    # Query records
+    def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment
+        :param experiment_name: Experiment name
+        :param query: Filter on the records as a dictionary, None for all the records
+        :param projection: Fields to return, None for all the fields
+        :return: List of records
+        """
+        return self._cached(experiment_name, 'query', experiment_name, query, projection)
+    # end query
+
+    # Get a metric series
+    def get_metric(self, experiment_name, metric):
+        """
+        Get a metric series
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: Steps (int64 array), values (float64 array) ordered by step, read-only
+        """
+        return self._cached(experiment_name, 'get_metric', experiment_name, metric)
+    # end get_metric
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Cached call
+    def _cached(self, experiment_name, method, *args):
+        """
+        Call a read method of the collector through the cache
+        :param experiment_name: Experiment the result depends on, None for all the experiments
+        :param method: Method name
+        :param args: Arguments
+        :return: Result
+        """
+        # Key and stamp
+        key = (method, json.dumps(args, sort_keys=True, default=str))
+        if experiment_name is None:
+            stamp = (self._collector.collector_last_write_date, self._collector.modification_stamp())
+        else:
+            stamp = (self._collector.modification_stamp(experiment_name),)
+        # end if
+        stamp += (self._backend_stamp(experiment_name),)
+
+        # Cached
+        found, value = self._cache.get(key, stamp)
+        if found:
+            return value
+        # end if
+
+        # Read, arrays are shared so they are made read-only
+        value = getattr(self._collector, method)(*args)
+        if method == 'get_metric':
+            for array in value:
+                array.flags.writeable = False
+            # end for
+        # end if
+        self._cache.put(key, stamp, value)
+        return value
+    # end _cached
+
+    # Backend stamp
+    def _backend_stamp(self, experiment_name):
+        """
+        Stamp of an experiment in the backend, read again after check_interval seconds
+        :param experiment_name: Experiment name, None for all the experiments
+        :return: Stamp, None if the collector has no backend stamp
+        """
+        now = time.monotonic()
+        with self._stamps_lock:
+            entry = self._backend_stamps.get(experiment_name)
+        # end with
+        if entry is not None and now - entry[0] < self._check_interval:
+            return entry[1]
+        # end if
+        stamp = self._collector.backend_stamp(experiment_name)
+        if self._check_interval > 0:
+            with self._stamps_lock:
+                self._backend_stamps[experiment_name] = (now, stamp)
+            # end with
+        # end if
+        return stamp
+    # end _backend_stamp
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Other attributes from the collector
+    def __getattr__(self, item):
+        """
+        Other attributes from the collector
+        :param item: Attribute name
+        """
+        return getattr(self._collector, item)
+    # end __getattr__
+
+    # endregion OVERRIDE
+
+# end CachedCollector
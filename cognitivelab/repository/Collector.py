@@ -26,8 +26,17 @@
 
 # Imports
 import re
+import uuid
 import datetime
+import threading
+import functools
+import collections
+import numpy as np
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from .BackgroundWriter import BackgroundWriter
+from .ArtifactCodec import ArtifactCodec
+from .ArtifactReader import ArtifactReader
 
 
 # Base class for Collector classes
@@ -40,6 +49,28 @@ class Collector(object):
     COLLECTOR_NOT_INITIALIZED = 0
     COLLECTOT_INITIALIZED = 1
 
+    # Experiment status
+    EXPERIMENT_NOT_FOUND = 0
+    EXPERIMENT_CREATED = 1
+    EXPERIMENT_RUNNING = 2
+    EXPERIMENT_FINISHED = 3
+    EXPERIMENT_FAILED = 4
+
+    # Field with the metric name in metric buckets (records without it are user records)
+    METRIC_FIELD = "_metric"
+
+    # Field with the date a record was stored by the backend (set at flush, incremental sync is based on it)
+    INSERT_DATE_FIELD = "insert_date"
+
+    # Default number of points in a metric bucket
+    METRIC_BUCKET_SIZE = 4096
+
+    # Number of records between two measures of the encoded size of a record (buffer size estimates)
+    SIZE_SAMPLE_INTERVAL = 32
+
+    # Default size of artifact chunks before compression (far below the 16MB BSON document limit)
+    ARTIFACT_CHUNK_SIZE = 1024 * 1024
+
     # Constructor
     def __init__(self, collector_type, collector_connection_string, collector_creation_date=None, collector_last_write_date=None):
         """
@@ -54,6 +85,23 @@ class Collector(object):
         # Creation date
         self._creation_date = datetime.datetime.now() if collector_creation_date is None else collector_creation_date
         self._last_write_date = collector_last_write_date
+
+        # Background writer (asynchronous writes)
+        self._writer = None
+
+        # Open metric buckets, (experiment name, metric) -> [steps array, values array, number of points]
+        self._metric_buckets = dict()
+        self._metric_bucket_size = self.METRIC_BUCKET_SIZE
+        self._metric_lock = threading.Lock()
+
+        # Modification stamps, experiment name -> stamp, and stamp of the last modification of any experiment
+        self._experiment_stamps = dict()
+        self._stamp = 0
+        self._stamp_lock = threading.Lock()
+
+        # Average encoded size of a record, and number of records estimated
+        self._record_size = None
+        self._size_samples = 0
     # end __init__
 
     # region PROPERTIES
@@ -119,6 +167,36 @@ class Collector(object):
         return self._last_write_date
     # end collector_last_write_date
 
+    # Background writer
+    @property
+    def writer(self):
+        """
+        Get the background writer
+        :return: BackgroundWriter object, None if writes are synchronous
+        """
+        return self._writer
+    # end writer
+
+    # Number of points in a metric bucket
+    @property
+    def metric_bucket_size(self):
+        """
+        Get the number of points in a metric bucket
+        :return: Number of points
+        """
+        return self._metric_bucket_size
+    # end metric_bucket_size
+
+    # Set the number of points in a metric bucket
+    @metric_bucket_size.setter
+    def metric_bucket_size(self, value):
+        """
+        Set the number of points in a metric bucket
+        :param value: Number of points
+        """
+        self._metric_bucket_size = value
+    # end metric_bucket_size
+
     # Set collector_destination
     @collector_last_write_date.setter
     def collector_last_write_date(self, v):
@@ -163,11 +241,33 @@ class Collector(object):
         """
         Get an experiment from the collector
         :param experiment_name: Experiment name
-        :return: CLExperiment object
+        :return: Experiment object, None if not found
         """
         pass
     # get_experiment
 
+    # Get experiment information
+    def experiment_info(self, experiment_name):
+        """
+        Get the information of an experiment (name, lab, status, dates and other fields)
+        :param experiment_name: Experiment name
+        :return: Dictionary, None if not found
+        """
+        pass
+    # end experiment_info
+
+    # Create or update an experiment
+    def update_experiment(self, experiment_name, lab=None, status=None, **fields):
+        """
+        Create or update an experiment
+        :param experiment_name: Experiment name
+        :param lab: Lab of the experiment, None to keep the current one
+        :param status: Status of the experiment, None to keep the current one
+        :param fields: Other fields to set
+        """
+        pass
+    # end update_experiment
+
     # What is the status of an experiment?
     def experiment_status(self, experiment_name):
         """
@@ -178,8 +278,653 @@ class Collector(object):
         pass
     # end experiment_status
 
+    # Status of many experiments
+    def experiment_statuses(self, lab=None, status=None):
+        """
+        Status of the experiments of a lab
+        :param lab: Lab name, None for all the experiments
+        :param status: Only experiments with this status, None for all
+        :return: Dictionary of experiment name to status
+        """
+        pass
+    # end experiment_statuses
+
+    # Query records
+    def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment
+        :param experiment_name: Experiment name
+        :param query: Filter on the records as a dictionary, None for all the records
+        :param projection: Fields to return, None for all the fields
+        :return: List of records
+        """
+        pass
+    # end query
+
+    # Write a record
+    def write(self, experiment_name, record):
+        """
+        Write a record of an experiment (may be buffered until flush)
+        :param experiment_name: Experiment name
+        :param record: Record as a dictionary
+        """
+        self.write_many(experiment_name, [record])
+    # end write
+
+    # Write records
+    def write_many(self, experiment_name, records):
+        """
+        Write records of an experiment (may be buffered until flush)
+        :param experiment_name: Experiment name
+        :param records: List of records as dictionaries
+        """
+        self._touch_experiments([experiment_name])
+        self._put_records([self._create_record(experiment_name, record) for record in records])
+    # end write_many
+
+    # Log a metric point
+    def log_metric(self, experiment_name, metric, step, value):
+        """
+        Log a point of a metric series (buffered in a bucket until full or flush)
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param step: Step (integer)
+        :param value: Value (float)
+        """
+        self.log_metrics(experiment_name, metric, [step], [value])
+    # end log_metric
+
+    # Log metric points
+    def log_metrics(self, experiment_name, metric, steps, values):
+        """
+        Log points of a metric series, written as buckets of metric_bucket_size points
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param steps: Steps (array-like of integers)
+        :param values: Values (array-like of floats)
+        """
+        # Add to the open bucket, cut full buckets
+        buckets = self._add_metric_points(experiment_name, metric, steps, values)
+
+        # Points not written yet are part of the experiment
+        self._touch_experiments([experiment_name])
+
+        # Write full buckets
+        if buckets:
+            self._put_records(buckets)
+        # end if
+    # end log_metrics
+
+    # Get a metric series
+    def get_metric(self, experiment_name, metric):
+        """
+        Get a metric series, buffered points are flushed first
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: Steps (int64 array), values (float64 array) ordered by step
+        """
+        # Write buffered points
+        self.flush()
+
+        return self._merge_buckets(self._read_buckets(experiment_name, metric))
+    # end get_metric
+
+    # Flush buffered records
+    def flush(self):
+        """
+        Flush buffered records and metric points to the backend (waits for queued records with asynchronous writes)
+        """
+        # Write open metric buckets
+        buckets = self._seal_metric_buckets()
+        if buckets:
+            self._put_records(buckets)
+        # end if
+
+        # Flush
+        if self._writer is not None:
+            self._writer.flush()
+        else:
+            self._flush_records()
+        # end if
+    # end flush
+
+    # Enable asynchronous writes
+    def enable_async_writes(self, queue_size=10000, batch_size=1000, policy=BackgroundWriter.BLOCK,
+                            spill_directory=None, flush_interval=1.0):
+        """
+        Enable asynchronous writes, records are queued and written to the backend by a background thread
+        :param queue_size: Maximum number of queued records
+        :param batch_size: Maximum number of records written to the backend at once
+        :param policy: What to do when the queue is full ('block', 'drop-oldest' or 'spill' to disk)
+        :param spill_directory: Directory of the spill file, None for the temporary directory
+        :param flush_interval: Maximum time in seconds between two flushes of the backend
+        """
+        if self._writer is None:
+            self._writer = BackgroundWriter(
+                self._write_records,
+                self._flush_records,
+                queue_size=queue_size,
+                batch_size=batch_size,
+                policy=policy,
+                spill_directory=spill_directory,
+                flush_interval=flush_interval,
+                name="{}Writer".format(type(self).__name__)
+            )
+        # end if
+    # end enable_async_writes
+
+    # Disable asynchronous writes
+    def disable_async_writes(self):
+        """
+        Disable asynchronous writes, queued records are written and the background thread is stopped
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        # end if
+    # end disable_async_writes
+
+    # Iterate over records
+    def iter_records(self, since=None, experiment_name=None):
+        """
+        Iterate over the records and metric buckets of all the experiments (streamed)
+        :param since: Only records stored after this datetime (insert date), None for all the records
+        :param experiment_name: Only the records of this experiment, None for all the experiments
+        :return: Iterator of records
+        """
+        return iter(())
+    # end iter_records
+
+    # Iterate over experiments
+    def iter_experiments(self, since=None):
+        """
+        Iterate over the information of the experiments (streamed)
+        :param since: Only experiments updated after this datetime, None for all the experiments
+        :return: Iterator of dictionaries
+        """
+        return iter(())
+    # end iter_experiments
+
+    # Insert or replace records
+    def upsert_records(self, records):
+        """
+        Insert records (from another collector), or replace the ones with the same ID, and flush
+        :param records: List of records
+        """
+        self._touch_experiments({record['experiment'] for record in records})
+        self._put_records(records)
+        self.flush()
+    # end upsert_records
+
+    # Insert or replace experiments
+    def upsert_experiments(self, experiments):
+        """
+        Insert experiments (from another collector), or replace the ones with the same name
+        :param experiments: List of experiment information dictionaries
+        """
+        for experiment in experiments:
+            experiment = dict(experiment)
+            self.update_experiment(experiment.pop('name'), **experiment)
+        # end for
+    # end upsert_experiments
+
+    # Get a sync watermark
+    def sync_watermark(self, source):
+        """
+        Get the date of the last record received from a source collector by sync
+        :param source: Source collector identifier
+        :return: Datetime, None if never synced
+        """
+        pass
+    # end sync_watermark
+
+    # Set a sync watermark
+    def set_sync_watermark(self, source, watermark):
+        """
+        Set the date of the last record received from a source collector by sync
+        :param source: Source collector identifier
+        :param watermark: Datetime
+        """
+        pass
+    # end set_sync_watermark
+
+    # Store an artifact
+    def put_artifact(self, experiment_name, artifact_name, data, compression=ArtifactCodec.ZLIB, level=None,
+                     chunk_size=None, parallelism=4, metadata=None):
+        """
+        Store an artifact (arrays, model weights, files) as compressed chunks, written directly to the backend.
+        Chunks are compressed and written in parallel, at most 2 * parallelism chunks are held in memory when
+        data is a file object. The artifact is visible once all its chunks are written, an artifact with the
+        same name replaces the previous one in reads.
+        :param experiment_name: Experiment name
+        :param artifact_name: Artifact name
+        :param data: Bytes-like object (bytes, contiguous NumPy array) or binary file object
+        :param compression: Compression (none, zlib or zstd)
+        :param level: Compression level, None for the default level of the compression
+        :param chunk_size: Size in bytes of the chunks before compression, None for ARTIFACT_CHUNK_SIZE
+        :param parallelism: Number of chunks compressed and written in parallel
+        :param metadata: Dictionary stored with the artifact (dtype, shape, ...), None for none
+        :return: Artifact information
+        """
+        codec = ArtifactCodec(compression, level)
+        chunk_size = self.ARTIFACT_CHUNK_SIZE if chunk_size is None else chunk_size
+        artifact_id = uuid.uuid4().hex
+
+        # Chunks of the data, all of chunk_size bytes but the last one
+        def read_chunks():
+            while True:
+                chunk = data.read(chunk_size)
+                while chunk and len(chunk) < chunk_size:
+                    rest = data.read(chunk_size - len(chunk))
+                    if not rest:
+                        break
+                    # end if
+                    chunk += rest
+                # end while
+                if not chunk:
+                    return
+                # end if
+                yield chunk
+            # end while
+        # end read_chunks
+        if hasattr(data, 'read'):
+            chunks = read_chunks()
+        else:
+            data = memoryview(data).cast('B')
+            chunks = (data[start:start + chunk_size] for start in range(0, len(data), chunk_size))
+        # end if
+
+        # Compress and write a chunk
+        def write_chunk(index, chunk):
+            compressed = codec.compress(chunk)
+            self._write_artifact_chunk(artifact_id, index, compressed)
+            return len(chunk), len(compressed)
+        # end write_chunk
+
+        # Chunks in parallel, a bounded number in flight
+        length, compressed_length, n_chunks = 0, 0, 0
+        pending = collections.deque()
+        executor = ThreadPoolExecutor(max(1, parallelism), thread_name_prefix="cognitivelab-artifact")
+        try:
+            for chunk in chunks:
+                if len(pending) >= 2 * max(1, parallelism):
+                    size, compressed_size = pending.popleft().result()
+                    length, compressed_length = length + size, compressed_length + compressed_size
+                # end if
+                pending.append(executor.submit(write_chunk, n_chunks, chunk))
+                n_chunks += 1
+            # end for
+            while pending:
+                size, compressed_size = pending.popleft().result()
+                length, compressed_length = length + size, compressed_length + compressed_size
+            # end while
+        except BaseException:
+            # Remove the chunks already written
+            for future in pending:
+                future.cancel()
+            # end for
+            executor.shutdown(wait=True)
+            self._delete_artifact_chunks(artifact_id)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        # end try
+
+        # Artifact visible once its chunks are written
+        info = {
+            '_id': artifact_id,
+            'experiment': experiment_name,
+            'name': artifact_name,
+            'length': length,
+            'compressed_length': compressed_length,
+            'chunks': n_chunks,
+            'chunk_size': chunk_size,
+            'compression': compression,
+            'metadata': metadata or dict(),
+            'date': datetime.datetime.now()
+        }
+        self._write_artifact(info)
+        self._touch_experiments([experiment_name])
+        self.collector_last_write_date = info['date']
+        return info
+    # end put_artifact
+
+    # Read an artifact
+    def get_artifact(self, experiment_name, artifact_name, parallelism=4):
+        """
+        Open an artifact as a streaming binary file object, chunks are read and decompressed ahead in parallel
+        :param experiment_name: Experiment name
+        :param artifact_name: Artifact name
+        :param parallelism: Number of chunks read ahead in parallel
+        :return: ArtifactReader object (to close), None if not found
+        """
+        info = self.artifact_info(experiment_name, artifact_name)
+        if info is None:
+            return None
+        # end if
+        return ArtifactReader(info, functools.partial(self._read_artifact_chunk, info['_id']), parallelism)
+    # end get_artifact
+
+    # Get artifact information
+    def artifact_info(self, experiment_name, artifact_name):
+        """
+        Get the information of the last version of an artifact
+        :param experiment_name: Experiment name
+        :param artifact_name: Artifact name
+        :return: Dictionary (ID, name, lengths, chunks, compression, metadata and date), None if not found
+        """
+        pass
+    # end artifact_info
+
+    # List artifacts
+    def artifacts(self, experiment_name):
+        """
+        List the artifacts of an experiment (last version of each)
+        :param experiment_name: Experiment name
+        :return: List of artifact information dictionaries ordered by name
+        """
+        pass
+    # end artifacts
+
+    # Modification stamp
+    def modification_stamp(self, experiment_name=None):
+        """
+        Modification stamp of an experiment, changed by each write or update of the experiment through
+        this collector (writes from other processes are not seen)
+        :param experiment_name: Experiment name, None for the stamp of the last modification of any experiment
+        :return: Stamp as an integer
+        """
+        with self._stamp_lock:
+            if experiment_name is None:
+                return self._stamp
+            # end if
+            return self._experiment_stamps.get(experiment_name, 0)
+        # end with
+    # end modification_stamp
+
+    # Backend stamp
+    def backend_stamp(self, experiment_name=None):
+        """
+        Modification stamp of an experiment read from the backend, changed by writes from any process
+        :param experiment_name: Experiment name, None for the stamp of the last modification of any experiment
+        :return: Stamp (compared for equality only), None if the backend has no such stamp
+        """
+        return None
+    # end backend_stamp
+
     # endregion PUBLIC
 
+    # region PRIVATE
+
+    # Change the modification stamp of experiments
+    def _touch_experiments(self, experiment_names):
+        """
+        Change the modification stamp of experiments
+        :param experiment_names: Experiment names
+        """
+        with self._stamp_lock:
+            self._stamp += 1
+            for experiment_name in experiment_names:
+                self._experiment_stamps[experiment_name] = self._stamp
+            # end for
+        # end with
+    # end _touch_experiments
+
+    # Create a record
+    def _create_record(self, experiment_name, record):
+        """
+        Create a record to store from a user record
+        :param experiment_name: Experiment name
+        :param record: Record as a dictionary
+        :return: Record with a unique ID, experiment name and date
+        """
+        record = dict(record, experiment=experiment_name, date=datetime.datetime.now())
+        record.setdefault('_id', uuid.uuid4().hex)
+        return record
+    # end _create_record
+
+    # Add metric points to the open bucket
+    def _add_metric_points(self, experiment_name, metric, steps, values):
+        """
+        Copy metric points into the open bucket of the series (preallocated arrays, O(1) per point)
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param steps: Steps (array-like of integers)
+        :param values: Values (array-like of floats)
+        :return: List of full bucket records to write
+        """
+        # Points
+        steps = np.asarray(steps, dtype=np.int64).reshape(-1)
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if len(steps) != len(values):
+            raise ValueError("{} steps for {} values".format(len(steps), len(values)))
+        # end if
+
+        # Fill the open bucket, cut it when full
+        buckets = list()
+        with self._metric_lock:
+            bucket = self._metric_buckets.get((experiment_name, metric))
+            if bucket is None:
+                bucket = [
+                    np.empty(self._metric_bucket_size, dtype=np.int64),
+                    np.empty(self._metric_bucket_size, dtype=np.float64),
+                    0
+                ]
+                self._metric_buckets[(experiment_name, metric)] = bucket
+            # end if
+            bucket_steps, bucket_values, length = bucket
+            position = 0
+            while position < len(steps):
+                n_points = min(len(steps) - position, len(bucket_steps) - length)
+                bucket_steps[length:length + n_points] = steps[position:position + n_points]
+                bucket_values[length:length + n_points] = values[position:position + n_points]
+                length += n_points
+                position += n_points
+
+                # Full bucket, its arrays are copied and reused
+                if length == len(bucket_steps):
+                    buckets.append(self._create_bucket(experiment_name, metric, bucket_steps, bucket_values))
+                    length = 0
+                # end if
+            # end while
+            bucket[2] = length
+        # end with
+
+        return buckets
+    # end _add_metric_points
+
+    # Seal open metric buckets
+    def _seal_metric_buckets(self):
+        """
+        Close the open buckets of all the series
+        :return: List of bucket records to write
+        """
+        with self._metric_lock:
+            buckets = [
+                self._create_bucket(experiment_name, metric, steps[:length], values[:length])
+                for (experiment_name, metric), (steps, values, length) in self._metric_buckets.items()
+                if length > 0
+            ]
+            self._metric_buckets = dict()
+        # end with
+        return buckets
+    # end _seal_metric_buckets
+
+    # Merge metric buckets
+    def _merge_buckets(self, buckets):
+        """
+        Concatenate the points of metric buckets
+        :param buckets: List of bucket records (steps and values as bytes), None for none
+        :return: Steps (int64 array), values (float64 array) ordered by step
+        """
+        # Concatenate buckets
+        buckets = buckets or list()
+        if not buckets:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        # end if
+        steps = np.concatenate([np.frombuffer(bucket['steps'], dtype='<i8') for bucket in buckets])
+        values = np.concatenate([np.frombuffer(bucket['values'], dtype='<f8') for bucket in buckets])
+
+        # Order by step (buckets of points logged out of order)
+        if len(steps) > 1 and np.any(steps[1:] < steps[:-1]):
+            order = np.argsort(steps, kind='stable')
+            steps, values = steps[order], values[order]
+        # end if
+
+        return steps, values
+    # end _merge_buckets
+
+    # Create a metric bucket
+    def _create_bucket(self, experiment_name, metric, steps, values):
+        """
+        Create a metric bucket record, steps and values are stored as raw int64 and float64 bytes
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param steps: Steps (int64 array)
+        :param values: Values (float64 array)
+        :return: Bucket record
+        """
+        return {
+            '_id': uuid.uuid4().hex,
+            'experiment': experiment_name,
+            self.METRIC_FIELD: metric,
+            'start_step': int(steps.min()),
+            'end_step': int(steps.max()),
+            'count': len(steps),
+            'steps': np.ascontiguousarray(steps, dtype='<i8').tobytes(),
+            'values': np.ascontiguousarray(values, dtype='<f8').tobytes(),
+            'date': datetime.datetime.now()
+        }
+    # end _create_bucket
+
+    # Estimate the size of records
+    def _estimate_size(self, records):
+        """
+        Estimate the encoded (BSON) size of records without encoding all of them, the size of metric buckets
+        from their arrays and of other records from an average measured every SIZE_SAMPLE_INTERVAL records
+        (length of their representation without the bson package)
+        :param records: List of records
+        :return: Size in bytes
+        """
+        size = 0
+        for record in records:
+            if self.METRIC_FIELD in record:
+                size += len(record['steps']) + len(record['values']) + 192
+            else:
+                if self._size_samples % self.SIZE_SAMPLE_INTERVAL == 0:
+                    sample = self._record_bytes(record)
+                    self._record_size = sample if self._record_size is None else (3 * self._record_size + sample) // 4
+                # end if
+                self._size_samples += 1
+                size += self._record_size
+            # end if
+        # end for
+        return size
+    # end _estimate_size
+
+    # Encoded size of a record
+    @staticmethod
+    def _record_bytes(record):
+        """
+        Encoded (BSON) size of a record, imported when first used so that collectors do not require pymongo
+        :param record: Record
+        :return: Size in bytes
+        """
+        try:
+            import bson
+        except ImportError:
+            return len(repr(record))
+        # end try
+        try:
+            return len(bson.encode(record))
+        except Exception:
+            return len(repr(record))
+        # end try
+    # end _record_bytes
+
+    # Write records to the backend or the background writer
+    def _put_records(self, records):
+        """
+        Write records to the backend, or queue them with asynchronous writes
+        :param records: List of records
+        """
+        if self._writer is not None:
+            self._writer.put(records)
+        else:
+            self._write_records(records)
+        # end if
+    # end _put_records
+
+    # Read metric buckets
+    def _read_buckets(self, experiment_name, metric):
+        """
+        Read the buckets of a metric series
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: List of bucket records (steps and values as bytes), ordered by start step
+        """
+        pass
+    # end _read_buckets
+
+    # Write records to the backend
+    def _write_records(self, records):
+        """
+        Write records to the backend
+        :param records: List of records (from _create_record)
+        """
+        pass
+    # end _write_records
+
+    # Flush the backend
+    def _flush_records(self):
+        """
+        Flush records buffered by _write_records to the backend
+        """
+        pass
+    # end _flush_records
+
+    # Write an artifact chunk
+    def _write_artifact_chunk(self, artifact_id, index, data):
+        """
+        Write a compressed artifact chunk to the backend (called from threads)
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :param data: Compressed bytes
+        """
+        raise Exception("Error: {} does not store artifacts".format(type(self).__name__))
+    # end _write_artifact_chunk
+
+    # Write artifact information
+    def _write_artifact(self, info):
+        """
+        Write the information of an artifact once its chunks are written
+        :param info: Artifact information
+        """
+        raise Exception("Error: {} does not store artifacts".format(type(self).__name__))
+    # end _write_artifact
+
+    # Read an artifact chunk
+    def _read_artifact_chunk(self, artifact_id, index):
+        """
+        Read a compressed artifact chunk (called from threads)
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :return: Compressed bytes
+        """
+        raise Exception("Error: {} does not store artifacts".format(type(self).__name__))
+    # end _read_artifact_chunk
+
+    # Delete artifact chunks
+    def _delete_artifact_chunks(self, artifact_id):
+        """
+        Delete the chunks of an artifact (failed upload)
+        :param artifact_id: Artifact ID
+        """
+        pass
+    # end _delete_artifact_chunks
+
+    # endregion PRIVATE
+
     # region OVERRIDE
 
     # Override equals
@@ -208,6 +953,17 @@ class Collector(object):
         return urlparse(destination)
     # end get_connection_info
 
+    # Insert date of a record
+    @staticmethod
+    def insert_date(record):
+        """
+        Date a record was stored by the backend, its date for records stored without insert date
+        :param record: Record
+        :return: Datetime
+        """
+        return record.get(Collector.INSERT_DATE_FIELD, record['date'])
+    # end insert_date
+
     # endregion STATIC
 
 # end Collector
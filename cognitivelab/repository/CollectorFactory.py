@@ -22,24 +22,38 @@
 #
 
 # Imports
+import importlib
 
 
 # Class to create and access Collector classes
 class CollectorFactory(object):
     """
-    Class to create and access Collector classes
+    Class to create and access Collector classes. Collector types are declared by name with the module
+    and class implementing them, built-in types here and other types as entry points of the
+    cognitivelab.collectors group, and the module of a type is imported only when a collector of
+    this type is created.
     """
 
     # Instance
     _instance = None
 
+    # Entry point group of collector types (name = module:Class)
+    ENTRY_POINT_GROUP = "cognitivelab.collectors"
+
+    # Built-in collector types, also declared as entry points by setup.py
+    BUILTIN_COLLECTORS = {
+        'mongodb': "cognitivelab.repository.MongoDBCollector:MongoDBCollector",
+        'file': "cognitivelab.repository.FileCollector:FileCollector"
+    }
+
     # Constructor
     def __init__(self):
         """
         Constructor
         """
-        # Init. collectors
-        self._collectors = dict()
+        # Init. collectors, name -> class, or "module:Class" string / entry point not imported yet
+        self._collectors = dict(self.BUILTIN_COLLECTORS)
+        self._entry_points_loaded = False
 
         # Save instance
         self._instance = self
@@ -50,49 +64,71 @@ class CollectorFactory(object):
     # List of collector types
     def collector_types(self):
         """
-        List of collector types
+        List of collector types (declared, nothing is imported)
         :return: Collector types as a List
         """
-        return self._collectors.keys()
+        self._load_entry_points()
+        return list(self._collectors.keys())
     # end collector_types
 
     # Register collector
     def register_collector(self, name, collector):
         """
         Register collector
-        :param name:
-        :param collector:
-        :return:
+        :param name: Collector type
+        :param collector: Collector class, or "module:Class" string imported when first used
         """
         self._collectors[name] = collector
     # end register_collector
 
-    # Get a collector
-    def get_collector(self, collector_type, connection_string):
+    # Get a collector class
+    def get_collector_class(self, collector_type):
         """
-        Get a collector
-        :param collector_type:
-        :param connection_string:
-        :return:
+        Get the class of a collector type, its module is imported on first use
+        :param collector_type: Collector type
+        :return: Collector class
         """
-        # Create and returns collector
+        self._load_entry_points()
+        if collector_type not in self._collectors:
+            raise ValueError("Unknown collector type {}".format(collector_type))
+        # end if
+
+        # Import
         collector = self._collectors[collector_type]
-        if not collector:
-            raise ValueError(collector_type)
+        if isinstance(collector, str):
+            module_name, class_name = collector.split(':')
+            collector = getattr(importlib.import_module(module_name), class_name)
+        elif not isinstance(collector, type):
+            collector = collector.load()
         # end if
-        return collector(connection_string)
+        self._collectors[collector_type] = collector
+        return collector
+    # end get_collector_class
+
+    # Get a collector
+    def get_collector(self, collector_type, connection_string, **kwargs):
+        """
+        Get a collector
+        :param collector_type: Collector type
+        :param connection_string: Connection string
+        :param kwargs: Options of the collector class
+        :return: Collector object
+        """
+        return self.get_collector_class(collector_type)(connection_string, **kwargs)
     # end get_collector
 
     # Get a collector from configuration
-    def get_collector_from_config(self, collector_config):
+    def get_collector_from_config(self, collector_config, **kwargs):
         """
         Get a collector from configuration
         :param collector_config: config.objects.Collector object
+        :param kwargs: Options of the collector class
         :return:
         """
         return self.get_collector(
             collector_config.collector_type,
-            collector_config.collector_destination
+            collector_config.collector_connection_string,
+            **kwargs
         )
     # end get_collector_from_config
 
@@ -107,6 +143,43 @@ class CollectorFactory(object):
 
     # endregion PUBLIC
 
+    # region PRIVATE
+
+    # Load entry points
+    def _load_entry_points(self):
+        """
+        Declare the collector types of the entry points of installed packages (read from their
+        metadata, not imported), built-in and registered types are kept
+        """
+        # Already loaded
+        if self._entry_points_loaded:
+            return
+        # end if
+        self._entry_points_loaded = True
+
+        # Metadata of installed packages (Python 3.8+)
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            return
+        # end try
+        all_entry_points = entry_points()
+        if hasattr(all_entry_points, 'select'):
+            group_entry_points = all_entry_points.select(group=self.ENTRY_POINT_GROUP)
+        else:
+            group_entry_points = all_entry_points.get(self.ENTRY_POINT_GROUP, list())
+        # end if
+
+        # Declare
+        for entry_point in group_entry_points:
+            if entry_point.name not in self._collectors:
+                self._collectors[entry_point.name] = entry_point
+            # end if
+        # end for
+    # end _load_entry_points
+
+    # endregion PRIVATE
+
     # region STATIC
 
     # endregion STATIC
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : CollectorSync.py
+# Description : Incremental copy of the records of a collector to another
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 22.10.2026 15:20:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import time
+import datetime
+from .Collector import Collector
+
+
+# Incremental copy of the records of a collector to another
+class CollectorSync(object):
+    """
+    Incremental copy of the records, metric buckets and experiments of a source collector to a
+    destination collector. The destination keeps a watermark per source, the last write date of the
+    source when synced, and only records stored in the source after the watermark (insert date set
+    by the backend at flush, so spooled or retried records are caught whatever their date) are
+    streamed and upserted by batch. The source is not read at all if its last write date is not
+    after the watermark. Records stamped before a sync but stored after it (flushes in progress,
+    clocks of other writers) are caught by starting overlap seconds before the watermark, records
+    received twice are replaced by their ID.
+    """
+
+    # Constructor
+    def __init__(self, source, destination, batch_size=1000, overlap=60.0):
+        """
+        Constructor
+        :param source: Source collector (opened)
+        :param destination: Destination collector (opened)
+        :param batch_size: Number of records per bulk upsert
+        :param overlap: Seconds before the watermark to start from
+        """
+        self._source = source
+        self._destination = destination
+        self._batch_size = batch_size
+        self._overlap = datetime.timedelta(seconds=overlap)
+    # end __init__
+
+    # region PROPERTIES
+
+    # Source identifier
+    @property
+    def source_id(self):
+        """
+        Identifier of the source in the watermarks of the destination
+        :return: collector_type:collector_connection_string
+        """
+        return "{}:{}".format(self._source.collector_type, self._source.collector_connection_string)
+    # end source_id
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Run the sync
+    def run(self):
+        """
+        Copy new records and experiments to the destination
+        :return: Dictionary with the number of records and experiments copied, the previous and new
+        watermarks, whether the source was up to date and the duration in seconds
+        """
+        start_time = time.perf_counter()
+
+        # Watermark
+        watermark = self._destination.sync_watermark(self.source_id)
+        stats = {
+            'records': 0,
+            'experiments': 0,
+            'previous_watermark': watermark,
+            'watermark': watermark,
+            'up_to_date': False
+        }
+
+        # Nothing new in the source, dates are stored with a millisecond precision
+        last_write_date = self._source.collector_last_write_date
+        if last_write_date is not None:
+            last_write_date = last_write_date.replace(microsecond=last_write_date.microsecond // 1000 * 1000)
+        # end if
+        if watermark is not None and last_write_date is not None and last_write_date <= watermark:
+            stats['up_to_date'] = True
+            stats['duration'] = time.perf_counter() - start_time
+            return stats
+        # end if
+        since = None if watermark is None else watermark - self._overlap
+
+        # Stream records by batch
+        batch = list()
+        for record in self._source.iter_records(since):
+            batch.append(record)
+            insert_date = Collector.insert_date(record)
+            if watermark is None or insert_date > watermark:
+                watermark = insert_date
+            # end if
+            if len(batch) >= self._batch_size:
+                self._destination.upsert_records(batch)
+                stats['records'] += len(batch)
+                batch = list()
+            # end if
+        # end for
+        if batch:
+            self._destination.upsert_records(batch)
+            stats['records'] += len(batch)
+        # end if
+
+        # Experiments updated since
+        batch = list()
+        for experiment in self._source.iter_experiments(since):
+            batch.append(experiment)
+            update_date = experiment.get('update_date')
+            if update_date is not None and (watermark is None or update_date > watermark):
+                watermark = update_date
+            # end if
+            if len(batch) >= self._batch_size:
+                self._destination.upsert_experiments(batch)
+                stats['experiments'] += len(batch)
+                batch = list()
+            # end if
+        # end for
+        if batch:
+            self._destination.upsert_experiments(batch)
+            stats['experiments'] += len(batch)
+        # end if
+
+        # Everything written to the source before the sync started was read
+        if last_write_date is not None and (watermark is None or last_write_date > watermark):
+            watermark = last_write_date
+        # end if
+
+        # New watermark, once everything is written
+        self._destination.flush()
+        if watermark is not None:
+            self._destination.set_sync_watermark(self.source_id, watermark)
+        # end if
+        stats['watermark'] = watermark
+        stats['duration'] = time.perf_counter() - start_time
+        return stats
+    # end run
+
+    # endregion PUBLIC
+
+# end CollectorSync
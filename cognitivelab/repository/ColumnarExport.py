@@ -0,0 +1,454 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : ColumnarExport.py
+# Description : Streaming export and import of experiments to columnar files
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 23.10.2026 15:00:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import os
+import hashlib
+import itertools
+import numpy as np
+from bson import json_util
+from .Collector import Collector
+from .AsyncCollector import AsyncCollector
+
+
+# Streaming export and import of experiments to columnar files
+class ColumnarExport(object):
+    """
+    Streaming export of the experiments, records and metric series of a collector to columnar files
+    (Parquet or Arrow IPC, with the pyarrow package), and import of these files into a collector.
+    A directory holds three tables: experiments (one row per experiment), records (one row per record,
+    the user fields as JSON) and metrics (one row per point). Records are read with the streamed
+    cursors of the collector and written by batches of batch_size rows, files are read back batch
+    by batch, so memory stays bounded whatever the size of the experiments. Metric points are imported
+    as buckets with IDs derived from the series and their position, so importing twice replaces them.
+    """
+
+    # File formats
+    PARQUET = 'parquet'
+    ARROW = 'arrow'
+
+    # Tables
+    EXPERIMENTS = 'experiments'
+    RECORDS = 'records'
+    METRICS = 'metrics'
+
+    # Columns of the experiments table, other fields are stored as JSON
+    EXPERIMENT_COLUMNS = ('name', 'lab', 'status', 'creation_date', 'update_date')
+
+    # Constructor
+    def __init__(self, collector, file_format=PARQUET, batch_size=65536):
+        """
+        Constructor
+        :param collector: Collector (opened)
+        :param file_format: File format (parquet or arrow)
+        :param batch_size: Number of rows per written or read batch
+        """
+        # Streamed reads and writes of synchronous collectors only
+        if isinstance(collector, AsyncCollector):
+            raise NotImplementedError("Error: columnar export is not available on asyncio collectors")
+        # end if
+
+        # Check format
+        if file_format not in (self.PARQUET, self.ARROW):
+            raise Exception("Error: unknown columnar format {}".format(file_format))
+        # end if
+
+        # pyarrow is optional
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise Exception("Error: columnar export requires the pyarrow package (pip install pyarrow)")
+        # end try
+        self._pa = pyarrow
+
+        # Properties
+        self._collector = collector
+        self._file_format = file_format
+        self._batch_size = batch_size
+
+        # Table schemas
+        timestamp = pyarrow.timestamp('us')
+        self._schemas = {
+            self.EXPERIMENTS: pyarrow.schema([
+                ('name', pyarrow.string()),
+                ('lab', pyarrow.string()),
+                ('status', pyarrow.int64()),
+                ('creation_date', timestamp),
+                ('update_date', timestamp),
+                ('fields', pyarrow.string())
+            ]),
+            self.RECORDS: pyarrow.schema([
+                ('_id', pyarrow.string()),
+                ('experiment', pyarrow.string()),
+                ('date', timestamp),
+                ('data', pyarrow.string())
+            ]),
+            self.METRICS: pyarrow.schema([
+                ('experiment', pyarrow.string()),
+                ('metric', pyarrow.string()),
+                ('step', pyarrow.int64()),
+                ('value', pyarrow.float64())
+            ])
+        }
+    # end __init__
+
+    # region PUBLIC
+
+    # Export experiments
+    def export_experiments(self, directory, lab=None):
+        """
+        Export experiments, their records and metric series to a directory
+        :param directory: Output directory (created if needed)
+        :param lab: Only the experiments of this lab, None for all the experiments and records
+        :return: Dictionary with the number of experiments, records and metric points exported
+        """
+        # Experiments of a lab
+        if lab is not None and not self._has_experiment_api():
+            raise Exception("Error: {} collectors do not store experiments, cannot export lab {}".format(
+                self._collector.collector_type, lab
+            ))
+        # end if
+
+        # Write buffered records
+        self._collector.flush()
+        os.makedirs(directory, exist_ok=True)
+        stats = {'experiments': 0, 'records': 0, 'points': 0}
+
+        # Writers and row buffers of the tables
+        writers = {table: self._open_writer(directory, table) for table in self._schemas}
+        buffers = {table: self._empty_buffer(table) for table in self._schemas}
+        try:
+            # Experiments
+            experiment_names = list()
+            for info in self._collector.iter_experiments():
+                if lab is not None and info.get('lab') != lab:
+                    continue
+                # end if
+                experiment_names.append(info['name'])
+                fields = {key: value for key, value in info.items() if key not in self.EXPERIMENT_COLUMNS}
+                for column in self.EXPERIMENT_COLUMNS:
+                    buffers[self.EXPERIMENTS][column].append(info.get(column))
+                # end for
+                buffers[self.EXPERIMENTS]['fields'].append(json_util.dumps(fields))
+                stats['experiments'] += 1
+                self._write_buffer(writers, buffers, self.EXPERIMENTS)
+            # end for
+
+            # Records of the lab, or all the records
+            if lab is None:
+                records = self._collector.iter_records()
+            else:
+                records = itertools.chain.from_iterable(
+                    self._collector.iter_records(experiment_name=experiment_name)
+                    for experiment_name in experiment_names
+                )
+            # end if
+
+            # Records and metric points
+            for record in records:
+                if Collector.METRIC_FIELD in record:
+                    steps = np.frombuffer(record['steps'], dtype='<i8')
+                    buffer = buffers[self.METRICS]
+                    buffer['experiment'].append(np.full(len(steps), record['experiment'], dtype=object))
+                    buffer['metric'].append(np.full(len(steps), record[Collector.METRIC_FIELD], dtype=object))
+                    buffer['step'].append(steps)
+                    buffer['value'].append(np.frombuffer(record['values'], dtype='<f8'))
+                    stats['points'] += len(steps)
+                    self._write_buffer(writers, buffers, self.METRICS)
+                else:
+                    record = dict(record)
+                    buffer = buffers[self.RECORDS]
+                    buffer['_id'].append(str(record.pop('_id')))
+                    buffer['experiment'].append(record.pop('experiment'))
+                    buffer['date'].append(record.pop('date'))
+                    record.pop(Collector.INSERT_DATE_FIELD, None)
+                    buffer['data'].append(json_util.dumps(record))
+                    stats['records'] += 1
+                    self._write_buffer(writers, buffers, self.RECORDS)
+                # end if
+            # end for
+
+            # Rest of the rows
+            for table in self._schemas:
+                self._write_buffer(writers, buffers, table, force=True)
+            # end for
+        finally:
+            for writer in writers.values():
+                writer.close()
+            # end for
+        # end try
+
+        return stats
+    # end export_experiments
+
+    # Import experiments
+    def import_experiments(self, directory):
+        """
+        Import experiments, records and metric series from a directory written by export_experiments.
+        Experiments, records and metric buckets already imported are replaced.
+        :param directory: Input directory
+        :return: Dictionary with the number of experiments, records and metric points imported
+        """
+        stats = {'experiments': 0, 'records': 0, 'points': 0}
+
+        # Experiments are not stored by the collector
+        if not self._has_experiment_api() and any(
+                batch.num_rows > 0 for batch in self._read_batches(directory, self.EXPERIMENTS)):
+            raise Exception("Error: {} collectors do not store experiments, cannot import {}".format(
+                self._collector.collector_type, directory
+            ))
+        # end if
+
+        # Experiments
+        for batch in self._read_batches(directory, self.EXPERIMENTS):
+            experiments = list()
+            for row in batch.to_pylist():
+                info = json_util.loads(row.pop('fields'))
+                info.update({key: value for key, value in row.items() if value is not None})
+                experiments.append(info)
+            # end for
+            self._collector.upsert_experiments(experiments)
+            stats['experiments'] += len(experiments)
+        # end for
+
+        # Records
+        for batch in self._read_batches(directory, self.RECORDS):
+            records = list()
+            for row in batch.to_pylist():
+                record = json_util.loads(row['data'])
+                record.update(_id=row['_id'], experiment=row['experiment'], date=row['date'])
+                records.append(record)
+            # end for
+            self._collector.upsert_records(records)
+            stats['records'] += len(records)
+        # end for
+
+        # Metric points, cut in buckets per series
+        series = dict()
+        buckets = list()
+        for batch in self._read_batches(directory, self.METRICS):
+            experiments = batch.column('experiment').to_numpy(zero_copy_only=False)
+            metrics = batch.column('metric').to_numpy(zero_copy_only=False)
+            steps = batch.column('step').to_numpy()
+            values = batch.column('value').to_numpy()
+            changes = np.flatnonzero((experiments[1:] != experiments[:-1]) | (metrics[1:] != metrics[:-1])) + 1
+            for start, stop in zip(np.concatenate(([0], changes)), np.concatenate((changes, [len(steps)]))):
+                buckets.extend(self._add_points(
+                    series, experiments[start], metrics[start], steps[start:stop], values[start:stop]
+                ))
+            # end for
+            stats['points'] += len(steps)
+
+            # Write full buckets
+            if len(buckets) * self._collector.metric_bucket_size >= self._batch_size:
+                self._collector.upsert_records(buckets)
+                buckets = list()
+            # end if
+        # end for
+
+        # Write the rest of the buckets
+        for experiment_name, metric in list(series):
+            buckets.extend(self._add_points(series, experiment_name, metric, None, None, force=True))
+        # end for
+        if buckets:
+            self._collector.upsert_records(buckets)
+        # end if
+
+        return stats
+    # end import_experiments
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Does the collector store experiments?
+    def _has_experiment_api(self):
+        """
+        Does the collector store experiments? (iter_experiments and upsert_experiments of the base class are no-ops)
+        :return: True/False
+        """
+        collector_class = type(self._collector)
+        if not issubclass(collector_class, Collector):
+            collector_class = type(self._collector.collector)
+        # end if
+        return collector_class.iter_experiments is not Collector.iter_experiments and \
+            collector_class.update_experiment is not Collector.update_experiment
+    # end _has_experiment_api
+
+    # Add metric points to the bucket of a series
+    def _add_points(self, series, experiment_name, metric, steps, values, force=False):
+        """
+        Add imported metric points to the open bucket of a series, buckets have a stable ID (series and
+        position in the series) so that importing the same file again replaces them
+        :param series: Dictionary of (experiment, metric) to open bucket (list of step and value arrays, number
+        of points, number of buckets cut)
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :param steps: Steps (int64 array), None with force
+        :param values: Values (float64 array), None with force
+        :param force: Cut the open bucket whatever its size
+        :return: List of bucket records
+        """
+        # Open bucket
+        bucket = series.setdefault((experiment_name, metric), [list(), list(), 0, 0])
+        if steps is not None:
+            bucket[0].append(steps)
+            bucket[1].append(values)
+            bucket[2] += len(steps)
+        # end if
+
+        # Not full
+        bucket_size = self._collector.metric_bucket_size
+        if bucket[2] == 0 or (not force and bucket[2] < bucket_size):
+            return list()
+        # end if
+
+        # Cut buckets
+        buckets = list()
+        all_steps, all_values = np.concatenate(bucket[0]), np.concatenate(bucket[1])
+        position = 0
+        while len(all_steps) - position >= bucket_size or (force and position < len(all_steps)):
+            end = min(position + bucket_size, len(all_steps))
+            record = self._collector._create_bucket(
+                experiment_name, metric, all_steps[position:end], all_values[position:end]
+            )
+            bucket_id = "{}\x00{}\x00{}".format(experiment_name, metric, bucket[3])
+            record['_id'] = hashlib.sha1(bucket_id.encode('utf-8')).hexdigest()[:32]
+            buckets.append(record)
+            position = end
+            bucket[3] += 1
+        # end while
+
+        # Rest of the points
+        bucket[0], bucket[1] = [all_steps[position:]], [all_values[position:]]
+        bucket[2] = len(all_steps) - position
+        return buckets
+    # end _add_points
+
+    # Table path
+    def _table_path(self, directory, table):
+        """
+        Path of a table file
+        :param directory: Directory
+        :param table: Table name
+        :return: Path
+        """
+        return os.path.join(directory, "{}.{}".format(table, self._file_format))
+    # end _table_path
+
+    # Open a table writer
+    def _open_writer(self, directory, table):
+        """
+        Open the writer of a table file
+        :param directory: Directory
+        :param table: Table name
+        :return: Parquet or Arrow IPC writer
+        """
+        path = self._table_path(directory, table)
+        if self._file_format == self.PARQUET:
+            return self._pa.parquet.ParquetWriter(path, self._schemas[table])
+        # end if
+        return self._pa.ipc.new_file(path, self._schemas[table])
+    # end _open_writer
+
+    # Empty row buffer
+    def _empty_buffer(self, table):
+        """
+        Empty row buffer of a table
+        :param table: Table name
+        :return: Dictionary of column name to list of values (or arrays for metric points)
+        """
+        return {name: list() for name in self._schemas[table].names}
+    # end _empty_buffer
+
+    # Write a row buffer
+    def _write_buffer(self, writers, buffers, table, force=False):
+        """
+        Write the row buffer of a table as a batch when it holds batch_size rows
+        :param writers: Dictionary of table name to writer
+        :param buffers: Dictionary of table name to row buffer
+        :param table: Table name
+        :param force: Write the buffer whatever its size
+        """
+        # Size of the buffer
+        buffer = buffers[table]
+        if table == self.METRICS:
+            length = sum(len(steps) for steps in buffer['step'])
+        else:
+            length = len(buffer['_id' if table == self.RECORDS else 'name'])
+        # end if
+
+        # Not full yet
+        if length == 0 or (not force and length < self._batch_size):
+            return
+        # end if
+
+        # Columns
+        schema = self._schemas[table]
+        if table == self.METRICS:
+            columns = [np.concatenate(buffer[name]) for name in schema.names]
+        else:
+            columns = [buffer[name] for name in schema.names]
+        # end if
+        writers[table].write_table(self._pa.Table.from_arrays(
+            [self._pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+            schema=schema
+        ))
+        buffers[table] = self._empty_buffer(table)
+    # end _write_buffer
+
+    # Read table batches
+    def _read_batches(self, directory, table):
+        """
+        Read a table file batch by batch
+        :param directory: Directory
+        :param table: Table name
+        :return: Iterator of record batches
+        """
+        path = self._table_path(directory, table)
+        if not os.path.exists(path):
+            return
+        # end if
+        if self._file_format == self.PARQUET:
+            for batch in self._pa.parquet.ParquetFile(path).iter_batches(batch_size=self._batch_size):
+                yield batch
+            # end for
+        else:
+            with self._pa.memory_map(path) as source:
+                reader = self._pa.ipc.open_file(source)
+                for index in range(reader.num_record_batches):
+                    yield reader.get_batch(index)
+                # end for
+            # end with
+        # end if
+    # end _read_batches
+
+    # endregion PRIVATE
+
+# end ColumnarExport
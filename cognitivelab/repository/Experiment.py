@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : Experiment.py
+# Description : Experiment stored in a collector, loaded lazily
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 21.10.2026 11:50:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Experiment stored in a collector
+class Experiment(object):
+    """
+    Experiment stored in a collector. Only the name and the status are known when created,
+    the information and the records are read from the collector when first used.
+    """
+
+    # Constructor
+    def __init__(self, collector, name, status=None):
+        """
+        Constructor
+        :param collector: Collector storing the experiment
+        :param name: Experiment name
+        :param status: Experiment status if already known
+        """
+        self._collector = collector
+        self._name = name
+        self._status = status
+        self._info = None
+        self._records = None
+    # end __init__
+
+    # region PROPERTIES
+
+    # Experiment name
+    @property
+    def name(self):
+        """
+        Get experiment name
+        :return: Experiment name
+        """
+        return self._name
+    # end name
+
+    # Experiment status
+    @property
+    def status(self):
+        """
+        Get experiment status
+        :return: Status as an integer
+        """
+        if self._status is None:
+            self._status = self._collector.experiment_status(self._name)
+        # end if
+        return self._status
+    # end status
+
+    # Experiment information
+    @property
+    def info(self):
+        """
+        Get experiment information (loaded on first use)
+        :return: Dictionary
+        """
+        if self._info is None:
+            self._info = self._collector.experiment_info(self._name) or dict()
+        # end if
+        return self._info
+    # end info
+
+    # Experiment lab
+    @property
+    def lab(self):
+        """
+        Get experiment lab
+        :return: Lab name
+        """
+        return self.info.get('lab')
+    # end lab
+
+    # Experiment records
+    @property
+    def records(self):
+        """
+        Get experiment records (loaded on first use)
+        :return: List of records
+        """
+        if self._records is None:
+            self._records = self._collector.query(self._name)
+        # end if
+        return self._records
+    # end records
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Reload
+    def reload(self):
+        """
+        Forget loaded status, information and records, read again when next used
+        """
+        self._status = None
+        self._info = None
+        self._records = None
+    # end reload
+
+    # endregion PUBLIC
+
+    # region OVERRIDE
+
+    # Get an information field
+    def __getitem__(self, item):
+        """
+        Get an information field
+        :param item: Field name
+        :return: Field value
+        """
+        return self.info[item]
+    # end __getitem__
+
+    # To string
+    def __repr__(self):
+        """
+        To string
+        """
+        return "Experiment(name={!r}, status={!r})".format(self._name, self._status)
+    # end __repr__
+
+    # endregion OVERRIDE
+
+# end Experiment
@@ -0,0 +1,597 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : FanOutCollector.py
+# Description : Collector writing to several collectors concurrently
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 22.10.2026 10:10:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import time
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from .Collector import Collector
+from .BackgroundWriter import BackgroundWriter
+from .CollectorFactory import collector_factory
+
+
+# Collector writing to several collectors concurrently
+class FanOutCollector(Collector):
+    """
+    Collector writing each batch of records to several collectors concurrently. Every backend has
+    its own background writer and queue, so a slow backend does not stall the others (by default a
+    full queue spills to disk). Experiment updates and artifact writes are run in order by a thread
+    per backend, the caller waits for the first backend only (reads go to the first backend opened),
+    and at most max_pending_operations operations wait per backend. A backend failing to open or to
+    write is isolated from the others, its errors and lag are reported by backend_stats().
+    """
+
+    # Constructor
+    def __init__(self, collectors, queue_size=10000, batch_size=1000, policy=BackgroundWriter.SPILL,
+                 spill_directory=None, flush_interval=1.0, flush_timeout=None, max_pending_operations=64):
+        """
+        Constructor
+        :param collectors: List of Collector objects
+        :param queue_size: Maximum number of queued records per backend
+        :param batch_size: Maximum number of records written to a backend at once
+        :param policy: What to do when the queue of a backend is full ('block', 'drop-oldest' or 'spill')
+        :param spill_directory: Directory of the spill files, None for the temporary directory
+        :param flush_interval: Maximum time in seconds between two flushes of a backend
+        :param flush_timeout: Maximum time in seconds to wait for the backends when flushing, and for a
+        backend with max_pending_operations operations (the operation is not run on it), None to wait
+        :param max_pending_operations: Maximum number of experiment updates and artifact writes waiting per backend
+        """
+        # Super
+        super(FanOutCollector, self).__init__(
+            "fanout",
+            ",".join(collector.collector_connection_string for collector in collectors)
+        )
+
+        # Properties
+        self._collectors = list(collectors)
+        self._writer_options = dict(
+            queue_size=queue_size,
+            batch_size=batch_size,
+            policy=policy,
+            spill_directory=spill_directory,
+            flush_interval=flush_interval
+        )
+        self._flush_timeout = flush_timeout
+        self._max_pending_operations = max_pending_operations
+        self._opened = False
+
+        # Thread, slots and pending operations of each backend, index -> executor, semaphore, set of futures
+        self._executors = dict()
+        self._slots = dict()
+        self._operations = dict()
+        self._operations_lock = threading.Lock()
+
+        # Backends which failed to open, and last error of a write or update, index -> exception
+        self._failures = dict()
+        self._errors = dict()
+
+        # Backends with a chunk of an artifact skipped or failed, artifact ID -> set of indexes
+        self._incomplete_artifacts = dict()
+    # end __init__
+
+    # region PROPERTIES
+
+    # Backends
+    @property
+    def collectors(self):
+        """
+        Get backends
+        :return: List of Collector objects
+        """
+        return self._collectors
+    # end collectors
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Open the collector
+    def open(self):
+        """
+        Open the backends and start their writers, raises only if no backend can be opened
+        """
+        # Already opened
+        if self._opened:
+            return
+        # end if
+
+        # Open each backend
+        self._failures = dict()
+        self._errors = dict()
+        self._incomplete_artifacts = dict()
+        for index, collector in enumerate(self._collectors):
+            try:
+                collector.open()
+                collector.enable_async_writes(**self._writer_options)
+            except Exception as e:
+                self._failures[index] = e
+            # end try
+        # end for
+
+        # No backend
+        if len(self._failures) == len(self._collectors):
+            raise Exception("Error: no collector could be opened ({})".format(
+                "; ".join(str(e) for e in self._failures.values())
+            ))
+        # end if
+
+        # Operation thread of each backend
+        for index in range(len(self._collectors)):
+            if index not in self._failures:
+                self._executors[index] = ThreadPoolExecutor(max_workers=1)
+                self._slots[index] = threading.BoundedSemaphore(self._max_pending_operations)
+                self._operations[index] = set()
+            # end if
+        # end for
+
+        # Opened
+        self._opened = True
+    # end open
+
+    # Close the collector
+    def close(self):
+        """
+        Close the collector, the queue of each backend is drained
+        """
+        # Not opened
+        if not self._opened:
+            return
+        # end if
+
+        # Write what is left
+        self.flush()
+
+        # Stop operation threads once their operations are done
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        # end for
+        self._executors = dict()
+        self._slots = dict()
+        self._operations = dict()
+
+        # Close backends
+        for collector in self._active_collectors():
+            try:
+                collector.disable_async_writes()
+                collector.close()
+            except Exception:
+                pass
+            # end try
+        # end for
+        self._opened = False
+    # end close
+
+    # Get collector status
+    def status(self):
+        """
+        Get collector status
+        :return: Collector status as an Integer
+        """
+        if self._opened:
+            return Collector.COLLECTOT_INITIALIZED
+        else:
+            return Collector.COLLECTOR_NOT_INITIALIZED
+        # end if
+    # end status
+
+    # Get experiment
+    def get_experiment(self, experiment_name):
+        """
+        Get an experiment from the first backend
+        :param experiment_name: Experiment name
+        :return: Experiment object, None if not found
+        """
+        return self._primary().get_experiment(experiment_name)
+    # end get_experiment
+
+    # Get experiment information
+    def experiment_info(self, experiment_name):
+        """
+        Get the information of an experiment from the first backend
+        :param experiment_name: Experiment name
+        :return: Dictionary, None if not found
+        """
+        return self._primary().experiment_info(experiment_name)
+    # end experiment_info
+
+    # Create or update an experiment
+    def update_experiment(self, experiment_name, lab=None, status=None, **fields):
+        """
+        Create or update an experiment in every backend, errors of a backend are reported by backend_stats()
+        :param experiment_name: Experiment name
+        :param lab: Lab of the experiment, None to keep the current one
+        :param status: Status of the experiment, None to keep the current one
+        :param fields: Other fields to set
+        """
+        self._run_operation(lambda collector: collector.update_experiment(
+            experiment_name,
+            lab=lab,
+            status=status,
+            **fields
+        ))
+        self._touch_experiments([experiment_name])
+    # end update_experiment
+
+    # What is the status of an experiment?
+    def experiment_status(self, experiment_name):
+        """
+        What is the status of an experiment? (first backend)
+        :param experiment_name: Experiment name
+        :return: Status as an integer
+        """
+        return self._primary().experiment_status(experiment_name)
+    # end experiment_status
+
+    # Status of many experiments
+    def experiment_statuses(self, lab=None, status=None):
+        """
+        Status of the experiments of a lab (first backend)
+        :param lab: Lab name, None for all the experiments
+        :param status: Only experiments with this status, None for all
+        :return: Dictionary of experiment name to status
+        """
+        return self._primary().experiment_statuses(lab=lab, status=status)
+    # end experiment_statuses
+
+    # Query records
+    def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment (first backend), buffered records are flushed first
+        :param experiment_name: Experiment name
+        :param query: Filter on the records as a dictionary, None for all the records
+        :param projection: Fields to return, None for all the fields
+        :return: List of records
+        """
+        self.flush()
+        return self._primary().query(experiment_name, query=query, projection=projection)
+    # end query
+
+    # Get artifact information
+    def artifact_info(self, experiment_name, artifact_name):
+        """
+        Get the information of the last version of an artifact from the first backend
+        :param experiment_name: Experiment name
+        :param artifact_name: Artifact name
+        :return: Dictionary, None if not found
+        """
+        return self._primary().artifact_info(experiment_name, artifact_name)
+    # end artifact_info
+
+    # List artifacts
+    def artifacts(self, experiment_name):
+        """
+        List the artifacts of an experiment (first backend)
+        :param experiment_name: Experiment name
+        :return: List of artifact information dictionaries ordered by name
+        """
+        return self._primary().artifacts(experiment_name)
+    # end artifacts
+
+    # Statistics of the backends
+    def backend_stats(self):
+        """
+        Statistics of the backends
+        :return: List of dictionaries with the backend type and connection string, whether it is opened,
+        the open failure, the last error of a write or update, the number of experiment updates and artifact
+        writes pending, the statistics of its writer (pending, written, dropped, spilled, errors, last_error),
+        and its lag (pending records, and seconds since records are pending)
+        """
+        stats = list()
+        now = time.time()
+        for index, collector in enumerate(self._collectors):
+            backend = {
+                'collector_type': collector.collector_type,
+                'collector_connection_string': collector.collector_connection_string,
+                'opened': self._opened and index not in self._failures,
+                'failure': self._failures.get(index),
+                'error': self._errors.get(index),
+                'pending_operations': len(self._operations.get(index, ()))
+            }
+            if collector.writer is not None:
+                backend.update(collector.writer.stats)
+                backend['lag'] = backend['pending']
+                backend['lag_seconds'] = 0.0 if backend['pending_since'] is None else now - backend['pending_since']
+            # end if
+            stats.append(backend)
+        # end for
+        return stats
+    # end backend_stats
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Opened backends
+    def _active_collectors(self, with_index=False):
+        """
+        Backends opened successfully
+        :param with_index: Return (index, collector) pairs
+        :return: List of collectors
+        """
+        if not self._opened:
+            return list()
+        # end if
+        return [
+            (index, collector) if with_index else collector
+            for index, collector in enumerate(self._collectors)
+            if index not in self._failures
+        ]
+    # end _active_collectors
+
+    # First backend
+    def _primary(self):
+        """
+        First backend opened successfully
+        :return: Collector object
+        """
+        active = self._active_collectors()
+        if not active:
+            raise Exception("Error: fan-out collector is not opened")
+        # end if
+        return active[0]
+    # end _primary
+
+    # Run an operation on the backends
+    def _run_operation(self, operation, with_index=False, on_error=None):
+        """
+        Run an operation on every backend by its operation thread, wait for the first backend only. A backend
+        with max_pending_operations operations waiting is waited for flush_timeout seconds, then skipped.
+        Errors are reported by backend_stats().
+        :param operation: Function called with the collector of a backend
+        :param with_index: Call the operation with the index of the backend and its collector
+        :param on_error: Function called with the index of a backend on which the operation is skipped or fails
+        (before its next operation runs), None for none
+        """
+        first = None
+        for index, collector in self._active_collectors(with_index=True):
+            # Slot of the backend
+            if not self._slots[index].acquire(timeout=self._flush_timeout):
+                self._errors[index] = Exception(
+                    "Error: {} operations pending, operation skipped".format(self._max_pending_operations)
+                )
+                if on_error is not None:
+                    on_error(index)
+                # end if
+                continue
+            # end if
+
+            # Queue the operation
+            if with_index:
+                future = self._executors[index].submit(operation, index, collector)
+            else:
+                future = self._executors[index].submit(operation, collector)
+            # end if
+            with self._operations_lock:
+                self._operations[index].add(future)
+            # end with
+            future.add_done_callback(functools.partial(self._operation_done, index, on_error))
+            first = future if first is None else first
+        # end for
+
+        # Reads go to the first backend
+        if first is not None:
+            wait([first])
+        # end if
+    # end _run_operation
+
+    # Operation done
+    def _operation_done(self, index, on_error, future):
+        """
+        Release the slot of an operation done on a backend, and keep its error
+        :param index: Backend index
+        :param on_error: Function called with the backend index if the operation failed, None for none
+        :param future: Future of the operation
+        """
+        with self._operations_lock:
+            self._operations[index].discard(future)
+        # end with
+        self._slots[index].release()
+        if future.exception() is not None:
+            self._errors[index] = future.exception()
+            if on_error is not None:
+                on_error(index)
+            # end if
+        # end if
+    # end _operation_done
+
+    # Mark an artifact incomplete on a backend
+    def _artifact_incomplete(self, artifact_id, index):
+        """
+        Mark an artifact incomplete on a backend (a chunk write skipped or failed)
+        :param artifact_id: Artifact ID
+        :param index: Backend index
+        """
+        with self._operations_lock:
+            self._incomplete_artifacts.setdefault(artifact_id, set()).add(index)
+        # end with
+    # end _artifact_incomplete
+
+    # Forget an artifact on a backend
+    def _artifact_done(self, artifact_id, index):
+        """
+        Forget an artifact on a backend once its information is written or its chunks deleted
+        :param artifact_id: Artifact ID
+        :param index: Backend index
+        :return: True if the artifact was incomplete on the backend
+        """
+        with self._operations_lock:
+            indexes = self._incomplete_artifacts.get(artifact_id)
+            if indexes is None or index not in indexes:
+                return False
+            # end if
+            indexes.discard(index)
+            if not indexes:
+                del self._incomplete_artifacts[artifact_id]
+            # end if
+            return True
+        # end with
+    # end _artifact_done
+
+    # Write records to the backends
+    def _put_records(self, records):
+        """
+        Queue the records in every backend
+        :param records: List of records
+        """
+        if not self._opened:
+            raise Exception("Error: fan-out collector is not opened")
+        # end if
+        for index, collector in self._active_collectors(with_index=True):
+            try:
+                collector._put_records(records)
+            except Exception as e:
+                self._errors[index] = e
+            # end try
+        # end for
+    # end _put_records
+
+    # Flush the backends
+    def _flush_records(self):
+        """
+        Wait for the queue and the operations of every backend to be written and flushed,
+        at most flush_timeout seconds in total
+        """
+        deadline = None if self._flush_timeout is None else time.monotonic() + self._flush_timeout
+        for index, collector in self._active_collectors(with_index=True):
+            # Pending operations
+            with self._operations_lock:
+                operations = list(self._operations[index])
+            # end with
+            wait(operations, timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+            # Queued records
+            collector.writer.flush(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        # end for
+    # end _flush_records
+
+    # Read metric buckets
+    def _read_buckets(self, experiment_name, metric):
+        """
+        Read the buckets of a metric series from the first backend
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: List of bucket records
+        """
+        return self._primary()._read_buckets(experiment_name, metric)
+    # end _read_buckets
+
+    # Write an artifact chunk
+    def _write_artifact_chunk(self, artifact_id, index, data):
+        """
+        Write a compressed artifact chunk to every backend, compressed once for all of them. The artifact is
+        marked incomplete on backends where the write is skipped or fails.
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :param data: Compressed bytes
+        """
+        if not self._opened:
+            raise Exception("Error: fan-out collector is not opened")
+        # end if
+        self._run_operation(
+            lambda collector: collector._write_artifact_chunk(artifact_id, index, data),
+            on_error=functools.partial(self._artifact_incomplete, artifact_id)
+        )
+    # end _write_artifact_chunk
+
+    # Write artifact information
+    def _write_artifact(self, info):
+        """
+        Write the information of an artifact to every backend, except the ones where it is incomplete
+        (its chunks are deleted there instead and the error reported by backend_stats())
+        :param info: Artifact information
+        """
+        artifact_id = info['_id']
+
+        # Information, after the chunk writes queued on the backend
+        def write_artifact(index, collector):
+            if self._artifact_done(artifact_id, index):
+                collector._delete_artifact_chunks(artifact_id)
+                raise Exception("Error: chunks of artifact {} missing, artifact not written".format(artifact_id))
+            # end if
+            collector._write_artifact(dict(info))
+        # end write_artifact
+
+        self._run_operation(
+            write_artifact,
+            with_index=True,
+            on_error=functools.partial(self._artifact_done, artifact_id)
+        )
+    # end _write_artifact
+
+    # Read an artifact chunk
+    def _read_artifact_chunk(self, artifact_id, index):
+        """
+        Read a compressed artifact chunk from the first backend
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :return: Compressed bytes
+        """
+        return self._primary()._read_artifact_chunk(artifact_id, index)
+    # end _read_artifact_chunk
+
+    # Delete artifact chunks
+    def _delete_artifact_chunks(self, artifact_id):
+        """
+        Delete the chunks of an artifact in every backend (failed upload)
+        :param artifact_id: Artifact ID
+        """
+        # Chunks, after the chunk writes queued on the backend
+        def delete_chunks(index, collector):
+            self._artifact_done(artifact_id, index)
+            collector._delete_artifact_chunks(artifact_id)
+        # end delete_chunks
+
+        self._run_operation(
+            delete_chunks,
+            with_index=True,
+            on_error=functools.partial(self._artifact_done, artifact_id)
+        )
+    # end _delete_artifact_chunks
+
+    # endregion PRIVATE
+
+    # region STATIC
+
+    # Create a fan-out collector from a repository configuration
+    @classmethod
+    def from_repository(cls, repository, **kwargs):
+        """
+        Create a fan-out collector writing to all the collectors of a repository
+        :param repository: Repository object
+        :param kwargs: Options of FanOutCollector
+        :return: FanOutCollector object
+        """
+        return cls(
+            [collector_factory.get_collector_from_config(config) for config in repository.repo_collectors],
+            **kwargs
+        )
+    # end from_repository
+
+    # endregion STATIC
+
+# end FanOutCollector
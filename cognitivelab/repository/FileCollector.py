@@ -0,0 +1,782 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : FileCollector.py
+# Description : Experiment data collector to local append-only segment files
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 20.10.2026 17:20:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import os
+import re
+import time
+import shutil
+import datetime
+import threading
+from bson import json_util
+from .Collector import Collector
+from .Experiment import Experiment
+from .CollectorFactory import collector_factory
+
+
+# Experiment data collector to local append-only segment files
+class FileCollector(Collector):
+    """
+    Experiment data collector to local files, without any server. Records are appended to JSONL
+    segment files rotated when they reach segment_size bytes. Each flush writes the records of an
+    experiment as one contiguous extent, and the extents are appended to an index file so that the
+    records of an experiment are read without scanning the other experiments. The information of the
+    experiments is appended to an experiments file, the last line of an experiment is its current state.
+    Connection strings are file://<directory>, relative to the repository, file:// is the data directory.
+    """
+
+    # Default directory
+    DEFAULT_DIRECTORY = "data"
+
+    # Index file
+    INDEX_FILE = "index.jsonl"
+
+    # Experiments file
+    EXPERIMENTS_FILE = "experiments.jsonl"
+
+    # Sync watermarks file
+    SYNC_FILE = "sync.json"
+
+    # Artifacts index file, directory of the chunks of each artifact and chunk files
+    ARTIFACTS_FILE = "artifacts.jsonl"
+    ARTIFACTS_DIRECTORY = "artifacts"
+    ARTIFACT_CHUNK_FILE = "chunk-{:06d}.bin"
+
+    # Segment files
+    SEGMENT_FILE = "segment-{:06d}.jsonl"
+    SEGMENT_PATTERN = re.compile(r"^segment-(\d{6})\.jsonl$")
+
+    # Constructor
+    def __init__(self, connection_string, segment_size=64 * 1024 * 1024, buffer_size=1000, buffer_delay=1.0,
+                 fsync=False):
+        """
+        Constructor
+        :param connection_string: file://<directory>
+        :param segment_size: Size in bytes which triggers the rotation of the segment file
+        :param buffer_size: Number of buffered records which triggers a flush
+        :param buffer_delay: Age in seconds of the oldest buffered record which triggers a flush
+        :param fsync: Sync segment and index files to disk at each flush
+        """
+        # Super
+        super(FileCollector, self).__init__("file", connection_string)
+
+        # Parse information
+        connection_string_schema = self.get_connection_infos(connection_string)
+
+        # Not a file URL
+        if connection_string_schema.scheme != "file":
+            raise Exception("Not a file:// connection string: {}".format(connection_string))
+        # end if
+
+        # Properties
+        self._directory = os.path.join(connection_string_schema.netloc, connection_string_schema.path.lstrip('/')) \
+            if connection_string_schema.netloc else connection_string_schema.path
+        self._directory = self._directory if self._directory else self.DEFAULT_DIRECTORY
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._opened = False
+
+        # Current segment
+        self._segment_index = 0
+        self._segment_file = None
+        self._index_file = None
+
+        # Extents of each experiment, experiment name -> list of (segment, offset, length, insert date)
+        self._extents = dict()
+        self._lock = threading.Lock()
+
+        # Information of the experiments, experiment name -> dictionary
+        self._experiments = dict()
+
+        # IDs of the records of experiments, loaded by upsert_records, experiment name -> set of IDs
+        self._known_ids = dict()
+
+        # Last version of the artifacts, experiment name -> artifact name -> information
+        self._artifacts = dict()
+
+        # Write buffer
+        self._buffer_size = buffer_size
+        self._buffer_delay = buffer_delay
+        self._buffer = list()
+        self._buffer_time = None
+    # end __init__
+
+    # region PROPERTIES
+
+    # Directory
+    @property
+    def directory(self):
+        """
+        Get directory
+        :return: Directory of the segment and index files
+        """
+        return self._directory
+    # end directory
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Open the collector
+    def open(self):
+        """
+        Open the collector
+        """
+        # Already opened
+        if self._opened:
+            return
+        # end if
+
+        # Create directory
+        os.makedirs(self._directory, exist_ok=True)
+
+        # Load index
+        self._extents = dict()
+        index_path = os.path.join(self._directory, self.INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as f:
+                for line in f:
+                    # Skip a line cut by a crash
+                    try:
+                        extent = json_util.loads(line)
+                    except ValueError:
+                        continue
+                    # end try
+                    self._extents.setdefault(extent['experiment'], list()).append(
+                        (extent['segment'], extent['offset'], extent['length'], extent.get('date'))
+                    )
+
+                    # Last write
+                    if extent.get('date') is not None and (self.collector_last_write_date is None or
+                                                           extent['date'] > self.collector_last_write_date):
+                        self.collector_last_write_date = extent['date']
+                    # end if
+                # end for
+            # end with
+        # end if
+        self._known_ids = dict()
+
+        # Load experiments, the last line of an experiment is its current state
+        self._experiments = dict()
+        experiments_path = os.path.join(self._directory, self.EXPERIMENTS_FILE)
+        if os.path.exists(experiments_path):
+            with open(experiments_path, 'r') as f:
+                for line in f:
+                    # Skip a line cut by a crash
+                    try:
+                        info = json_util.loads(line)
+                    except ValueError:
+                        continue
+                    # end try
+                    self._experiments[info['name']] = info
+
+                    # Last write
+                    if info.get('update_date') is not None and (self.collector_last_write_date is None or
+                                                                info['update_date'] > self.collector_last_write_date):
+                        self.collector_last_write_date = info['update_date']
+                    # end if
+                # end for
+            # end with
+        # end if
+
+        # Load artifacts index, the last line of an artifact is its last version
+        self._artifacts = dict()
+        artifacts_path = os.path.join(self._directory, self.ARTIFACTS_FILE)
+        if os.path.exists(artifacts_path):
+            with open(artifacts_path, 'r') as f:
+                for line in f:
+                    # Skip a line cut by a crash
+                    try:
+                        info = json_util.loads(line)
+                    except ValueError:
+                        continue
+                    # end try
+                    self._artifacts.setdefault(info['experiment'], dict())[info['name']] = info
+                # end for
+            # end with
+        # end if
+
+        # Append to the last segment
+        segments = [int(m.group(1)) for m in map(self.SEGMENT_PATTERN.match, os.listdir(self._directory)) if m]
+        self._segment_index = max(segments) if segments else 0
+        self._segment_file = open(self._segment_path(self._segment_index), 'ab')
+        self._index_file = open(index_path, 'a')
+
+        # Opened
+        self._opened = True
+    # end open
+
+    # Close the collector
+    def close(self):
+        """
+        Close the collector
+        """
+        # Not opened
+        if not self._opened:
+            return
+        # end if
+
+        # Drain asynchronous writes and write what is left
+        self.disable_async_writes()
+        self.flush()
+
+        # Close files
+        self._segment_file.close()
+        self._index_file.close()
+        self._segment_file = None
+        self._index_file = None
+        self._opened = False
+    # end close
+
+    # Get collector status
+    def status(self):
+        """
+        Get collector status
+        :return: Collector status as an Integer
+        """
+        if self._opened:
+            return Collector.COLLECTOT_INITIALIZED
+        else:
+            return Collector.COLLECTOR_NOT_INITIALIZED
+        # end if
+    # end status
+
+    # Get experiment
+    def get_experiment(self, experiment_name):
+        """
+        Get an experiment from the collector
+        :param experiment_name: Experiment name
+        :return: Experiment object, None if not found
+        """
+        status = self.experiment_status(experiment_name)
+        if status == Collector.EXPERIMENT_NOT_FOUND:
+            return None
+        # end if
+        return Experiment(self, experiment_name, status)
+    # end get_experiment
+
+    # Get experiment information
+    def experiment_info(self, experiment_name):
+        """
+        Get the information of an experiment (name, lab, status, dates and other fields)
+        :param experiment_name: Experiment name
+        :return: Dictionary, None if not found
+        """
+        with self._lock:
+            info = self._experiments.get(experiment_name)
+            return None if info is None else dict(info)
+        # end with
+    # end experiment_info
+
+    # Create or update an experiment
+    def update_experiment(self, experiment_name, lab=None, status=None, **fields):
+        """
+        Create or update an experiment
+        :param experiment_name: Experiment name
+        :param lab: Lab of the experiment, None to keep the current one
+        :param status: Status of the experiment, None to keep the current one (created for a new experiment)
+        :param fields: Other fields to set
+        """
+        now = datetime.datetime.now()
+        with self._lock:
+            info = dict(self._experiments.get(experiment_name) or {
+                'name': experiment_name,
+                'lab': None,
+                'status': Collector.EXPERIMENT_CREATED,
+                'creation_date': now
+            })
+            info.update(fields, update_date=now)
+            if lab is not None:
+                info['lab'] = lab
+            # end if
+            if status is not None:
+                info['status'] = status
+            # end if
+            self._append_experiments([info])
+        # end with
+        self._touch_experiments([experiment_name])
+        self.collector_last_write_date = now
+    # end update_experiment
+
+    # What is the status of an experiment?
+    def experiment_status(self, experiment_name):
+        """
+        What is the status of an experiment?
+        :param experiment_name: Experiment name
+        :return: Status as an integer
+        """
+        with self._lock:
+            info = self._experiments.get(experiment_name)
+            return Collector.EXPERIMENT_NOT_FOUND if info is None else info['status']
+        # end with
+    # end experiment_status
+
+    # Status of many experiments
+    def experiment_statuses(self, lab=None, status=None):
+        """
+        Status of the experiments of a lab
+        :param lab: Lab name, None for all the experiments
+        :param status: Only experiments with this status, None for all
+        :return: Dictionary of experiment name to status
+        """
+        with self._lock:
+            return {
+                name: info['status'] for name, info in self._experiments.items()
+                if (lab is None or info.get('lab') == lab) and (status is None or info['status'] == status)
+            }
+        # end with
+    # end experiment_statuses
+
+    # List experiments
+    def experiments(self):
+        """
+        List experiments with records in the collector
+        :return: List of experiment names
+        """
+        with self._lock:
+            return list(self._extents.keys())
+        # end with
+    # end experiments
+
+    # Query records
+    def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment, buffered records are flushed first
+        :param experiment_name: Experiment name
+        :param query: Fields values the records must match as a dictionary, None for all the records
+        :param projection: Fields to return (list), None for all the fields
+        :return: List of records
+        """
+        # Records, without metric buckets
+        records = list()
+        for record in self._read_experiment(experiment_name):
+            if self.METRIC_FIELD in record:
+                continue
+            # end if
+            if query and any(record.get(key) != value for key, value in query.items()):
+                continue
+            # end if
+            if projection is not None:
+                record = {key: record[key] for key in projection if key in record}
+            # end if
+            records.append(record)
+        # end for
+
+        return records
+    # end query
+
+    # Iterate over records
+    def iter_records(self, since=None, experiment_name=None):
+        """
+        Iterate over the records and metric buckets of all the experiments, extents older than since are not read
+        :param since: Only records stored after this datetime (insert date), None for all the records
+        :param experiment_name: Only the records of this experiment, None for all the experiments
+        :return: Iterator of records
+        """
+        experiment_names = self.experiments() if experiment_name is None else [experiment_name]
+        for experiment_name in experiment_names:
+            for record in self._read_experiment(experiment_name, since):
+                yield record
+            # end for
+        # end for
+    # end iter_records
+
+    # Iterate over experiments
+    def iter_experiments(self, since=None):
+        """
+        Iterate over the information of the experiments
+        :param since: Only experiments updated after this datetime, None for all the experiments
+        :return: Iterator of dictionaries
+        """
+        with self._lock:
+            experiments = [
+                dict(info) for info in self._experiments.values()
+                if since is None or (info.get('update_date') is not None and info['update_date'] > since)
+            ]
+        # end with
+        return iter(experiments)
+    # end iter_experiments
+
+    # Insert or replace records
+    def upsert_records(self, records):
+        """
+        Insert records (from another collector), records with an ID already in the experiment are skipped
+        :param records: List of records
+        """
+        # Write buffered records
+        self.flush()
+
+        # Skip known records
+        new_records = list()
+        for record in records:
+            experiment_name = record['experiment']
+            if experiment_name not in self._known_ids:
+                self._known_ids[experiment_name] = {r['_id'] for r in self._read_experiment(experiment_name)}
+            # end if
+            if record['_id'] not in self._known_ids[experiment_name]:
+                self._known_ids[experiment_name].add(record['_id'])
+                new_records.append(record)
+            # end if
+        # end for
+
+        # Write
+        if new_records:
+            super(FileCollector, self).upsert_records(new_records)
+        # end if
+    # end upsert_records
+
+    # Insert or replace experiments
+    def upsert_experiments(self, experiments):
+        """
+        Insert experiments (from another collector), or replace the ones with the same name
+        :param experiments: List of experiment information dictionaries
+        """
+        if experiments:
+            with self._lock:
+                self._append_experiments([dict(experiment) for experiment in experiments])
+            # end with
+            self._touch_experiments({experiment['name'] for experiment in experiments})
+        # end if
+    # end upsert_experiments
+
+    # Get a sync watermark
+    def sync_watermark(self, source):
+        """
+        Get the date of the last record received from a source collector by sync
+        :param source: Source collector identifier
+        :return: Datetime, None if never synced
+        """
+        return self._load_sync().get(source)
+    # end sync_watermark
+
+    # Set a sync watermark
+    def set_sync_watermark(self, source, watermark):
+        """
+        Set the date of the last record received from a source collector by sync
+        :param source: Source collector identifier
+        :param watermark: Datetime
+        """
+        watermarks = self._load_sync()
+        watermarks[source] = watermark
+        sync_path = os.path.join(self._directory, self.SYNC_FILE)
+        with open(sync_path + ".tmp", 'w') as f:
+            f.write(json_util.dumps(watermarks))
+        # end with
+        os.replace(sync_path + ".tmp", sync_path)
+    # end set_sync_watermark
+
+    # Get artifact information
+    def artifact_info(self, experiment_name, artifact_name):
+        """
+        Get the information of the last version of an artifact
+        :param experiment_name: Experiment name
+        :param artifact_name: Artifact name
+        :return: Dictionary (ID, name, lengths, chunks, compression, metadata and date), None if not found
+        """
+        with self._lock:
+            return self._artifacts.get(experiment_name, dict()).get(artifact_name)
+        # end with
+    # end artifact_info
+
+    # List artifacts
+    def artifacts(self, experiment_name):
+        """
+        List the artifacts of an experiment (last version of each)
+        :param experiment_name: Experiment name
+        :return: List of artifact information dictionaries ordered by name
+        """
+        with self._lock:
+            artifacts = self._artifacts.get(experiment_name, dict())
+            return [artifacts[artifact_name] for artifact_name in sorted(artifacts)]
+        # end with
+    # end artifacts
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Append experiments
+    def _append_experiments(self, experiments):
+        """
+        Append the information of experiments to the experiments file (called with the lock held)
+        :param experiments: List of experiment information dictionaries
+        """
+        with open(os.path.join(self._directory, self.EXPERIMENTS_FILE), 'a') as f:
+            f.write("".join(json_util.dumps(info) + "\n" for info in experiments))
+            self._sync(f)
+        # end with
+        for info in experiments:
+            self._experiments[info['name']] = info
+        # end for
+    # end _append_experiments
+
+    # Load sync watermarks
+    def _load_sync(self):
+        """
+        Load sync watermarks
+        :return: Dictionary of source collector identifier to datetime
+        """
+        sync_path = os.path.join(self._directory, self.SYNC_FILE)
+        if not os.path.exists(sync_path):
+            return dict()
+        # end if
+        with open(sync_path, 'r') as f:
+            return json_util.loads(f.read())
+        # end with
+    # end _load_sync
+
+    # Read the records of an experiment
+    def _read_experiment(self, experiment_name, since=None):
+        """
+        Read the records and metric buckets of an experiment, buffered records are flushed first
+        :param experiment_name: Experiment name
+        :param since: Only records stored after this datetime (insert date), None for all the records
+        :return: Iterator of records
+        """
+        # Write buffered records
+        self.flush()
+
+        # Extents of the experiment
+        with self._lock:
+            extents = list(self._extents.get(experiment_name, list()))
+        # end with
+
+        # Read extents, skip the ones without newer records
+        for segment, offset, length, date in extents:
+            if since is not None and date is not None and date <= since:
+                continue
+            # end if
+            with open(self._segment_path(segment), 'rb') as f:
+                f.seek(offset)
+                data = f.read(length)
+            # end with
+            for line in data.splitlines():
+                record = json_util.loads(line)
+                if since is None or self.insert_date(record) > since:
+                    yield record
+                # end if
+            # end for
+        # end for
+    # end _read_experiment
+
+    # Read metric buckets
+    def _read_buckets(self, experiment_name, metric):
+        """
+        Read the buckets of a metric series
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: List of bucket records (steps and values as bytes), ordered by start step
+        """
+        buckets = [r for r in self._read_experiment(experiment_name) if r.get(self.METRIC_FIELD) == metric]
+        return sorted(buckets, key=lambda bucket: bucket['start_step'])
+    # end _read_buckets
+
+    # Segment path
+    def _segment_path(self, segment):
+        """
+        Path of a segment file
+        :param segment: Segment index
+        :return: Path
+        """
+        return os.path.join(self._directory, self.SEGMENT_FILE.format(segment))
+    # end _segment_path
+
+    # Write records to the buffer
+    def _write_records(self, records):
+        """
+        Write records to the buffer, flush when a size or time threshold is reached
+        :param records: List of records
+        """
+        # Buffer
+        if self._buffer_time is None:
+            self._buffer_time = time.monotonic()
+        # end if
+        self._buffer.extend(records)
+
+        # Thresholds
+        if len(self._buffer) >= self._buffer_size or time.monotonic() - self._buffer_time >= self._buffer_delay:
+            self._flush_records()
+        # end if
+    # end _write_records
+
+    # Flush buffered records
+    def _flush_records(self):
+        """
+        Append buffered records to the segment file, one extent per experiment, then index the extents
+        """
+        # Nothing to write
+        if not self._buffer:
+            return
+        # end if
+
+        # Check files
+        if not self._opened:
+            raise Exception("Error: file collector is not opened")
+        # end if
+
+        # Group records by experiment, stamped with their insert date
+        now = datetime.datetime.now()
+        experiments = dict()
+        for record in self._buffer:
+            experiments.setdefault(record['experiment'], list()).append(dict(record, **{self.INSERT_DATE_FIELD: now}))
+        # end for
+
+        # Write one extent per experiment
+        extents = list()
+        for experiment_name, records in experiments.items():
+            # Rotate segment
+            if self._segment_file.tell() >= self._segment_size:
+                self._segment_file.close()
+                self._segment_index += 1
+                self._segment_file = open(self._segment_path(self._segment_index), 'ab')
+            # end if
+
+            data = "".join(json_util.dumps(record) + "\n" for record in records).encode('utf-8')
+            extents.append((experiment_name, self._segment_index, self._segment_file.tell(), len(data), now))
+            self._segment_file.write(data)
+
+            # IDs of the experiment if loaded
+            if experiment_name in self._known_ids:
+                self._known_ids[experiment_name].update(record['_id'] for record in records)
+            # end if
+        # end for
+        self._sync(self._segment_file)
+
+        # Index extents once their records are written
+        for experiment_name, segment, offset, length, date in extents:
+            self._index_file.write(json_util.dumps({
+                'experiment': experiment_name,
+                'segment': segment,
+                'offset': offset,
+                'length': length,
+                'date': date
+            }) + "\n")
+        # end for
+        self._sync(self._index_file)
+
+        # Extents in memory
+        with self._lock:
+            for experiment_name, segment, offset, length, date in extents:
+                self._extents.setdefault(experiment_name, list()).append((segment, offset, length, date))
+            # end for
+        # end with
+
+        # Empty buffer
+        self._buffer = list()
+        self._buffer_time = None
+
+        # Last write
+        self.collector_last_write_date = now
+    # end _flush_records
+
+    # Artifact chunk path
+    def _artifact_chunk_path(self, artifact_id, index):
+        """
+        Path of an artifact chunk file
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :return: Path
+        """
+        return os.path.join(
+            self._directory,
+            self.ARTIFACTS_DIRECTORY,
+            artifact_id,
+            self.ARTIFACT_CHUNK_FILE.format(index)
+        )
+    # end _artifact_chunk_path
+
+    # Write an artifact chunk
+    def _write_artifact_chunk(self, artifact_id, index, data):
+        """
+        Write a compressed artifact chunk, one file per chunk (called from threads)
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :param data: Compressed bytes
+        """
+        chunk_path = self._artifact_chunk_path(artifact_id, index)
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        with open(chunk_path, 'wb') as f:
+            f.write(data)
+            self._sync(f)
+        # end with
+    # end _write_artifact_chunk
+
+    # Write artifact information
+    def _write_artifact(self, info):
+        """
+        Append the information of an artifact to the artifacts index once its chunks are written
+        :param info: Artifact information
+        """
+        with self._lock:
+            with open(os.path.join(self._directory, self.ARTIFACTS_FILE), 'a') as f:
+                f.write(json_util.dumps(info) + "\n")
+                self._sync(f)
+            # end with
+            self._artifacts.setdefault(info['experiment'], dict())[info['name']] = info
+        # end with
+    # end _write_artifact
+
+    # Read an artifact chunk
+    def _read_artifact_chunk(self, artifact_id, index):
+        """
+        Read a compressed artifact chunk (called from threads)
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :return: Compressed bytes
+        """
+        with open(self._artifact_chunk_path(artifact_id, index), 'rb') as f:
+            return f.read()
+        # end with
+    # end _read_artifact_chunk
+
+    # Delete artifact chunks
+    def _delete_artifact_chunks(self, artifact_id):
+        """
+        Delete the chunks of an artifact (failed upload)
+        :param artifact_id: Artifact ID
+        """
+        shutil.rmtree(os.path.join(self._directory, self.ARTIFACTS_DIRECTORY, artifact_id), ignore_errors=True)
+    # end _delete_artifact_chunks
+
+    # Write a file to disk
+    def _sync(self, file):
+        """
+        Flush a file, and sync it to disk if fsync is enabled
+        :param file: File object
+        """
+        file.flush()
+        if self._fsync:
+            os.fsync(file.fileno())
+        # end if
+    # end _sync
+
+    # endregion PRIVATE
+
+# end FileCollector
+
+# Register
+collector_factory.register_collector('file', FileCollector)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : MongoClientPool.py
+# Description : Process-wide registry of pooled MongoDB clients
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 20.10.2026 09:15:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import threading
+from pymongo import MongoClient
+
+
+# Process-wide registry of pooled MongoDB clients
+class MongoClientPool(object):
+    """
+    Process-wide registry of pooled MongoDB clients, one MongoClient per connection string
+    shared by all the collectors of the process. Clients are reference-counted and closed
+    when the last collector using them releases them.
+    """
+
+    # Constructor
+    def __init__(self):
+        """
+        Constructor
+        """
+        # Connection string -> [client, reference count]
+        self._clients = dict()
+        self._lock = threading.Lock()
+    # end __init__
+
+    # region PUBLIC
+
+    # Acquire a client
+    def acquire(self, connection_string, max_pool_size=100, min_pool_size=0, connect_timeout=None):
+        """
+        Acquire the client of a connection string, created and checked on first use.
+        Pool sizes and timeout are only used when the client is created.
+        :param connection_string: MongoDB connection string
+        :param max_pool_size: Maximum number of sockets of the client
+        :param min_pool_size: Minimum number of sockets of the client
+        :param connect_timeout: Server selection and connection timeout in seconds, None for pymongo's defaults
+        :return: MongoClient object
+        """
+        # Already created
+        with self._lock:
+            if connection_string in self._clients:
+                self._clients[connection_string][1] += 1
+                return self._clients[connection_string][0]
+            # end if
+        # end with
+
+        # New client, checked without the lock so that a slow server does not block the others
+        options = dict(maxPoolSize=max_pool_size, minPoolSize=min_pool_size)
+        if connect_timeout is not None:
+            options['serverSelectionTimeoutMS'] = int(connect_timeout * 1000)
+            options['connectTimeoutMS'] = int(connect_timeout * 1000)
+        # end if
+        client = MongoClient(connection_string, **options)
+
+        # The ismaster command is cheap and does not require auth.
+        try:
+            client.admin.command('ismaster')
+        except Exception:
+            client.close()
+            raise
+        # end try
+
+        # Register, unless created by another thread meanwhile
+        with self._lock:
+            if connection_string in self._clients:
+                client.close()
+                self._clients[connection_string][1] += 1
+                return self._clients[connection_string][0]
+            # end if
+            self._clients[connection_string] = [client, 1]
+            return client
+        # end with
+    # end acquire
+
+    # Release a client
+    def release(self, connection_string):
+        """
+        Release the client of a connection string, closed when no longer used
+        :param connection_string: MongoDB connection string
+        """
+        with self._lock:
+            # Not acquired
+            if connection_string not in self._clients:
+                return
+            # end if
+
+            # Close when last reference
+            self._clients[connection_string][1] -= 1
+            if self._clients[connection_string][1] <= 0:
+                client, _ = self._clients.pop(connection_string)
+                client.close()
+            # end if
+        # end with
+    # end release
+
+    # Number of references to a client
+    def references(self, connection_string):
+        """
+        Number of references to the client of a connection string
+        :param connection_string: MongoDB connection string
+        :return: Reference count (0 if no client)
+        """
+        with self._lock:
+            return self._clients[connection_string][1] if connection_string in self._clients else 0
+        # end with
+    # end references
+
+    # endregion PUBLIC
+
+# end MongoClientPool
+
+# Process-wide pool
+mongo_client_pool = MongoClientPool()
@@ -26,23 +26,68 @@
 
 
 # Imports
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+import os
+import time
+import hashlib
+import datetime
+import threading
+from pymongo import ASCENDING, DESCENDING, ReplaceOne
+from pymongo.errors import BulkWriteError, ConnectionFailure
 from .Collector import Collector
+from .Experiment import Experiment
+from .MongoClientPool import mongo_client_pool
+from .WriteAheadSpool import WriteAheadSpool
 from .CollectorFactory import collector_factory
 
 
 # Experiment data collector to MongoDB
 class MongoDBCollector(Collector):
     """
-    Experiment data collector to MongoDB
+    Experiment data collector to MongoDB. With a spool directory, records written while the server
+    is unreachable go to a local write-ahead spool, replayed by a background thread when the server is back.
     """
 
+    # Collection of experiment records
+    RECORDS_COLLECTION = "records"
+
+    # Collection of experiments
+    EXPERIMENTS_COLLECTION = "experiments"
+
+    # Collection of metric buckets
+    METRICS_COLLECTION = "metrics"
+
+    # Collection of sync watermarks
+    SYNC_COLLECTION = "sync"
+
+    # Collections of artifacts information and compressed artifact chunks
+    ARTIFACTS_COLLECTION = "artifacts"
+    ARTIFACT_CHUNKS_COLLECTION = "artifact_chunks"
+
+    # Index of experiment names and status (status of an experiment read from the index only)
+    EXPERIMENTS_NAME_STATUS_INDEX = [('name', ASCENDING), ('status', ASCENDING)]
+
+    # Duplicate key error code (record already written by an interrupted insert)
+    DUPLICATE_KEY_ERROR = 11000
+
+    # Default connection timeout in seconds with a spool (an unreachable server must not block writes)
+    SPOOL_CONNECT_TIMEOUT = 2.0
+
     # Constructor
-    def __init__(self, connection_string):
+    def __init__(self, connection_string, buffer_size=1000, buffer_bytes=8 * 1024 * 1024, buffer_delay=1.0,
+                 max_pool_size=100, min_pool_size=0, spool_directory=None, retry_interval=5.0, connect_timeout=None):
         """
         Constructor
         :param connection_string: Connection information to MongoDB
+        :param buffer_size: Number of buffered records which triggers a flush
+        :param buffer_bytes: Size in bytes (BSON) of buffered records which triggers a flush
+        :param buffer_delay: Age in seconds of the oldest buffered record which triggers a flush (by a timer
+        when no record is written meanwhile)
+        :param max_pool_size: Maximum number of sockets of the shared client
+        :param min_pool_size: Minimum number of sockets of the shared client
+        :param spool_directory: Directory of the write-ahead spool used when the server is unreachable, None to disable
+        :param retry_interval: Time in seconds between two attempts of the background thread to reach the server
+        :param connect_timeout: Server selection and connection timeout in seconds, None for SPOOL_CONNECT_TIMEOUT
+        with a spool and pymongo's defaults (30s) otherwise
         """
         # Super
         super(MongoDBCollector, self).__init__("mongodb", connection_string)
@@ -60,7 +105,36 @@ class MongoDBCollector(Collector):
         self._db_name = connection_string_schema.path[1:]
         self._client = None
         self._db = None
-        self._connected = False
+        self._opened = False
+        self._max_pool_size = max_pool_size
+        self._min_pool_size = min_pool_size
+        self._connect_timeout = connect_timeout
+        if connect_timeout is None and spool_directory is not None:
+            self._connect_timeout = self.SPOOL_CONNECT_TIMEOUT
+        # end if
+
+        # Write-ahead spool
+        self._spool = None
+        if spool_directory is not None:
+            self._spool = WriteAheadSpool(os.path.join(
+                spool_directory,
+                "mongodb-{}.wal".format(hashlib.sha1(connection_string.encode('utf-8')).hexdigest()[:16])
+            ))
+        # end if
+        self._retry_interval = retry_interval
+        self._reconnecting = False
+        self._reconnect_thread = None
+        self._closing = threading.Event()
+
+        # Write buffer
+        self._buffer_size = buffer_size
+        self._buffer_bytes = buffer_bytes
+        self._buffer_delay = buffer_delay
+        self._buffer = list()
+        self._buffered_bytes = 0
+        self._buffer_time = None
+        self._buffer_lock = threading.RLock()
+        self._flush_timer = None
     # end __init__
 
     # region PROPERTIES
@@ -106,6 +180,26 @@ class MongoDBCollector(Collector):
         self._db_name = value
     # end database
 
+    # Write-ahead spool
+    @property
+    def spool(self):
+        """
+        Get the write-ahead spool
+        :return: WriteAheadSpool object, None if disabled
+        """
+        return self._spool
+    # end spool
+
+    # Is the server reachable?
+    @property
+    def connected(self):
+        """
+        Is the server reachable? (False while records are spooled or replayed)
+        :return: True/False
+        """
+        return self._db is not None and not self._reconnecting and (self._spool is None or self._spool.pending == 0)
+    # end connected
+
     # endregion PROPERTIES
 
     # region PUBLIC
@@ -113,24 +207,30 @@ class MongoDBCollector(Collector):
     # Open the collector
     def open(self):
         """
-        Open the collector
+        Open the collector, with a spool an unreachable server does not raise, records are spooled and
+        a background thread tries to reach the server every retry_interval seconds
         """
-        # Connection to MongoDB
-        # self._client = MongoClient(self._host, self._port, connect=True)
-        self._client = MongoClient(self._connection_string)
-
-        # Get database
-        self._db = self._client[self._db_name]
+        # Already opened
+        if self._opened:
+            return
+        # end if
 
-        # The ismaster command is cheap and does not require auth.
+        # Connect and write spooled records
         try:
-            self._client.admin.command('ismaster')
+            self._connect()
+            self._replay()
         except ConnectionFailure as e:
-            raise Exception("Error: Cannot connect to the MongoDB server: {}".format(e))
+            if self._spool is None:
+                raise Exception("Error: Cannot connect to the MongoDB server: {}".format(e))
+            # end if
+            self._reconnecting = True
         # end try
 
-        # Connected
-        self._connected = True
+        # Opened
+        self._opened = True
+        if self._reconnecting:
+            self._start_reconnect()
+        # end if
     # end open
 
     # Close the collector
@@ -138,9 +238,29 @@ class MongoDBCollector(Collector):
         """
         Close the collector
         """
-        # Disconnect
-        self._client.close()
-        self._connected = False
+        # Not opened
+        if not self._opened:
+            return
+        # end if
+
+        # Stop reconnecting, drain asynchronous writes and write (or spool) what is left
+        self._closing.set()
+        if self._reconnect_thread is not None:
+            self._reconnect_thread.join()
+        # end if
+        self.disable_async_writes()
+        self.flush()
+
+        # Release the shared connection
+        if self._client is not None:
+            mongo_client_pool.release(self._connection_string)
+        # end if
+        self._client = None
+        self._db = None
+        self._reconnecting = False
+        self._reconnect_thread = None
+        self._closing.clear()
+        self._opened = False
     # end close
 
     # Get collector status
@@ -149,15 +269,673 @@ class MongoDBCollector(Collector):
         Get collector status
         :return: Collector status as an Integer
         """
-        if self._connected:
+        if self._opened:
             return Collector.COLLECTOT_INITIALIZED
         else:
             return Collector.COLLECTOR_NOT_INITIALIZED
         # end if
     # end status
 
+    # Query records
+    def query(self, experiment_name, query=None, projection=None):
+        """
+        Query the records of an experiment, buffered records are flushed first
+        :param experiment_name: Experiment name
+        :param query: Filter on the records as a dictionary, None for all the records
+        :param projection: Fields to return, None for all the fields
+        :return: List of records
+        """
+        # Write buffered records
+        self.flush()
+
+        # Check connection
+        self._check_connected()
+
+        return list(self._db[self.RECORDS_COLLECTION].find(dict(query or {}, experiment=experiment_name), projection))
+    # end query
+
+    # Get experiment
+    def get_experiment(self, experiment_name):
+        """
+        Get an experiment, its information and records are read when first used
+        :param experiment_name: Experiment name
+        :return: Experiment object, None if not found
+        """
+        status = self.experiment_status(experiment_name)
+        if status == Collector.EXPERIMENT_NOT_FOUND:
+            return None
+        # end if
+        return Experiment(self, experiment_name, status)
+    # end get_experiment
+
+    # Get experiment information
+    def experiment_info(self, experiment_name):
+        """
+        Get the information of an experiment (name, lab, status, dates and other fields)
+        :param experiment_name: Experiment name
+        :return: Dictionary, None if not found
+        """
+        self._check_connected()
+        return self._db[self.EXPERIMENTS_COLLECTION].find_one({'name': experiment_name}, {'_id': 0})
+    # end experiment_info
+
+    # Create or update an experiment
+    def update_experiment(self, experiment_name, lab=None, status=None, **fields):
+        """
+        Create or update an experiment
+        :param experiment_name: Experiment name
+        :param lab: Lab of the experiment, None to keep the current one
+        :param status: Status of the experiment, None to keep the current one (created for a new experiment)
+        :param fields: Other fields to set
+        """
+        # Check connection
+        self._check_connected()
+
+        # Fields to set, and to set on creation only
+        now = datetime.datetime.now()
+        set_fields = dict(fields, update_date=now)
+        insert_fields = {'creation_date': now}
+        for key, value, default in (('lab', lab, None), ('status', status, Collector.EXPERIMENT_CREATED)):
+            if value is not None:
+                set_fields[key] = value
+            else:
+                insert_fields[key] = default
+            # end if
+        # end for
+
+        # Upsert
+        self._db[self.EXPERIMENTS_COLLECTION].update_one(
+            {'name': experiment_name},
+            {'$set': set_fields, '$setOnInsert': insert_fields},
+            upsert=True
+        )
+        self._touch_experiments([experiment_name])
+        self.collector_last_write_date = now
+    # end update_experiment
+
+    # What is the status of an experiment?
+    def experiment_status(self, experiment_name):
+        """
+        What is the status of an experiment? (read from the name and status index only)
+        :param experiment_name: Experiment name
+        :return: Status as an integer
+        """
+        self._check_connected()
+        cursor = self._db[self.EXPERIMENTS_COLLECTION].find(
+            {'name': experiment_name},
+            {'_id': 0, 'status': 1}
+        ).hint(self.EXPERIMENTS_NAME_STATUS_INDEX).limit(1)
+        experiment = next(iter(cursor), None)
+        return Collector.EXPERIMENT_NOT_FOUND if experiment is None else experiment['status']
+    # end experiment_status
+
+    # Status of many experiments
+    def experiment_statuses(self, lab=None, status=None):
+        """
+        Status of the experiments of a lab (read from the indexes only)
+        :param lab: Lab name, None for all the experiments
+        :param status: Only experiments with this status, None for all
+        :return: Dictionary of experiment name to status
+        """
+        # Check connection
+        self._check_connected()
+
+        # Filter
+        query = dict()
+        if lab is not None:
+            query['lab'] = lab
+        # end if
+        if status is not None:
+            query['status'] = status
+        # end if
+
+        # Index scan, without filter the name and status index
+        cursor = self._db[self.EXPERIMENTS_COLLECTION].find(query, {'_id': 0, 'name': 1, 'status': 1})
+        if not query:
+            cursor = cursor.hint(self.EXPERIMENTS_NAME_STATUS_INDEX)
+        # end if
+
+        return {experiment['name']: experiment['status'] for experiment in cursor}
+    # end experiment_statuses
+
+    # Iterate over records
+    def iter_records(self, since=None, experiment_name=None):
+        """
+        Iterate over the records and metric buckets of all the experiments
+        :param since: Only records stored after this datetime (insert date, or date for records stored without
+        insert date), None for all the records
+        :param experiment_name: Only the records of this experiment, None for all the experiments
+        :return: Iterator of records
+        """
+        self._check_connected()
+        query = dict()
+        if since is not None:
+            query['$or'] = [
+                {self.INSERT_DATE_FIELD: {'$gt': since}},
+                {self.INSERT_DATE_FIELD: None, 'date': {'$gt': since}}
+            ]
+        # end if
+        if experiment_name is not None:
+            query['experiment'] = experiment_name
+        # end if
+        for collection in (self.RECORDS_COLLECTION, self.METRICS_COLLECTION):
+            cursor = self._db[collection].find(query).batch_size(self._buffer_size)
+            for record in cursor:
+                yield record
+            # end for
+        # end for
+    # end iter_records
+
+    # Iterate over experiments
+    def iter_experiments(self, since=None):
+        """
+        Iterate over the information of the experiments
+        :param since: Only experiments updated after this datetime, None for all the experiments
+        :return: Iterator of dictionaries
+        """
+        self._check_connected()
+        query = dict() if since is None else {'update_date': {'$gt': since}}
+        return iter(self._db[self.EXPERIMENTS_COLLECTION].find(query, {'_id': 0}).batch_size(self._buffer_size))
+    # end iter_experiments
+
+    # Insert or replace records
+    def upsert_records(self, records):
+        """
+        Insert records (from another collector), or replace the ones with the same ID, with unordered bulk writes
+        :param records: List of records
+        """
+        # Write buffered records
+        self.flush()
+        self._check_connected()
+
+        # Bulk upserts of records and metric buckets, stamped with their insert date here
+        now = datetime.datetime.now()
+        records = [dict(record, **{self.INSERT_DATE_FIELD: now}) for record in records]
+        for collection, documents in (
+            (self.RECORDS_COLLECTION, [r for r in records if self.METRIC_FIELD not in r]),
+            (self.METRICS_COLLECTION, [r for r in records if self.METRIC_FIELD in r])
+        ):
+            if documents:
+                self._db[collection].bulk_write(
+                    [ReplaceOne({'_id': document['_id']}, document, upsert=True) for document in documents],
+                    ordered=False
+                )
+            # end if
+        # end for
+        self._touch_experiments({record['experiment'] for record in records})
+        self.collector_last_write_date = datetime.datetime.now()
+    # end upsert_records
+
+    # Insert or replace experiments
+    def upsert_experiments(self, experiments):
+        """
+        Insert experiments (from another collector), or replace the ones with the same name
+        :param experiments: List of experiment information dictionaries
+        """
+        self._check_connected()
+        if experiments:
+            self._db[self.EXPERIMENTS_COLLECTION].bulk_write(
+                [ReplaceOne({'name': experiment['name']}, experiment, upsert=True) for experiment in experiments],
+                ordered=False
+            )
+            self._touch_experiments({experiment['name'] for experiment in experiments})
+        # end if
+    # end upsert_experiments
+
+    # Get a sync watermark
+    def sync_watermark(self, source):
+        """
+        Get the date of the last record received from a source collector by sync
+        :param source: Source collector identifier
+        :return: Datetime, None if never synced
+        """
+        self._check_connected()
+        sync = self._db[self.SYNC_COLLECTION].find_one({'_id': source})
+        return None if sync is None else sync['watermark']
+    # end sync_watermark
+
+    # Set a sync watermark
+    def set_sync_watermark(self, source, watermark):
+        """
+        Set the date of the last record received from a source collector by sync
+        :param source: Source collector identifier
+        :param watermark: Datetime
+        """
+        self._check_connected()
+        self._db[self.SYNC_COLLECTION].update_one(
+            {'_id': source},
+            {'$set': {'watermark': watermark, 'sync_date': datetime.datetime.now()}},
+            upsert=True
+        )
+    # end set_sync_watermark
+
+    # Get artifact information
+    def artifact_info(self, experiment_name, artifact_name):
+        """
+        Get the information of the last version of an artifact
+        :param experiment_name: Experiment name
+        :param artifact_name: Artifact name
+        :return: Dictionary (ID, name, lengths, chunks, compression, metadata and date), None if not found
+        """
+        self._check_connected()
+        return self._db[self.ARTIFACTS_COLLECTION].find_one(
+            {'experiment': experiment_name, 'name': artifact_name},
+            sort=[('date', DESCENDING)]
+        )
+    # end artifact_info
+
+    # List artifacts
+    def artifacts(self, experiment_name):
+        """
+        List the artifacts of an experiment (last version of each)
+        :param experiment_name: Experiment name
+        :return: List of artifact information dictionaries ordered by name
+        """
+        self._check_connected()
+        artifacts = list()
+        for info in self._db[self.ARTIFACTS_COLLECTION].find({'experiment': experiment_name}).sort(
+                [('name', ASCENDING), ('date', DESCENDING)]):
+            if not artifacts or artifacts[-1]['name'] != info['name']:
+                artifacts.append(info)
+            # end if
+        # end for
+        return artifacts
+    # end artifacts
+
+    # Backend stamp
+    def backend_stamp(self, experiment_name=None):
+        """
+        Modification stamp of an experiment read from the server, the newest insert dates of its records
+        and metric buckets and its update date (index-only reads)
+        :param experiment_name: Experiment name, None for the stamp of the last modification of any experiment
+        :return: Tuple of dates
+        """
+        self._check_connected()
+        return self._newest_dates(experiment_name)
+    # end backend_stamp
+
     # endregion PUBLIC
 
+    # region PRIVATE
+
+    # Newest dates
+    def _newest_dates(self, experiment_name=None):
+        """
+        Newest insert dates of the records and metric buckets and newest update date of the experiments,
+        read from the indexes
+        :param experiment_name: Only this experiment, None for all the experiments
+        :return: Tuple of dates (None for an empty collection)
+        """
+        query = dict() if experiment_name is None else {'experiment': experiment_name}
+        dates = list()
+        for collection, field in ((self.RECORDS_COLLECTION, self.INSERT_DATE_FIELD),
+                                  (self.METRICS_COLLECTION, self.INSERT_DATE_FIELD),
+                                  (self.EXPERIMENTS_COLLECTION, 'update_date')):
+            if collection == self.EXPERIMENTS_COLLECTION and experiment_name is not None:
+                query = {'name': experiment_name}
+                index = [('name', ASCENDING)]
+            elif experiment_name is not None:
+                index = [('experiment', ASCENDING), (field, ASCENDING)]
+            else:
+                index = [(field, ASCENDING)]
+            # end if
+            cursor = self._db[collection].find(query, {'_id': 0, field: 1}).hint(index)
+            newest = next(iter(cursor.sort(field, DESCENDING).limit(1)), None)
+            dates.append(None if newest is None else newest.get(field))
+        # end for
+        return tuple(dates)
+    # end _newest_dates
+
+    # Write records to the buffer
+    def _write_records(self, records):
+        """
+        Write records to the buffer, flush when a size, byte or time threshold is reached
+        :param records: List of records
+        """
+        with self._buffer_lock:
+            # Buffer, flushed by a timer after buffer_delay
+            if self._buffer_time is None:
+                self._buffer_time = time.monotonic()
+                self._flush_timer = threading.Timer(self._buffer_delay, self._idle_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            # end if
+            self._buffer.extend(records)
+            self._buffered_bytes += self._estimate_size(records)
+
+            # Thresholds
+            flush = len(self._buffer) >= self._buffer_size or self._buffered_bytes >= self._buffer_bytes or \
+                time.monotonic() - self._buffer_time >= self._buffer_delay
+        # end with
+
+        # Flush outside the lock
+        if flush:
+            self._flush_records()
+        # end if
+    # end _write_records
+
+    # Flush on timer
+    def _idle_flush(self):
+        """
+        Flush buffered records buffer_delay seconds after the first one, if no write or flush did it before.
+        Records which cannot be written stay buffered, and the next write or flush raises.
+        """
+        with self._buffer_lock:
+            self._flush_timer = None
+            if not self._opened or self._buffer_time is None:
+                return
+            # end if
+        # end with
+        try:
+            self._flush_records()
+        except Exception:
+            pass
+        # end try
+    # end _idle_flush
+
+    # Flush buffered records
+    def _flush_records(self):
+        """
+        Flush buffered records to MongoDB with a single unordered bulk insert, or to the spool while the
+        server is unreachable. The lock is held only to swap the buffer or append to the spool.
+        """
+        # Take the buffer, the timer is not needed anymore
+        with self._buffer_lock:
+            # Nothing to write
+            if not self._buffer:
+                return
+            # end if
+
+            # Check connection
+            if not self._opened:
+                raise Exception("Error: MongoDB collector is not opened")
+            # end if
+
+            # Swap the buffer
+            records, buffered_bytes, buffer_time = self._buffer, self._buffered_bytes, self._buffer_time
+            self._buffer = list()
+            self._buffered_bytes = 0
+            self._buffer_time = None
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            # end if
+
+            # Spool while the background thread tries to reach the server
+            if self._reconnecting:
+                self._spool.append(records)
+                return
+            # end if
+        # end with
+
+        # Insert, spool and reconnect in the background if the server is unreachable
+        try:
+            self._insert(records)
+            self.collector_last_write_date = datetime.datetime.now()
+        except ConnectionFailure:
+            with self._buffer_lock:
+                # No spool, records stay buffered
+                if self._spool is None:
+                    self._buffer[0:0] = records
+                    self._buffered_bytes += buffered_bytes
+                    if self._buffer_time is None or buffer_time < self._buffer_time:
+                        self._buffer_time = buffer_time
+                    # end if
+                    raise
+                # end if
+                self._spool.append(records)
+                self._start_reconnect()
+            # end with
+        # end try
+    # end _flush_records
+
+    # Start the reconnection thread
+    def _start_reconnect(self):
+        """
+        Spool the next flushes and start the background thread reaching the server, if not running
+        """
+        with self._buffer_lock:
+            self._reconnecting = True
+            if self._reconnect_thread is None:
+                self._reconnect_thread = threading.Thread(target=self._reconnect, name="MongoDBCollector-reconnect")
+                self._reconnect_thread.daemon = True
+                self._reconnect_thread.start()
+            # end if
+        # end with
+    # end _start_reconnect
+
+    # Reconnect and replay the spool
+    def _reconnect(self):
+        """
+        Try to reach the server every retry_interval seconds until the spool is replayed or the collector closed.
+        Flushes go to the server again once it is reachable, while spooled records are replayed.
+        """
+        while not self._closing.wait(self._retry_interval):
+            try:
+                # Probe
+                if self._client is None:
+                    self._connect()
+                else:
+                    self._client.admin.command('ping')
+                # end if
+
+                # Reachable, flushes insert again while the spool is replayed
+                with self._buffer_lock:
+                    self._reconnecting = False
+                # end with
+                self._replay()
+            except Exception:
+                with self._buffer_lock:
+                    self._reconnecting = True
+                # end with
+                continue
+            # end try
+
+            # Stop once everything is replayed and no flush failed meanwhile
+            with self._buffer_lock:
+                if not self._reconnecting and self._spool.pending == 0:
+                    self._reconnect_thread = None
+                    return
+                # end if
+            # end with
+        # end while
+    # end _reconnect
+
+    # Connect to the server
+    def _connect(self):
+        """
+        Acquire the shared connection to MongoDB (checked when created) if not done yet
+        """
+        if self._client is None:
+            self._client = mongo_client_pool.acquire(
+                self._connection_string,
+                max_pool_size=self._max_pool_size,
+                min_pool_size=self._min_pool_size,
+                connect_timeout=self._connect_timeout
+            )
+            self._db = self._client[self._db_name]
+            self._create_indexes()
+            self._load_last_write_date()
+        # end if
+    # end _connect
+
+    # Load the last write date
+    def _load_last_write_date(self):
+        """
+        Set the last write date to the insert date of the newest record or metric bucket, or the date of the
+        newest experiment update (from the indexes)
+        """
+        for date in self._newest_dates():
+            if date is not None and (self.collector_last_write_date is None or date > self.collector_last_write_date):
+                self.collector_last_write_date = date
+            # end if
+        # end for
+    # end _load_last_write_date
+
+    # Create indexes
+    def _create_indexes(self):
+        """
+        Create the indexes of the experiments and records collections (nothing done if they exist)
+        """
+        # Experiments, by name, lab, status and dates
+        experiments = self._db[self.EXPERIMENTS_COLLECTION]
+        experiments.create_index([('name', ASCENDING)], unique=True)
+        experiments.create_index(self.EXPERIMENTS_NAME_STATUS_INDEX)
+        experiments.create_index([('lab', ASCENDING), ('status', ASCENDING), ('name', ASCENDING)])
+        experiments.create_index([('status', ASCENDING), ('name', ASCENDING)])
+        experiments.create_index([('update_date', ASCENDING)])
+
+        # Records of an experiment in time order, records by insert date (sync) or date (sync of records
+        # stored without insert date), and newest insert date of an experiment (backend stamp)
+        self._db[self.RECORDS_COLLECTION].create_index([('experiment', ASCENDING), ('date', ASCENDING)])
+        self._db[self.RECORDS_COLLECTION].create_index([(self.INSERT_DATE_FIELD, ASCENDING)])
+        self._db[self.RECORDS_COLLECTION].create_index([('experiment', ASCENDING), (self.INSERT_DATE_FIELD, ASCENDING)])
+        self._db[self.RECORDS_COLLECTION].create_index([('date', ASCENDING)])
+
+        # Metric buckets of an experiment in step order, by insert date
+        self._db[self.METRICS_COLLECTION].create_index(
+            [('experiment', ASCENDING), (self.METRIC_FIELD, ASCENDING), ('start_step', ASCENDING)]
+        )
+        self._db[self.METRICS_COLLECTION].create_index([(self.INSERT_DATE_FIELD, ASCENDING)])
+        self._db[self.METRICS_COLLECTION].create_index([('experiment', ASCENDING), (self.INSERT_DATE_FIELD, ASCENDING)])
+        self._db[self.METRICS_COLLECTION].create_index([('date', ASCENDING)])
+
+        # Artifacts of an experiment by name and version, chunks of an artifact in order
+        self._db[self.ARTIFACTS_COLLECTION].create_index(
+            [('experiment', ASCENDING), ('name', ASCENDING), ('date', DESCENDING)]
+        )
+        self._db[self.ARTIFACT_CHUNKS_COLLECTION].create_index([('artifact', ASCENDING), ('n', ASCENDING)], unique=True)
+    # end _create_indexes
+
+    # Check connection
+    def _check_connected(self):
+        """
+        Raise an exception if the collector is not opened or the server unreachable
+        """
+        if not self._opened:
+            raise Exception("Error: MongoDB collector is not opened")
+        # end if
+        if not self.connected:
+            raise Exception("Error: MongoDB server is unreachable, {} records spooled".format(self._spool.pending))
+        # end if
+    # end _check_connected
+
+    # Replay spooled records
+    def _replay(self):
+        """
+        Write spooled records to MongoDB, including the ones spooled during the replay
+        """
+        if self._spool is not None:
+            while self._spool.pending > 0 and self._spool.replay(self._insert, batch_size=self._buffer_size) > 0:
+                pass
+            # end while
+        # end if
+    # end _replay
+
+    # Insert records
+    def _insert(self, records):
+        """
+        Unordered bulk inserts of records and metric buckets, records already written (duplicate IDs) are skipped.
+        Records are stamped with their insert date, replayed records with the date of the replay.
+        :param records: List of records
+        """
+        # Records and metric buckets
+        now = datetime.datetime.now()
+        records = [dict(record, **{self.INSERT_DATE_FIELD: now}) for record in records]
+        self._insert_many(self.RECORDS_COLLECTION, [r for r in records if self.METRIC_FIELD not in r])
+        self._insert_many(self.METRICS_COLLECTION, [r for r in records if self.METRIC_FIELD in r])
+    # end _insert
+
+    # Insert documents in a collection
+    def _insert_many(self, collection, documents):
+        """
+        Unordered bulk insert, documents already written (duplicate IDs) are skipped
+        :param collection: Collection name
+        :param documents: List of documents
+        """
+        # Nothing to insert
+        if not documents:
+            return
+        # end if
+
+        try:
+            self._db[collection].insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            if any(error['code'] != self.DUPLICATE_KEY_ERROR for error in e.details.get('writeErrors', [])) or \
+                    e.details.get('writeConcernErrors'):
+                raise
+            # end if
+        # end try
+    # end _insert_many
+
+    # Read metric buckets
+    def _read_buckets(self, experiment_name, metric):
+        """
+        Read the buckets of a metric series
+        :param experiment_name: Experiment name
+        :param metric: Metric name
+        :return: List of bucket records (steps and values as bytes), ordered by start step
+        """
+        self._check_connected()
+        return list(self._db[self.METRICS_COLLECTION].find(
+            {'experiment': experiment_name, self.METRIC_FIELD: metric},
+            {'_id': 0, 'steps': 1, 'values': 1}
+        ).sort('start_step', ASCENDING))
+    # end _read_buckets
+
+    # Write an artifact chunk
+    def _write_artifact_chunk(self, artifact_id, index, data):
+        """
+        Write a compressed artifact chunk, one document per chunk (called from threads, the client is shared)
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :param data: Compressed bytes
+        """
+        self._check_connected()
+        self._db[self.ARTIFACT_CHUNKS_COLLECTION].insert_one({'artifact': artifact_id, 'n': index, 'data': data})
+    # end _write_artifact_chunk
+
+    # Write artifact information
+    def _write_artifact(self, info):
+        """
+        Write the information of an artifact once its chunks are written
+        :param info: Artifact information
+        """
+        self._check_connected()
+        self._db[self.ARTIFACTS_COLLECTION].insert_one(info)
+    # end _write_artifact
+
+    # Read an artifact chunk
+    def _read_artifact_chunk(self, artifact_id, index):
+        """
+        Read a compressed artifact chunk (called from threads)
+        :param artifact_id: Artifact ID
+        :param index: Chunk index
+        :return: Compressed bytes
+        """
+        self._check_connected()
+        chunk = self._db[self.ARTIFACT_CHUNKS_COLLECTION].find_one(
+            {'artifact': artifact_id, 'n': index},
+            {'_id': 0, 'data': 1}
+        )
+        if chunk is None:
+            raise Exception("Error: chunk {} of artifact {} not found".format(index, artifact_id))
+        # end if
+        return chunk['data']
+    # end _read_artifact_chunk
+
+    # Delete artifact chunks
+    def _delete_artifact_chunks(self, artifact_id):
+        """
+        Delete the chunks of an artifact (failed upload)
+        :param artifact_id: Artifact ID
+        """
+        self._check_connected()
+        self._db[self.ARTIFACT_CHUNKS_COLLECTION].delete_many({'artifact': artifact_id})
+    # end _delete_artifact_chunks
+
+    # endregion PRIVATE
+
 # end MongoDBCollector
 
 # Register
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : QueryCache.py
+# Description : LRU cache of query results with a memory budget
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 21.10.2026 16:00:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import sys
+import time
+import threading
+import collections
+import numpy as np
+
+
+# LRU cache of query results with a memory budget
+class QueryCache(object):
+    """
+    LRU cache of query results with a memory budget. Each entry has a stamp, an entry is
+    returned only if the stamp given when reading it is the one it was stored with, and
+    the least recently used entries are evicted when the budget is exceeded.
+    """
+
+    # Constructor
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=None):
+        """
+        Constructor
+        :param max_bytes: Memory budget in bytes (estimated size of the cached values)
+        :param ttl: Maximum age in seconds of an entry, None for no limit
+        """
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        # Key -> (stamp, value, size, time)
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+    # end __init__
+
+    # region PROPERTIES
+
+    # Cached bytes
+    @property
+    def bytes(self):
+        """
+        Estimated size of the cached values
+        :return: Size in bytes
+        """
+        return self._bytes
+    # end bytes
+
+    # Statistics
+    @property
+    def stats(self):
+        """
+        Statistics
+        :return: Dictionary with entries, bytes, hits and misses
+        """
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes, 'hits': self._hits, 'misses': self._misses}
+        # end with
+    # end stats
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Get a value
+    def get(self, key, stamp):
+        """
+        Get a value
+        :param key: Entry key
+        :param stamp: Current stamp of the entry
+        :return: True and the value if cached with this stamp, False and None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_stamp, value, size, entry_time = entry
+                if entry_stamp == stamp and (self._ttl is None or time.monotonic() - entry_time < self._ttl):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                # end if
+
+                # Outdated
+                del self._entries[key]
+                self._bytes -= size
+            # end if
+            self._misses += 1
+            return False, None
+        # end with
+    # end get
+
+    # Store a value
+    def put(self, key, stamp, value):
+        """
+        Store a value, not cached if larger than the budget
+        :param key: Entry key
+        :param stamp: Stamp of the value
+        :param value: Value
+        """
+        size = self.size_of(value)
+        with self._lock:
+            # Replace
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[2]
+            # end if
+
+            # Too large
+            if size > self._max_bytes:
+                return
+            # end if
+
+            # Store and evict least recently used entries
+            self._entries[key] = (stamp, value, size, time.monotonic())
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, _, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+            # end while
+        # end with
+    # end put
+
+    # Clear
+    def clear(self):
+        """
+        Remove all entries
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        # end with
+    # end clear
+
+    # endregion PUBLIC
+
+    # region STATIC
+
+    # Estimate the size of a value
+    @staticmethod
+    def size_of(value):
+        """
+        Estimate the size in memory of a value (arrays, containers and their items)
+        :param value: Value
+        :return: Size in bytes
+        """
+        if isinstance(value, np.ndarray):
+            return value.nbytes + sys.getsizeof(np.empty(0))
+        elif isinstance(value, dict):
+            return sys.getsizeof(value) + sum(
+                QueryCache.size_of(k) + QueryCache.size_of(v) for k, v in value.items()
+            )
+        elif isinstance(value, (list, tuple, set)):
+            return sys.getsizeof(value) + sum(QueryCache.size_of(v) for v in value)
+        # end if
+        return sys.getsizeof(value)
+    # end size_of
+
+    # endregion STATIC
+
+# end QueryCache
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : WriteAheadSpool.py
+# Description : Local write-ahead log of records waiting for an unreachable backend
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 21.10.2026 09:30:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import os
+import threading
+from bson import json_util
+
+
+# Local write-ahead log of records waiting for an unreachable backend
+class WriteAheadSpool(object):
+    """
+    Local write-ahead log of records waiting for an unreachable backend. Records are appended
+    as JSONL and replayed in batches when the backend is back, the file is removed once every
+    record is written. A replay moves the spool file aside first, records appended meanwhile go to
+    a new spool file replayed by the next call. A replay stopped by an error starts again from the
+    first record, so records need idempotent IDs.
+    """
+
+    # Suffix of the spool file being replayed
+    REPLAY_SUFFIX = ".replay"
+
+    # Constructor
+    def __init__(self, path, fsync=False):
+        """
+        Constructor
+        :param path: Path of the spool file (records left by a previous run are kept)
+        :param fsync: Sync the spool file to disk at each append
+        """
+        self._path = path
+        self._fsync = fsync
+        self._lock = threading.Lock()
+
+        # Records left by a previous run, in the spool file and a stopped replay
+        self._pending = 0
+        for spool_path in (path, path + self.REPLAY_SUFFIX):
+            if os.path.exists(spool_path):
+                self._pending += self._count_records(spool_path)
+            # end if
+        # end for
+    # end __init__
+
+    # region PROPERTIES
+
+    # Path
+    @property
+    def path(self):
+        """
+        Get path
+        :return: Path of the spool file
+        """
+        return self._path
+    # end path
+
+    # Number of spooled records
+    @property
+    def pending(self):
+        """
+        Number of spooled records
+        :return: Number of records
+        """
+        return self._pending
+    # end pending
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Append records
+    def append(self, records):
+        """
+        Append records to the spool
+        :param records: List of records
+        """
+        # Directory
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # end if
+
+        # Append
+        data = "".join(json_util.dumps(record) + "\n" for record in records).encode('utf-8')
+        with self._lock:
+            with open(self._path, 'ab') as f:
+                f.write(data)
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+                # end if
+            # end with
+            self._pending += len(records)
+        # end with
+    # end append
+
+    # Replay records
+    def replay(self, write_function, batch_size=1000):
+        """
+        Replay spooled records (the ones of a stopped replay, or the spool file moved aside), removed only if
+        every batch is written. Records appended meanwhile are kept for the next replay.
+        :param write_function: Function writing a list of records, raises on error
+        :param batch_size: Number of records per call to write_function
+        :return: Number of replayed records
+        """
+        # Move the spool file aside, unless a stopped replay is resumed
+        replay_path = self._path + self.REPLAY_SUFFIX
+        with self._lock:
+            if self._pending == 0:
+                return 0
+            # end if
+            if not os.path.exists(replay_path):
+                if not os.path.exists(self._path):
+                    return 0
+                # end if
+                os.replace(self._path, replay_path)
+            # end if
+        # end with
+
+        # Write batches
+        replayed = 0
+        lines = 0
+        with open(replay_path, 'rb') as f:
+            batch = list()
+            for line in f:
+                # Skip a line cut by a crash
+                if not line.strip():
+                    continue
+                # end if
+                lines += 1
+                try:
+                    batch.append(json_util.loads(line))
+                except ValueError:
+                    continue
+                # end try
+                if len(batch) >= batch_size:
+                    write_function(batch)
+                    replayed += len(batch)
+                    batch = list()
+                # end if
+            # end for
+            if batch:
+                write_function(batch)
+                replayed += len(batch)
+            # end if
+        # end with
+
+        # Remove the replayed records
+        with self._lock:
+            os.remove(replay_path)
+            self._pending = max(0, self._pending - lines)
+        # end with
+        return replayed
+    # end replay
+
+    # Remove spooled records
+    def clear(self):
+        """
+        Remove spooled records
+        """
+        with self._lock:
+            for spool_path in (self._path, self._path + self.REPLAY_SUFFIX):
+                if os.path.exists(spool_path):
+                    os.remove(spool_path)
+                # end if
+            # end for
+            self._pending = 0
+        # end with
+    # end clear
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Count records
+    @staticmethod
+    def _count_records(path):
+        """
+        Count the records of a spool file
+        :param path: Path of the spool file
+        :return: Number of non-empty lines
+        """
+        with open(path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+        # end with
+    # end _count_records
+
+    # endregion PRIVATE
+
+# end WriteAheadSpool
@@ -22,16 +22,51 @@
 #
 
 # Imports
+import importlib
 from .Config import Config
 from . import Repository
 from . import Collector
+from . import AsyncCollector
 from . import CollectorFactory
 from .CollectorFactory import collector_factory
 from . import Laboratory
-from . import MongoDBCollector
+from .Experiment import Experiment
+from .ArtifactCodec import ArtifactCodec
+from .ArtifactReader import ArtifactReader
+from .QueryCache import QueryCache
+from .CachedCollector import CachedCollector
+from .FanOutCollector import FanOutCollector
 from .RemoteDepot import RemoteDepot
 from . import schema
 
+# Collector modules, imported when first used (pymongo, motor)
+LAZY_MODULES = ['MongoDBCollector', 'AsyncMongoDBCollector', 'FileCollector', 'MongoClientPool']
+
+# Classes imported when first used (bson)
+LAZY_CLASSES = ['CollectorSync', 'ColumnarExport']
+
 # ALL
-__all__ = ['Config', 'RemoteDepot', 'Repository', 'Collector', 'CollectorFactory', 'MongoDBCollector',
-           'collector_factory', 'Laboratory', 'schema']
+__all__ = ['Config', 'RemoteDepot', 'Repository', 'Collector', 'AsyncCollector', 'CollectorFactory', 'MongoDBCollector',
+           'AsyncMongoDBCollector', 'FileCollector', 'Experiment', 'ArtifactCodec', 'ArtifactReader', 'QueryCache',
+           'CachedCollector', 'FanOutCollector', 'CollectorSync', 'ColumnarExport', 'collector_factory',
+           'mongo_client_pool', 'Laboratory', 'schema']
+
+
+# Import collector modules when first used
+def __getattr__(name):
+    """
+    Import collector modules and classes when first used
+    :param name: Attribute name
+    :return: Module, class, or the shared MongoDB client pool
+    """
+    if name in LAZY_MODULES:
+        return importlib.import_module("." + name, __name__)
+    elif name in LAZY_CLASSES:
+        # The class replaces the module set as attribute by the import
+        globals()[name] = getattr(importlib.import_module("." + name, __name__), name)
+        return globals()[name]
+    elif name == 'mongo_client_pool':
+        return importlib.import_module(".MongoClientPool", __name__).mongo_client_pool
+    # end if
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
+# end __getattr__
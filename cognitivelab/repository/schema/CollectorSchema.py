@@ -25,7 +25,7 @@
 #
 
 # Imports
-from marshmallow import Schema, fields, post_load, validate
+from marshmallow import Schema, fields, post_load, validate, validates
 from cognitivelab.repository.CollectorFactory import collector_factory
 from cognitivelab.repository.Collector import Collector
 
@@ -41,8 +41,7 @@ class CollectorSchema(Schema):
     # Collector type
     collector_type = fields.Str(
         required=True,
-        allow_none=False,
-        validate=validate.OneOf(collector_factory.collector_types())
+        allow_none=False
     )
 
     # Collector connection string
@@ -67,6 +66,17 @@ class CollectorSchema(Schema):
 
     # region PRIVATE
 
+    # Check the collector type
+    @validates('collector_type')
+    def _validate_collector_type(self, value, **kwargs):
+        """
+        Check the collector type is one of the declared types (read when validating, nothing is imported)
+        :param value: Collector type
+        :param kwargs:
+        """
+        validate.OneOf(collector_factory.collector_types())(value)
+    # end _validate_collector_type
+
     # Create Collector object
     @post_load
     def _create_collector(self, data, **kwargs):
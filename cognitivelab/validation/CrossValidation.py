@@ -24,36 +24,62 @@
 
 # Imports
 import math
-from torch.utils.data.dataset import Dataset
 import numpy as np
+from .ValidationBase import ValidationBase
+from .IndexRanges import IndexRanges
+from .FeistelPermutation import FeistelPermutation
+from .SharedArray import SharedArray
 
 
 # Do a k-fold cross validation with a dev set on a data set
-class CrossValidationWithDev(Dataset):
+class CrossValidationWithDev(ValidationBase):
     """
     Do K-fold cross validation with a dev set on a data set
     """
 
     # Constructor
     def __init__(self, root_dataset, k=10, mode='train', samples_indices=None, fold=0, train_size=1.0, dev_ratio=0.5,
-                 shuffle=False):
+                 shuffle=False, seed=None, permutation='array', fold_sizes=None):
         """
         Constructor
         :param root_dataset: The target data set
         :param k: Number of fold
         :param train: Return training or test set?
+        :param shuffle: Shuffle the samples before creating the folds
+        :param seed: Seed of the shuffle (None to use NumPy's global random state)
+        :param permutation: How to shuffle, 'array' shuffles a materialized index array, 'feistel' computes a
+        pseudo-random permutation on the fly (no index array, the train set follows the permutation order
+        instead of being sorted)
+        :param fold_sizes: Fold sizes if samples_indices is already ordered by fold (e.g. loaded fold plan),
+        None to divide the samples in k folds
         """
+        # Super
+        super(CrossValidationWithDev, self).__init__(root_dataset)
+
         # Properties
-        self.root_dataset = root_dataset
         self.k = k
         self.mode = mode
         self.train_size = train_size
         self.fold = fold
         self.dev_ratio = dev_ratio
         self.shuffle = shuffle
+        self.seed = seed
+        self.permutation = permutation
 
         # Compute fold sizes
-        self.folds, self.fold_sizes, self.indexes = self._create_folds(self.k, samples_indices)
+        if fold_sizes is None:
+            self.folds, self.fold_sizes, self.indexes = self._create_folds(self.k, samples_indices)
+        else:
+            self.indexes = np.asarray(samples_indices)
+            self.fold_sizes = list(fold_sizes)
+            self.folds = self._split_folds(self.indexes, self.fold_sizes)
+        # end if
+
+        # Cache of split indexes, (fold, mode, train_size, dev_ratio) -> indexes
+        self._splits = dict()
+
+        # Index arrays in shared memory?
+        self._shared = False
     # end __init__
 
     #region PUBLIC
@@ -89,6 +115,7 @@ class CrossValidationWithDev(Dataset):
         :return:
         """
         self.fold += 1
+        self._splits.clear()
     # end next_fold
 
     # Set fold
@@ -99,6 +126,7 @@ class CrossValidationWithDev(Dataset):
         :return:
         """
         self.fold = fold
+        self._splits.clear()
     # end set_fold
 
     # Set size
@@ -109,8 +137,34 @@ class CrossValidationWithDev(Dataset):
         :return:
         """
         self.train_size = size
+        self._splits.clear()
     # end set_size
 
+    # Move index arrays to shared memory
+    def share_memory(self):
+        """
+        Move the index arrays (indexes, folds and splits) to shared memory. Worker processes
+        (e.g. DataLoader workers) then receive read-only zero-copy views instead of their own copies.
+        Splits of the current fold are created now, so workers do not have to build them.
+        Range-encoded indexes do not hold arrays and are left as they are.
+        Requires Python 3.8 or later (multiprocessing.shared_memory).
+        """
+        # Copy indexes to shared memory, folds are views
+        if isinstance(self.indexes, np.ndarray):
+            self.indexes = self._to_shared(self.indexes)
+            self.folds = self._split_folds(self.indexes, self.fold_sizes)
+        # end if
+
+        # Shared from now on
+        self._shared = True
+        self._splits.clear()
+
+        # Create splits of the current fold
+        for mode in ('train', 'dev', 'test'):
+            self._split(mode)
+        # end for
+    # end share_memory
+
     #endregion PUBLIC
 
     #region PRIVATE
@@ -123,15 +177,25 @@ class CrossValidationWithDev(Dataset):
         """
         # Indexes
         if samples_indices is None:
-            # Indices
-            indexes = np.arange(0, len(self.root_dataset))
-
             # Shuffle index list
-            if self.shuffle:
-                np.random.shuffle(indexes)
+            if self.shuffle and self.permutation == 'feistel':
+                # Permutation computed on the fly, only depends on the seed
+                if self.seed is None:
+                    self.seed = int(np.random.randint(0, 2**31 - 1))
+                # end if
+                indexes = IndexRanges(
+                    [(0, len(self.root_dataset))],
+                    FeistelPermutation(len(self.root_dataset), self.seed)
+                )
+            elif self.shuffle:
+                indexes = np.arange(0, len(self.root_dataset))
+                self._random_state().shuffle(indexes)
+            else:
+                # Range-encoded, nothing materialized
+                indexes = IndexRanges([(0, len(self.root_dataset))])
             # end if
         else:
-            indexes = samples_indices
+            indexes = np.asarray(samples_indices)
         # end if
 
         # Dataset length
@@ -145,19 +209,193 @@ class CrossValidationWithDev(Dataset):
         # Folds size
         fold_sizes = [division+1] * (reste) + [division] * (reste_size)
 
+        return self._split_folds(indexes, fold_sizes), fold_sizes, indexes
+    # end _create_folds
+
+    # Random state used to shuffle
+    def _random_state(self):
+        """
+        Random state used to shuffle
+        :return: NumPy's global random state if no seed, a seeded RandomState otherwise
+        """
+        if self.seed is None:
+            return np.random
+        # end if
+        return np.random.RandomState(self.seed)
+    # end _random_state
+
+    # Split indexes into folds
+    def _split_folds(self, indexes, fold_sizes):
+        """
+        Split indexes into folds
+        :param indexes: Indexes
+        :param fold_sizes: Fold sizes
+        :return: List of folds (views of indexes)
+        """
         # Folds
         folds = list()
         start = 0
-        for i in range(k):
+        for i in range(len(fold_sizes)):
             folds.append(indexes[start:start+fold_sizes[i]])
             start += fold_sizes[i]
         # end for
 
-        return folds, fold_sizes, indexes
-    # end _create_folds
+        return folds
+    # end _split_folds
+
+    # Get the fold plan
+    def _get_plan(self):
+        """
+        Get the fold plan
+        :return: Dictionary of parameters, dictionary of index arrays
+        """
+        # Parameters
+        params = {
+            'length': len(self.root_dataset),
+            'k': self.k,
+            'mode': self.mode,
+            'fold': self.fold,
+            'train_size': self.train_size,
+            'dev_ratio': self.dev_ratio,
+            'shuffle': self.shuffle,
+            'seed': self.seed,
+            'permutation': self.permutation,
+            'range_encoded': isinstance(self.indexes, IndexRanges),
+            'fold_sizes': [int(size) for size in self.fold_sizes]
+        }
+
+        # Range-encoded indexes are recreated from the parameters
+        if isinstance(self.indexes, IndexRanges):
+            return params, dict()
+        # end if
+
+        return params, {'indexes': self.indexes}
+    # end _get_plan
+
+    # Get indexes of a split
+    def _split(self, mode=None):
+        """
+        Get indexes of a split of the current fold (cached until the fold or the size changes)
+        :param mode: Split (train, dev or test), None for the current mode
+        :return: Indexes in the root dataset
+        """
+        # Cache key
+        mode = self.mode if mode is None else mode
+        key = (self.fold, mode, self.train_size, self.dev_ratio)
+
+        # Create the split if not cached
+        if key not in self._splits:
+            split = self._create_split(self.fold, mode)
+
+            # New arrays go to shared memory (folds are already views)
+            if self._shared and isinstance(split, np.ndarray):
+                split = self._to_shared(split)
+            # end if
+
+            self._splits[key] = split
+        # end if
+
+        return self._splits[key]
+    # end _split
+
+    # Copy an array to shared memory
+    def _to_shared(self, array):
+        """
+        Copy an array to shared memory, if not already there
+        :param array: Array
+        :return: SharedArray object
+        """
+        if isinstance(array, SharedArray) and array.shared:
+            return array
+        # end if
+        return SharedArray(array)
+    # end _to_shared
+
+    # Create split
+    def _create_split(self, fold, mode):
+        """
+        Create the indexes of a split
+        :param fold: Fold used as dev/test set
+        :param mode: Split to create (train, dev or test)
+        :return: Indexes in the root dataset
+        """
+        # Dev/test set
+        dev_test_set = self.folds[fold]
+
+        # Train set
+        if mode == 'train':
+            if isinstance(self.indexes, IndexRanges):
+                # Range-encoded, the train set is what is left around the fold
+                fold_start = sum(self.fold_sizes[:fold])
+                train_set = self.indexes.exclude(fold_start, fold_start + len(dev_test_set))
+            else:
+                train_set = np.setdiff1d(self.indexes, dev_test_set)
+            # end if
+            train_length = len(self.root_dataset) - len(dev_test_set)
+            train_length = int(train_length * self.train_size)
+            return train_set[:train_length]
+        # end if
+
+        # Dev/test length
+        dev_length = int(len(dev_test_set) * self.dev_ratio)
+
+        # Dev/test sets
+        if mode == 'dev':
+            return dev_test_set[:dev_length]
+        else:
+            return dev_test_set[dev_length:]
+        # end if
+    # end _create_split
 
     #endregion PRIVATE
 
+    #region STATIC
+
+    # Create the validation instance from a fold plan
+    @classmethod
+    def _from_plan(cls, root_dataset, params, arrays):
+        """
+        Create the validation instance from a fold plan
+        :param root_dataset: Base dataset to validate
+        :param params: Dictionary of parameters
+        :param arrays: Dictionary of index arrays
+        :return: CrossValidationWithDev object
+        """
+        # Check dataset
+        cls._check_plan(root_dataset, params)
+
+        # Range-encoded indexes are recreated from the parameters
+        if params['range_encoded']:
+            return cls(
+                root_dataset,
+                k=params['k'],
+                mode=params['mode'],
+                fold=params['fold'],
+                train_size=params['train_size'],
+                dev_ratio=params['dev_ratio'],
+                shuffle=params['shuffle'],
+                seed=params['seed'],
+                permutation=params['permutation']
+            )
+        # end if
+
+        return cls(
+            root_dataset,
+            k=params['k'],
+            mode=params['mode'],
+            samples_indices=arrays['indexes'],
+            fold=params['fold'],
+            train_size=params['train_size'],
+            dev_ratio=params['dev_ratio'],
+            shuffle=params['shuffle'],
+            seed=params['seed'],
+            permutation=params['permutation'],
+            fold_sizes=params['fold_sizes']
+        )
+    # end _from_plan
+
+    #endregion STATIC
+
     #region OVERRIDE
 
     # Dataset size
@@ -181,38 +419,6 @@ class CrossValidationWithDev(Dataset):
         # end if
     # end __len__
 
-    # Get item
-    def __getitem__(self, item):
-        """
-        Get item
-        :param item:
-        :return:
-        """
-        # Get target set
-        dev_test_set = self.folds[self.fold]
-        indexes_copy = self.indexes.copy()
-        train_set = np.setdiff1d(indexes_copy, dev_test_set)
-        train_length = len(self.root_dataset) - len(dev_test_set)
-        train_length = int(train_length * self.train_size)
-        train_set = train_set[:train_length]
-
-        # Dev/test length
-        dev_length = int(len(dev_test_set) * self.dev_ratio)
-
-        # Dev/test sets
-        dev_set = dev_test_set[:dev_length]
-        test_set = dev_test_set[dev_length:]
-
-        # Train/test
-        if self.mode == 'train':
-            return self.root_dataset[train_set[item]]
-        elif self.mode == 'dev':
-            return self.root_dataset[dev_set[item]]
-        else:
-            return self.root_dataset[test_set[item]]
-        # end if
-    # end __getitem__
-
     #endregion OVERRIDE
 
 # end CrossValidationWithDev
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : FeistelPermutation.py
+# Description : Seedable pseudo-random permutation computed on the fly
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 18.10.2026 11:05:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+import numbers
+import numpy as np
+
+
+# Pseudo-random permutation of [0, N) with a Feistel network
+class FeistelPermutation(object):
+    """
+    Pseudo-random permutation of [0, N) computed on the fly with a balanced Feistel network
+    and cycle walking. Nothing is materialized, the permutation only depends on the length
+    and the seed, so it is the same in every process.
+    """
+
+    # Mixing constants (splitmix64 finalizer)
+    _MIX_SHIFTS = (np.uint64(30), np.uint64(27), np.uint64(31))
+    _MIX_MULTIPLIERS = (np.uint64(0xbf58476d1ce4e5b9), np.uint64(0x94d049bb133111eb))
+
+    # Constructor
+    def __init__(self, length, seed, rounds=6):
+        """
+        Constructor
+        :param length: Size N of the permuted domain
+        :param seed: Seed of the permutation (integer)
+        :param rounds: Number of Feistel rounds
+        """
+        # Properties
+        self._length = int(length)
+        self._seed = seed
+        self._rounds = rounds
+
+        # The network permutes [0, 4^half_bits), the smallest such domain containing [0, N)
+        self._half_bits = np.uint64(max(1, (max(self._length - 1, 1).bit_length() + 1) // 2))
+        self._mask = np.uint64((1 << int(self._half_bits)) - 1)
+
+        # Round keys
+        self._keys = np.random.SeedSequence(seed).generate_state(rounds, dtype=np.uint64)
+    # end __init__
+
+    # region PROPERTIES
+
+    # Seed
+    @property
+    def seed(self):
+        """
+        Seed
+        :return: Seed of the permutation
+        """
+        return self._seed
+    # end seed
+
+    # endregion PROPERTIES
+
+    # region PRIVATE
+
+    # Mix bits
+    def _mix(self, z):
+        """
+        Mix bits of 64-bit integers
+        :param z: Array of uint64
+        :return: Array of uint64
+        """
+        z = (z ^ (z >> self._MIX_SHIFTS[0])) * self._MIX_MULTIPLIERS[0]
+        z = (z ^ (z >> self._MIX_SHIFTS[1])) * self._MIX_MULTIPLIERS[1]
+        return z ^ (z >> self._MIX_SHIFTS[2])
+    # end _mix
+
+    # Encrypt values with the Feistel network
+    def _encrypt(self, values):
+        """
+        Encrypt values with the Feistel network
+        :param values: Array of uint64 in [0, 4^half_bits)
+        :return: Array of uint64 in [0, 4^half_bits)
+        """
+        # Split in two halves
+        left = values >> self._half_bits
+        right = values & self._mask
+
+        # Rounds
+        for key in self._keys:
+            left, right = right, left ^ (self._mix(right ^ key) & self._mask)
+        # end for
+
+        return (left << self._half_bits) | right
+    # end _encrypt
+
+    # Permute positions
+    def _permute(self, positions):
+        """
+        Permute positions
+        :param positions: Array of positions in [0, N)
+        :return: Array of permuted positions in [0, N)
+        """
+        # Check bounds
+        if positions.size > 0 and (positions.min() < 0 or positions.max() >= self._length):
+            raise IndexError("index out of range for permutation of length {}".format(self._length))
+        # end if
+
+        # First pass
+        values = self._encrypt(positions.astype(np.uint64))
+
+        # Cycle walking until back in [0, N)
+        outside = np.flatnonzero(values >= self._length)
+        while outside.size > 0:
+            values[outside] = self._encrypt(values[outside])
+            outside = outside[values[outside] >= self._length]
+        # end while
+
+        return values.astype(np.int64)
+    # end _permute
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Length
+    def __len__(self):
+        """
+        Length
+        :return: Size of the permuted domain
+        """
+        return self._length
+    # end __len__
+
+    # Get item
+    def __getitem__(self, item):
+        """
+        Get item
+        :param item: Position or array of positions
+        :return: Permuted position(s)
+        """
+        # Single position
+        if isinstance(item, numbers.Integral):
+            return int(self._permute(np.array([item], dtype=np.int64))[0])
+        # end if
+
+        return self._permute(np.asarray(item, dtype=np.int64))
+    # end __getitem__
+
+    # To string
+    def __repr__(self):
+        """
+        To string
+        """
+        return "FeistelPermutation(length={}, seed={})".format(self._length, self._seed)
+    # end __repr__
+
+    # endregion OVERRIDE
+
+# end FeistelPermutation
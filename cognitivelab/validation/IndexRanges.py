@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : IndexRanges.py
+# Description : Sequence of indexes encoded as a list of ranges
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 18.10.2026 10:12:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+import numbers
+import numpy as np
+
+
+# Sequence of indexes encoded as a list of ranges
+class IndexRanges(object):
+    """
+    Sequence of indexes encoded as a list of contiguous ranges [start, stop).
+    Behave like a read-only 1-D index array but only stores the range bounds, positions
+    are mapped to indexes with a binary search over the ranges. If a permutation is given,
+    the ranges are positions in the permutation and the indexes are the permuted values.
+    """
+
+    # Constructor
+    def __init__(self, ranges, permutation=None):
+        """
+        Constructor
+        :param ranges: List of (start, stop) tuples
+        :param permutation: Permutation applied to the ranges (e.g. FeistelPermutation), or None
+        """
+        # Properties
+        self._permutation = permutation
+
+        # Remove empty ranges
+        ranges = [(int(start), int(stop)) for start, stop in ranges if stop > start]
+
+        # Range starts and position of each range in the sequence
+        self._starts = np.array([start for start, _ in ranges], dtype=np.int64)
+        self._offsets = np.zeros(len(ranges) + 1, dtype=np.int64)
+        self._offsets[1:] = np.cumsum([stop - start for start, stop in ranges], dtype=np.int64)
+    # end __init__
+
+    # region PROPERTIES
+
+    # Ranges
+    @property
+    def ranges(self):
+        """
+        Ranges (before permutation)
+        :return: List of (start, stop) tuples
+        """
+        return [
+            (int(start), int(start + self._offsets[r + 1] - self._offsets[r]))
+            for r, start in enumerate(self._starts)
+        ]
+    # end ranges
+
+    # Permutation
+    @property
+    def permutation(self):
+        """
+        Permutation
+        :return: Permutation applied to the ranges, or None
+        """
+        return self._permutation
+    # end permutation
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Exclude positions
+    def exclude(self, start, stop):
+        """
+        Sequence without the positions in [start, stop)
+        :param start: First position to exclude
+        :param stop: Position after the last one to exclude
+        :return: IndexRanges object
+        """
+        return IndexRanges(self[:start].ranges + self[stop:].ranges, self._permutation)
+    # end exclude
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Map positions to indexes
+    def _take(self, positions):
+        """
+        Map positions to indexes
+        :param positions: Array of positions
+        :return: Array of indexes
+        """
+        # Negative positions
+        length = len(self)
+        positions = np.where(positions < 0, positions + length, positions)
+
+        # Check bounds
+        if positions.size > 0 and (positions.min() < 0 or positions.max() >= length):
+            raise IndexError("index out of range for sequence of length {}".format(length))
+        # end if
+
+        # Range containing each position
+        r = np.searchsorted(self._offsets, positions, side='right') - 1
+        indexes = self._starts[r] + (positions - self._offsets[r])
+
+        # Permute
+        if self._permutation is not None:
+            return self._permutation[indexes]
+        # end if
+
+        return indexes
+    # end _take
+
+    # Slice the sequence
+    def _slice(self, item):
+        """
+        Slice the sequence
+        :param item: Slice object
+        :return: IndexRanges object, or array of indexes if the step is not 1
+        """
+        # Positions
+        start, stop, step = item.indices(len(self))
+
+        # Not contiguous
+        if step != 1:
+            return self._take(np.arange(start, stop, step, dtype=np.int64))
+        # end if
+
+        # Clip each range to [start, stop)
+        ranges = list()
+        for r, range_start in enumerate(self._starts):
+            first = max(start, self._offsets[r])
+            last = min(stop, self._offsets[r + 1])
+            if last > first:
+                ranges.append((range_start + first - self._offsets[r], range_start + last - self._offsets[r]))
+            # end if
+        # end for
+
+        return IndexRanges(ranges, self._permutation)
+    # end _slice
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Length
+    def __len__(self):
+        """
+        Length
+        :return: Number of indexes
+        """
+        return int(self._offsets[-1])
+    # end __len__
+
+    # Get item
+    def __getitem__(self, item):
+        """
+        Get item
+        :param item: Position, slice or array of positions
+        :return: Index, IndexRanges object for slices, or array of indexes
+        """
+        # Slice
+        if isinstance(item, slice):
+            return self._slice(item)
+        # end if
+
+        # Single position
+        if isinstance(item, numbers.Integral):
+            return int(self._take(np.array([item], dtype=np.int64))[0])
+        # end if
+
+        return self._take(np.asarray(item, dtype=np.int64))
+    # end __getitem__
+
+    # Iterate
+    def __iter__(self):
+        """
+        Iterate over indexes
+        """
+        # Not permuted
+        if self._permutation is None:
+            for start, stop in self.ranges:
+                yield from range(start, stop)
+            # end for
+            return
+        # end if
+
+        # Permute by chunks
+        for start in range(0, len(self), 65536):
+            yield from self._take(np.arange(start, min(start + 65536, len(self)), dtype=np.int64)).tolist()
+        # end for
+    # end __iter__
+
+    # To array
+    def __array__(self, dtype=None, copy=None):
+        """
+        Materialize the indexes as a NumPy array
+        :param dtype: Data type
+        :param copy: Ignored, a new array is always created
+        :return: Array of indexes
+        """
+        indexes = np.concatenate(
+            [np.arange(start, stop, dtype=np.int64) for start, stop in self.ranges] + [np.zeros(0, dtype=np.int64)]
+        )
+
+        # Permute
+        if self._permutation is not None:
+            indexes = self._permutation[indexes]
+        # end if
+
+        return indexes if dtype is None else indexes.astype(dtype)
+    # end __array__
+
+    # To string
+    def __repr__(self):
+        """
+        To string
+        """
+        if self._permutation is not None:
+            return "IndexRanges({}, {})".format(self.ranges, self._permutation)
+        # end if
+        return "IndexRanges({})".format(self.ranges)
+    # end __repr__
+
+    # endregion OVERRIDE
+
+# end IndexRanges
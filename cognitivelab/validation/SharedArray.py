@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : SharedArray.py
+# Description : Read-only NumPy array in shared memory, pickled by reference
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 18.10.2026 14:20:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+import os
+import sys
+import weakref
+import numpy as np
+
+
+# Shared memory blocks attached in this process (name -> _SharedBlock)
+_attached_blocks = weakref.WeakValueDictionary()
+
+
+# Import shared memory support
+def _shared_memory():
+    """
+    Import multiprocessing.shared_memory (Python 3.8+) when first used
+    :return: shared_memory module
+    """
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        raise Exception("Error: shared arrays require Python 3.8 or later (multiprocessing.shared_memory)")
+    # end try
+    return shared_memory
+# end _shared_memory
+
+
+# A shared memory block, unlinked when the creating process drops it
+class _SharedBlock(object):
+    """
+    A shared memory block, unlinked when the creating process drops it
+    """
+
+    # Constructor
+    def __init__(self, shm, owner):
+        """
+        Constructor
+        :param shm: SharedMemory object
+        :param owner: Did this process create the block?
+        """
+        self.shm = shm
+        self.owner_pid = os.getpid() if owner else None
+        self.address = np.frombuffer(shm.buf, dtype=np.uint8).__array_interface__['data'][0]
+    # end __init__
+
+    # Destructor
+    def __del__(self):
+        """
+        Destructor
+        """
+        try:
+            self.shm.close()
+            if self.owner_pid == os.getpid():
+                self.shm.unlink()
+            # end if
+        except Exception:
+            pass
+        # end try
+    # end __del__
+
+# end _SharedBlock
+
+
+# Read-only NumPy array in shared memory
+class SharedArray(np.ndarray):
+    """
+    Read-only NumPy array whose buffer is a multiprocessing shared memory block.
+    The array and its views are pickled as a reference to the block, so a process
+    unpickling it (e.g. a spawned DataLoader worker) gets a zero-copy view of the
+    same memory. The block is unlinked when the creating process drops all its views.
+    """
+
+    # Create the array
+    def __new__(cls, array):
+        """
+        Create a shared array with a copy of an array
+        :param array: Array to copy in shared memory
+        """
+        # Copy in a new block
+        array = np.ascontiguousarray(array)
+        block = _SharedBlock(_shared_memory().SharedMemory(create=True, size=max(array.nbytes, 1)), owner=True)
+        obj = np.ndarray(array.shape, dtype=array.dtype, buffer=block.shm.buf).view(cls)
+        obj[...] = array
+
+        # Read-only
+        obj._block = block
+        obj.flags.writeable = False
+        return obj
+    # end __new__
+
+    # region PROPERTIES
+
+    # Is the data in shared memory?
+    @property
+    def shared(self):
+        """
+        Is the data in shared memory? (False for results of operations on shared arrays)
+        :return: True/False
+        """
+        return self._block_offset() is not None
+    # end shared
+
+    # endregion PROPERTIES
+
+    # region PRIVATE
+
+    # Block offset
+    def _block_offset(self):
+        """
+        Offset of the data in the shared memory block
+        :return: Offset in bytes, or None if the data is not in the block (e.g. result of an operation)
+        """
+        block = getattr(self, '_block', None)
+        if block is None:
+            return None
+        # end if
+
+        # Data must be inside the block
+        offset = self.__array_interface__['data'][0] - block.address
+        if offset < 0 or offset + self.nbytes > block.shm.size or any(s < 0 for s in self.strides):
+            return None
+        # end if
+
+        return offset
+    # end _block_offset
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Finalize a new array (view, slice)
+    def __array_finalize__(self, obj):
+        """
+        Finalize a new array (view, slice)
+        :param obj: Source array
+        """
+        self._block = getattr(obj, '_block', None)
+    # end __array_finalize__
+
+    # Pickle by reference
+    def __reduce__(self):
+        """
+        Pickle by reference to the shared memory block
+        """
+        # Not in shared memory, pickle as a normal array
+        offset = self._block_offset()
+        if offset is None:
+            return np.asarray(self).copy().__reduce__()
+        # end if
+
+        return _attach, (self._block.shm.name, offset, self.shape, self.dtype.str, self.strides)
+    # end __reduce__
+
+    # Pickle by reference (all protocols)
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle by reference (all protocols)
+        :param protocol: Pickle protocol
+        """
+        return self.__reduce__()
+    # end __reduce_ex__
+
+    # endregion OVERRIDE
+
+# end SharedArray
+
+
+# Attach to a shared array
+def _attach(name, offset, shape, dtype, strides):
+    """
+    Attach to a shared array (used when unpickling)
+    :param name: Shared memory block name
+    :param offset: Offset of the data in the block
+    :param shape: Array shape
+    :param dtype: Data type
+    :param strides: Array strides
+    :return: Read-only SharedArray view
+    """
+    # Attach to the block once per process
+    block = _attached_blocks.get(name)
+    if block is None:
+        if sys.version_info >= (3, 13):
+            shm = _shared_memory().SharedMemory(name=name, track=False)
+        else:
+            shm = _shared_memory().SharedMemory(name=name)
+        # end if
+        block = _SharedBlock(shm, owner=False)
+        _attached_blocks[name] = block
+    # end if
+
+    # View
+    view = np.ndarray(shape, dtype=dtype, buffer=block.shm.buf, offset=offset, strides=strides).view(SharedArray)
+    view._block = block
+    view.flags.writeable = False
+    return view
+# end _attach
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : StratifiedCrossValidation.py
+# Description : Stratified K-Fold cross validation
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 18.10.2026 16:40:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+import numpy as np
+from .CrossValidation import CrossValidationWithDev
+
+
+# Do a stratified k-fold cross validation with a dev set on a data set
+class StratifiedCrossValidationWithDev(CrossValidationWithDev):
+    """
+    Do stratified K-fold cross validation with a dev set on a data set.
+    Each class is spread evenly over the folds, and samples inside a fold are interleaved
+    by class so the dev/test split of the fold is stratified too.
+    """
+
+    # Constructor
+    def __init__(self, root_dataset, labels, k=10, mode='train', samples_indices=None, fold=0, train_size=1.0,
+                 dev_ratio=0.5, shuffle=False, seed=None, fold_sizes=None):
+        """
+        Constructor
+        :param root_dataset: The target data set
+        :param labels: Label of each sample of the root dataset (array-like)
+        :param k: Number of fold
+        :param shuffle: Shuffle the samples of each class before creating the folds
+        :param seed: Seed of the shuffle (None to use NumPy's global random state)
+        :param fold_sizes: Fold sizes if samples_indices is already ordered by fold (e.g. loaded fold plan)
+        """
+        # Labels
+        self.labels = np.asarray(labels)
+
+        # Super
+        super(StratifiedCrossValidationWithDev, self).__init__(
+            root_dataset,
+            k=k,
+            mode=mode,
+            samples_indices=samples_indices,
+            fold=fold,
+            train_size=train_size,
+            dev_ratio=dev_ratio,
+            shuffle=shuffle,
+            seed=seed,
+            fold_sizes=fold_sizes
+        )
+    # end __init__
+
+    #region PRIVATE
+
+    # Create folds
+    def _create_folds(self, k, samples_indices=None):
+        """
+        Create stratified folds
+        :return: Folds, fold sizes, indexes ordered by fold
+        """
+        # Indexes
+        if samples_indices is None:
+            indexes = np.arange(0, len(self.root_dataset))
+
+            # Shuffle index list
+            if self.shuffle:
+                self._random_state().shuffle(indexes)
+            # end if
+        else:
+            indexes = np.asarray(samples_indices)
+        # end if
+
+        # Class of each sample and class sizes
+        _, classes = np.unique(self.labels[indexes], return_inverse=True)
+        classes = classes.reshape(-1)
+        class_sizes = np.bincount(classes)
+        class_starts = np.cumsum(class_sizes) - class_sizes
+
+        # Rank of each sample inside its class
+        ranks = np.empty(len(indexes), dtype=np.int64)
+        ranks[np.argsort(classes, kind='stable')] = np.arange(len(indexes)) - np.repeat(class_starts, class_sizes)
+
+        # Deal samples sorted by class to the folds, fold sizes are the same as with unstratified folds
+        sample_folds = (class_starts[classes] + ranks) % k
+        fold_sizes = np.bincount(sample_folds, minlength=k).tolist()
+
+        # Order by fold, then by relative position in the class to interleave classes
+        order = np.lexsort((classes, ranks / class_sizes[classes], sample_folds))
+        indexes = indexes[order]
+
+        return self._split_folds(indexes, fold_sizes), fold_sizes, indexes
+    # end _create_folds
+
+    # Create split
+    def _create_split(self, fold, mode):
+        """
+        Create the indexes of a split, the train set is the other folds one after the other
+        so that a reduced train size stays stratified
+        :param fold: Fold used as dev/test set
+        :param mode: Split to create (train, dev or test)
+        :return: Indexes in the root dataset
+        """
+        # Train set
+        if mode == 'train':
+            train_set = np.concatenate([self.folds[i] for i in range(len(self.folds)) if i != fold])
+            train_length = len(self.root_dataset) - len(self.folds[fold])
+            train_length = int(train_length * self.train_size)
+            return train_set[:train_length]
+        # end if
+
+        return super(StratifiedCrossValidationWithDev, self)._create_split(fold, mode)
+    # end _create_split
+
+    # Get the fold plan
+    def _get_plan(self):
+        """
+        Get the fold plan
+        :return: Dictionary of parameters, dictionary of index arrays
+        """
+        params, arrays = super(StratifiedCrossValidationWithDev, self)._get_plan()
+        arrays['labels'], params['labels'] = self._encode_plan_values(self.labels)
+        return params, arrays
+    # end _get_plan
+
+    #endregion PRIVATE
+
+    #region STATIC
+
+    # Create the validation instance from a fold plan
+    @classmethod
+    def _from_plan(cls, root_dataset, params, arrays):
+        """
+        Create the validation instance from a fold plan
+        :param root_dataset: Base dataset to validate
+        :param params: Dictionary of parameters
+        :param arrays: Dictionary of index arrays
+        :return: StratifiedCrossValidationWithDev object
+        """
+        # Check dataset
+        cls._check_plan(root_dataset, params)
+
+        return cls(
+            root_dataset,
+            cls._decode_plan_values(arrays['labels'], params.get('labels')),
+            k=params['k'],
+            mode=params['mode'],
+            samples_indices=arrays['indexes'],
+            fold=params['fold'],
+            train_size=params['train_size'],
+            dev_ratio=params['dev_ratio'],
+            shuffle=params['shuffle'],
+            seed=params['seed'],
+            fold_sizes=params['fold_sizes']
+        )
+    # end _from_plan
+
+    #endregion STATIC
+
+# end StratifiedCrossValidationWithDev
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : StreamingCrossValidation.py
+# Description : K-Fold cross validation on streamed data sets
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 19.10.2026 09:30:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+import hashlib
+from torch.utils.data.dataset import IterableDataset
+from .ValidationBase import ValidationBase
+
+
+# Do a k-fold cross validation with a dev set on a streamed data set
+class StreamingCrossValidationWithDev(ValidationBase, IterableDataset):
+    """
+    Do K-fold cross validation with a dev set on a streamed data set (iterable, no length or random access).
+    Each sample is assigned to a fold by a stable hash of its key, and to the dev or the test set inside
+    its fold by a second part of the hash. The stream is filtered in a single pass with constant memory,
+    so split sizes follow k, dev_ratio and train_size in expectation only. Sharding the stream between
+    DataLoader workers is left to the root dataset.
+    """
+
+    # Constructor
+    def __init__(self, root_dataset, key=None, k=10, mode='train', fold=0, train_size=1.0, dev_ratio=0.5, seed=0):
+        """
+        Constructor
+        :param root_dataset: The target data set (iterable)
+        :param key: Function returning the key of a sample, None to use the position of the sample in the stream
+        :param k: Number of fold
+        :param mode: Split to iterate (train, dev or test)
+        :param fold: Fold used as dev/test set
+        :param train_size: Fraction of the train set to keep
+        :param dev_ratio: Fraction of the dev/test fold used as dev set
+        :param seed: Seed of the hash, different seeds give different folds
+        """
+        # Super
+        super(StreamingCrossValidationWithDev, self).__init__(root_dataset)
+
+        # Properties
+        self.key = key
+        self.k = k
+        self.mode = mode
+        self.fold = fold
+        self.train_size = train_size
+        self.dev_ratio = dev_ratio
+        self.seed = seed
+    # end __init__
+
+    #region PUBLIC
+
+    # Set in train mode
+    def train(self):
+        """
+        Set in train mode
+        """
+        self.mode = 'train'
+    # end train
+
+    # Set in dev mode
+    def dev(self):
+        """
+        Set in dev mode
+        """
+        self.mode = 'dev'
+    # end dev
+
+    # Set in test mode
+    def test(self):
+        """
+        Set in test mode
+        """
+        self.mode = 'test'
+    # end test
+
+    # Next fold
+    def next_fold(self):
+        """
+        Next fold
+        """
+        self.fold += 1
+    # end next_fold
+
+    # Set fold
+    def set_fold(self, fold):
+        """
+        Set fold
+        :param fold: Fold used as dev/test set
+        """
+        self.fold = fold
+    # end set_fold
+
+    # Set size
+    def set_size(self, size):
+        """
+        Set size
+        :param size: Fraction of the train set to keep
+        """
+        self.train_size = size
+    # end set_size
+
+    # Get the split of a key
+    def split_of(self, key):
+        """
+        Get the split of a sample key for the current fold
+        :param key: Sample key
+        :return: 'train', 'dev', 'test' or None if the sample is not in the reduced train set
+        """
+        # Sample fold and position in [0, 1)
+        sample_fold, position = self._hash(key)
+
+        # Dev/test fold
+        if sample_fold == self.fold:
+            return 'dev' if position < self.dev_ratio else 'test'
+        # end if
+
+        # Train set
+        return 'train' if position < self.train_size else None
+    # end split_of
+
+    #endregion PUBLIC
+
+    #region PRIVATE
+
+    # Hash a key
+    def _hash(self, key):
+        """
+        Hash a sample key, the hash is stable across processes and runs
+        :param key: Sample key
+        :return: Fold of the sample, position of the sample in [0, 1)
+        """
+        # 64 bits digest
+        digest = hashlib.blake2b(
+            str(key).encode('utf-8'),
+            digest_size=8,
+            key=str(self.seed).encode('utf-8')
+        ).digest()
+
+        # Fold from the first half, position from the second half
+        return int.from_bytes(digest[:4], 'little') % self.k, int.from_bytes(digest[4:], 'little') / 2**32
+    # end _hash
+
+    #endregion PRIVATE
+
+    #region OVERRIDE
+
+    # Iterate
+    def __iter__(self):
+        """
+        Iterate over the samples of the current split
+        """
+        for position, sample in enumerate(self.root_dataset):
+            key = position if self.key is None else self.key(sample)
+            if self.split_of(key) == self.mode:
+                yield sample
+            # end if
+        # end for
+    # end __iter__
+
+    #endregion OVERRIDE
+
+# end StreamingCrossValidationWithDev
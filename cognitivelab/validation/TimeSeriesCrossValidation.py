@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : TimeSeriesCrossValidation.py
+# Description : Rolling-origin cross validation for sequential data
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 19.10.2026 11:10:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Imports
+from .ValidationBase import ValidationBase
+from .IndexRanges import IndexRanges
+
+
+# Do a rolling-origin cross validation with a dev set on sequential data
+class TimeSeriesCrossValidationWithDev(ValidationBase):
+    """
+    Do rolling-origin cross validation with a dev set on sequential data.
+    The last k blocks of test_size samples are the dev/test windows of the k folds, the train
+    window ends gap samples before the dev/test window. With an expanding window the train set
+    starts at the first sample, with a sliding window it keeps a fixed length and moves with the
+    dev/test window. Windows are ranges, moving to the next fold only shifts their bounds.
+    """
+
+    # Windows
+    EXPANDING = 'expanding'
+    SLIDING = 'sliding'
+
+    # Constructor
+    def __init__(self, root_dataset, k=5, mode='train', fold=0, train_size=1.0, dev_ratio=0.5, test_size=None, gap=0,
+                 window='expanding', window_length=None):
+        """
+        Constructor
+        :param root_dataset: The target data set, samples in time order
+        :param k: Number of fold
+        :param mode: Split (train, dev or test)
+        :param fold: Fold index, the dev/test window of fold 0 is the earliest
+        :param train_size: Fraction of the train window to keep (the most recent samples are kept)
+        :param dev_ratio: Fraction of the dev/test window used as dev set (first samples of the window)
+        :param test_size: Length of the dev/test windows, None for len(root_dataset) // (k + 1)
+        :param gap: Number of samples left out between the train window and the dev/test window
+        :param window: 'expanding' or 'sliding' train window
+        :param window_length: Length of the sliding window, None for the length of the first train window
+        """
+        # Super
+        super(TimeSeriesCrossValidationWithDev, self).__init__(root_dataset)
+
+        # Properties
+        self.k = k
+        self.mode = mode
+        self.train_size = train_size
+        self.dev_ratio = dev_ratio
+        self.test_size = len(root_dataset) // (k + 1) if test_size is None else test_size
+        self.gap = gap
+        self.window = window
+
+        # Check window
+        if window not in (self.EXPANDING, self.SLIDING):
+            raise ValueError("Unknown window {}, must be {} or {}".format(window, self.EXPANDING, self.SLIDING))
+        # end if
+
+        # Check sizes
+        first_train_length = len(root_dataset) - k * self.test_size - gap
+        if first_train_length <= 0:
+            raise ValueError("Not enough samples ({}) for {} folds of {} samples with a gap of {}".format(
+                len(root_dataset),
+                k,
+                self.test_size,
+                gap
+            ))
+        # end if
+
+        # Sliding window length
+        self.window_length = first_train_length if window_length is None else window_length
+
+        # Current windows, (start, stop) of the train and the dev/test window
+        self.fold = None
+        self._train_window = None
+        self._test_window = None
+        self.set_fold(fold)
+    # end __init__
+
+    #region PUBLIC
+
+    # Set in train mode
+    def train(self):
+        """
+        Set in train mode
+        """
+        self.mode = 'train'
+    # end train
+
+    # Set in dev mode
+    def dev(self):
+        """
+        Set in dev mode
+        """
+        self.mode = 'dev'
+    # end dev
+
+    # Set in test mode
+    def test(self):
+        """
+        Set in test mode
+        """
+        self.mode = 'test'
+    # end test
+
+    # Next fold
+    def next_fold(self):
+        """
+        Next fold, windows move forward by test_size samples
+        """
+        # Shift windows
+        train_start, train_stop = self._train_window
+        test_start, test_stop = self._test_window
+        train_stop += self.test_size
+        if self.window == self.SLIDING:
+            train_start = max(train_start, train_stop - self.window_length)
+        # end if
+        self._train_window = (train_start, train_stop)
+        self._test_window = (test_start + self.test_size, test_stop + self.test_size)
+        self.fold += 1
+    # end next_fold
+
+    # Set fold
+    def set_fold(self, fold):
+        """
+        Set fold
+        :param fold: Fold index
+        """
+        # Dev/test window
+        test_start = len(self.root_dataset) - (self.k - fold) * self.test_size
+        self._test_window = (test_start, test_start + self.test_size)
+
+        # Train window
+        train_stop = test_start - self.gap
+        if self.window == self.SLIDING:
+            self._train_window = (max(0, train_stop - self.window_length), train_stop)
+        else:
+            self._train_window = (0, train_stop)
+        # end if
+
+        self.fold = fold
+    # end set_fold
+
+    # Set size
+    def set_size(self, size):
+        """
+        Set size
+        :param size: Fraction of the train window to keep
+        """
+        self.train_size = size
+    # end set_size
+
+    #endregion PUBLIC
+
+    #region PRIVATE
+
+    # Get indexes of a split
+    def _split(self, mode=None):
+        """
+        Get indexes of a split of the current fold
+        :param mode: Split (train, dev or test), None for the current mode
+        :return: IndexRanges object
+        """
+        mode = self.mode if mode is None else mode
+
+        # Train window, keep the most recent samples
+        if mode == 'train':
+            train_start, train_stop = self._train_window
+            train_length = int((train_stop - train_start) * self.train_size)
+            return IndexRanges([(train_stop - train_length, train_stop)])
+        # end if
+
+        # Dev/test window
+        test_start, test_stop = self._test_window
+        dev_stop = test_start + int(self.test_size * self.dev_ratio)
+        if mode == 'dev':
+            return IndexRanges([(test_start, dev_stop)])
+        else:
+            return IndexRanges([(dev_stop, test_stop)])
+        # end if
+    # end _split
+
+    # Get the fold plan
+    def _get_plan(self):
+        """
+        Get the fold plan
+        :return: Dictionary of parameters, dictionary of index arrays
+        """
+        return {
+            'length': len(self.root_dataset),
+            'k': self.k,
+            'mode': self.mode,
+            'fold': self.fold,
+            'train_size': self.train_size,
+            'dev_ratio': self.dev_ratio,
+            'test_size': self.test_size,
+            'gap': self.gap,
+            'window': self.window,
+            'window_length': self.window_length
+        }, dict()
+    # end _get_plan
+
+    #endregion PRIVATE
+
+    #region STATIC
+
+    # Create the validation instance from a fold plan
+    @classmethod
+    def _from_plan(cls, root_dataset, params, arrays):
+        """
+        Create the validation instance from a fold plan
+        :param root_dataset: Base dataset to validate
+        :param params: Dictionary of parameters
+        :param arrays: Dictionary of index arrays (none)
+        :return: TimeSeriesCrossValidationWithDev object
+        """
+        # Check dataset
+        cls._check_plan(root_dataset, params)
+        del params['length']
+
+        return cls(root_dataset, **params)
+    # end _from_plan
+
+    #endregion STATIC
+
+    #region OVERRIDE
+
+    # Dataset size
+    def __len__(self):
+        """
+        Dataset size
+        :return: Number of samples in the current split
+        """
+        return len(self._split())
+    # end __len__
+
+    #endregion OVERRIDE
+
+# end TimeSeriesCrossValidationWithDev
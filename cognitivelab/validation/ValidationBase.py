@@ -23,6 +23,9 @@
 #
 
 # Imports
+import os
+import json
+import numpy as np
 from torch.utils.data.dataset import Dataset
 
 
@@ -42,6 +45,30 @@ class ValidationBase(Dataset):
         self._root_dataset = root_dataset
     # end __init__
 
+    # region PROPERTIES
+
+    # Root dataset
+    @property
+    def root_dataset(self):
+        """
+        Root dataset
+        :return: Base dataset to validate
+        """
+        return self._root_dataset
+    # end root_dataset
+
+    # Set root dataset
+    @root_dataset.setter
+    def root_dataset(self, value):
+        """
+        Set root dataset
+        :param value: New base dataset
+        """
+        self._root_dataset = value
+    # end root_dataset
+
+    # endregion PROPERTIES
+
     # region DECORATORS
 
     # endregion DECORATORS
@@ -51,26 +78,191 @@ class ValidationBase(Dataset):
     # Serialize the validation instance
     def serialize(self, output_file):
         """
-        Serialize the validation instance
-        :param output_file: Output file for serialization
+        Serialize the validation instance (its fold plan) to a directory. Parameters are written
+        to plan.json and each index array to a .npy file, memory-mapped when deserialized.
+        :param output_file: Output directory for serialization
         """
-        pass
+        # Fold plan
+        params, arrays = self._get_plan()
+
+        # Create directory
+        os.makedirs(output_file, exist_ok=True)
+
+        # Index arrays
+        for array_name, array in arrays.items():
+            np.save(os.path.join(output_file, array_name + ".npy"), np.asarray(array))
+        # end for
+
+        # Parameters, written last so an interrupted serialization cannot be loaded
+        with open(os.path.join(output_file, "plan.json"), 'w') as f:
+            json.dump(dict(params, validation=type(self).__name__, arrays=sorted(arrays.keys())), f)
+        # end with
     # end serialize
 
     # endregion PUBLIC
 
+    # region PRIVATE
+
+    # Get indexes of a split
+    def _split(self, mode=None):
+        """
+        Get indexes of a split of the current fold
+        :param mode: Split (train, dev or test), None for the current mode
+        :return: Indexes in the root dataset (array or IndexRanges)
+        """
+        raise NotImplementedError("{} has no random access".format(type(self).__name__))
+    # end _split
+
+    # Get samples from the root dataset
+    def _fetch(self, indexes):
+        """
+        Get samples from the root dataset
+        :param indexes: Array of indexes in the root dataset
+        :return: List of samples
+        """
+        # Root dataset supports batched access
+        if hasattr(self.root_dataset, '__getitems__'):
+            return self.root_dataset.__getitems__(indexes.tolist())
+        # end if
+
+        return [self.root_dataset[i] for i in indexes.tolist()]
+    # end _fetch
+
+    # Get the fold plan
+    def _get_plan(self):
+        """
+        Get the fold plan
+        :return: Dictionary of parameters (JSON types), dictionary of index arrays
+        """
+        raise NotImplementedError("{} cannot be serialized".format(type(self).__name__))
+    # end _get_plan
+
+    # endregion PRIVATE
+
     # region STATIC
 
     # Deserialize the validation instance
-    def deserialize(self, input_file):
+    @classmethod
+    def deserialize(cls, input_file, root_dataset):
         """
-        Deserialize the validation instance
-        :param input_file: Serialized file
+        Deserialize the validation instance, index arrays are memory-mapped (read-only)
+        :param input_file: Serialized directory
+        :param root_dataset: Base dataset to validate
         :return: Deserialized ValidationBase object
         """
-        pass
+        # Parameters
+        with open(os.path.join(input_file, "plan.json"), 'r') as f:
+            params = json.load(f)
+        # end with
+
+        # Check class
+        if params.pop('validation') != cls.__name__:
+            raise ValueError("{} does not contain a {} fold plan".format(input_file, cls.__name__))
+        # end if
+
+        # Memory-mapped index arrays
+        arrays = {
+            array_name: np.load(os.path.join(input_file, array_name + ".npy"), mmap_mode='r')
+            for array_name in params.pop('arrays')
+        }
+
+        return cls._from_plan(root_dataset, params, arrays)
     # end deserialize
 
+    # Create the validation instance from a fold plan
+    @classmethod
+    def _from_plan(cls, root_dataset, params, arrays):
+        """
+        Create the validation instance from a fold plan
+        :param root_dataset: Base dataset to validate
+        :param params: Dictionary of parameters
+        :param arrays: Dictionary of index arrays
+        :return: ValidationBase object
+        """
+        raise NotImplementedError("{} cannot be deserialized".format(cls.__name__))
+    # end _from_plan
+
+    # Check that a fold plan matches a dataset
+    @staticmethod
+    def _check_plan(root_dataset, params):
+        """
+        Check that a fold plan matches a dataset
+        :param root_dataset: Base dataset to validate
+        :param params: Dictionary of parameters
+        """
+        if params['length'] != len(root_dataset):
+            raise ValueError("Fold plan was created for {} samples, dataset has {}".format(
+                params['length'],
+                len(root_dataset)
+            ))
+        # end if
+    # end _check_plan
+
+    # Encode per-sample values for a fold plan
+    @staticmethod
+    def _encode_plan_values(values):
+        """
+        Encode per-sample values (labels, groups) for a fold plan, as integer codes for the .npy file
+        (memory-mappable whatever the type of the values) and the distinct values for plan.json
+        :param values: Array of values
+        :return: Array of codes, dictionary of parameters (distinct values and dtype)
+        """
+        values = np.asarray(values)
+        uniques, codes = np.unique(values, return_inverse=True)
+        return codes.reshape(-1).astype(np.int64), {'values': uniques.tolist(), 'dtype': values.dtype.str}
+    # end _encode_plan_values
+
+    # Decode per-sample values of a fold plan
+    @staticmethod
+    def _decode_plan_values(codes, encoding):
+        """
+        Decode per-sample values of a fold plan
+        :param codes: Array of codes
+        :param encoding: Dictionary of parameters (distinct values and dtype), None if the values were saved as they are
+        :return: Array of values
+        """
+        if encoding is None:
+            return codes
+        # end if
+        return np.asarray(encoding['values'], dtype=encoding['dtype'])[codes]
+    # end _decode_plan_values
+
     # endregion STATIC
 
+    # region OVERRIDE
+
+    # Get item
+    def __getitem__(self, item):
+        """
+        Get item
+        :param item: Position, or list, slice or array of positions
+        :return: Sample, or list of samples
+        """
+        # Batch of positions
+        if isinstance(item, (list, tuple, slice, np.ndarray)):
+            return self.__getitems__(item)
+        # end if
+
+        return self.root_dataset[self._split()[item]]
+    # end __getitem__
+
+    # Get items
+    def __getitems__(self, items):
+        """
+        Get a batch of items (used by the PyTorch DataLoader)
+        :param items: List, slice or array of positions
+        :return: List of samples
+        """
+        # Map positions to root indexes
+        if isinstance(items, slice):
+            indexes = np.asarray(self._split()[items])
+        else:
+            indexes = self._split()[np.asarray(items, dtype=np.int64)]
+        # end if
+
+        return self._fetch(indexes)
+    # end __getitems__
+
+    # endregion OVERRIDE
+
 # end ValidationBase
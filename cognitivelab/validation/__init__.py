@@ -22,3 +22,18 @@
 #
 
 
+# Imports
+from .ValidationBase import ValidationBase
+from .CrossValidation import CrossValidationWithDev
+from .StratifiedCrossValidation import StratifiedCrossValidationWithDev
+from .GroupCrossValidation import GroupCrossValidationWithDev
+from .StreamingCrossValidation import StreamingCrossValidationWithDev
+from .TimeSeriesCrossValidation import TimeSeriesCrossValidationWithDev
+from .IndexRanges import IndexRanges
+from .FeistelPermutation import FeistelPermutation
+from .SharedArray import SharedArray
+
+# ALL
+__all__ = ['ValidationBase', 'CrossValidationWithDev', 'StratifiedCrossValidationWithDev',
+           'GroupCrossValidationWithDev', 'StreamingCrossValidationWithDev', 'TimeSeriesCrossValidationWithDev',
+           'IndexRanges', 'FeistelPermutation', 'SharedArray']
@@ -47,11 +47,17 @@ setup(
     url='https://github.com/nschaetti/CognitiveLab',
     author='nschaetti',
     author_email='nils.schaetti@unige.ch',
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     license='GPL v3',
     packages=setuptools.find_packages(exclude=['tests', 'tests.']),
     install_requires=requirements,
     zip_safe=False,
     include_package_data=True,
-    entry_points={"console_scripts": ["cognitivelab = cognitivelab.cli:main"]}
+    entry_points={
+        "console_scripts": ["cognitivelab = cognitivelab.cli:main"],
+        "cognitivelab.collectors": [
+            "mongodb = cognitivelab.repository.MongoDBCollector:MongoDBCollector",
+            "file = cognitivelab.repository.FileCollector:FileCollector"
+        ]
+    }
 )
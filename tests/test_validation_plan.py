@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File : tests/test_validation_plan.py
+# Description : Round trip of serialized fold plans
+# Author : Nils Schaetti <n.schaetti@gmail.com>
+# Date : 18.10.2026 16:50:00
+# Location : Nyon, Switzerland
+#
+# This file is part of the CognitiveLab package.
+# The CognitiveLab package is a set of free software:
+# you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# CognitiveLab is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with CognitiveLab.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Nils Schaetti <nils.schaetti@unige.ch>
+#
+
+
+# Imports
+import numpy as np
+import pytest
+pytest.importorskip("torch")
+from cognitivelab.validation import StratifiedCrossValidationWithDev, GroupCrossValidationWithDev
+
+
+# Splits of every fold
+def splits(validation, k):
+    """
+    Splits of every fold
+    :param validation: Validation object
+    :param k: Number of folds
+    :return: List of (train, dev, test) lists of indexes
+    """
+    result = list()
+    for fold in range(k):
+        validation.set_fold(fold)
+        result.append(tuple(np.asarray(validation._split(mode)).tolist() for mode in ('train', 'dev', 'test')))
+    # end for
+    return result
+# end splits
+
+
+# Stratified plan with string labels
+@pytest.mark.parametrize("dtype", [str, object])
+def test_stratified_string_labels(tmp_path, dtype):
+    """
+    Stratified plan with string labels is memory-mapped back with the same labels and folds
+    """
+    dataset = list(range(30))
+    labels = np.array(["cat", "dog", "bird"] * 10, dtype=dtype)
+    validation = StratifiedCrossValidationWithDev(dataset, labels, k=5, shuffle=True, seed=1)
+    validation.serialize(str(tmp_path))
+
+    loaded = StratifiedCrossValidationWithDev.deserialize(str(tmp_path), dataset)
+    assert loaded.labels.dtype == labels.dtype
+    assert loaded.labels.tolist() == labels.tolist()
+    assert splits(loaded, 5) == splits(validation, 5)
+    assert np.load(str(tmp_path / "labels.npy"), mmap_mode='r').dtype == np.int64
+# end test_stratified_string_labels
+
+
+# Group plan with string groups
+def test_group_string_groups(tmp_path):
+    """
+    Group plan with string groups is memory-mapped back with the same groups and folds
+    """
+    dataset = list(range(24))
+    groups = np.array(["subject-{}".format(i // 3) for i in range(24)], dtype=object)
+    validation = GroupCrossValidationWithDev(dataset, groups, k=4)
+    validation.serialize(str(tmp_path))
+
+    loaded = GroupCrossValidationWithDev.deserialize(str(tmp_path), dataset)
+    assert loaded.groups.tolist() == groups.tolist()
+    assert splits(loaded, 4) == splits(validation, 4)
+# end test_group_string_groups